@@ -0,0 +1,54 @@
+import json
+import os
+from benchmarks.mock_registry import VERSIONS
+
+# Number of dependencies of the generated fixture projects
+SIZES = (10, 100, 1000)
+
+
+def package_names(count):
+    return [f"bench_package_{index:04d}" for index in range(count)]
+
+
+def write_flutter_project(path, count, version=VERSIONS[0]):
+    """
+    Write a Flutter project whose pubspec.yaml and pubspec.lock pin count packages at version.
+    """
+    os.makedirs(path, exist_ok=True)
+    names = package_names(count)
+    with open(os.path.join(path, "pubspec.yaml"), "w") as file:
+        file.write("name: bench_app\ndependencies:\n")
+        file.writelines(f"  {name}: ^{version}\n" for name in names)
+    with open(os.path.join(path, "pubspec.lock"), "w") as file:
+        file.write("packages:\n")
+        file.writelines(
+            f"  {name}:\n"
+            '    dependency: "direct main"\n'
+            "    source: hosted\n"
+            f'    version: "{version}"\n'
+            for name in names
+        )
+    return path
+
+
+def write_swift_project(path, count, version=VERSIONS[0]):
+    """
+    Write a Swift project whose Package.resolved pins count GitHub packages at version.
+    """
+    directory = os.path.join(path, "Bench.xcworkspace", "xcshareddata", "swiftpm")
+    os.makedirs(directory, exist_ok=True)
+    pins = [
+        {
+            "identity": name,
+            "kind": "remoteSourceControl",
+            "location": f"https://github.com/bench/{name}.git",
+            "state": {"revision": f"{index:040x}", "version": version},
+        }
+        for index, name in enumerate(package_names(count))
+    ]
+    with open(os.path.join(directory, "Package.resolved"), "w") as file:
+        json.dump({"pins": pins, "version": 2}, file, indent=2)
+    return path
+
+
+WRITERS = {"flutter": write_flutter_project, "swift": write_swift_project}
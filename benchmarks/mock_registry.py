@@ -0,0 +1,250 @@
+import io
+import json
+import os
+import re
+import tarfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Versions every mock package has, oldest first; fixtures pin the first one
+VERSIONS = ("1.0.0", "1.1.0", "1.2.0", "2.0.0")
+PUBLISHED_AT = "2024-01-01T00:00:00Z"
+
+PACKAGE_PATH = re.compile(r"^/api/packages/(?P<name>[^/]+)$")
+ARCHIVE_PATH = re.compile(
+    r"^/packages/(?P<name>[^/]+)/versions/(?P<version>[^/]+)\.tar\.gz$"
+)
+LATEST_RELEASE_PATH = re.compile(
+    r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/releases/latest$"
+)
+RELEASES_PATH = re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/releases$")
+
+
+def changelog(name, versions=VERSIONS):
+    """
+    CHANGELOG.md of a mock package, newest version first.
+    """
+    return "".join(
+        f"## {version}\n\n- Changes of {name} {version}.\n\n"
+        for version in reversed(versions)
+    )
+
+
+def build_archive(name, version, payload_size=0, changelog_first=False):
+    """
+    Return a .tar.gz package archive holding a pubspec, a CHANGELOG.md and an
+    incompressible asset of payload_size bytes, stored before the changelog unless
+    changelog_first, so a reader has to get through the asset to find it.
+    """
+    members = [("pubspec.yaml", f"name: {name}\nversion: {version}\n".encode())]
+    asset = ("assets/payload.bin", os.urandom(payload_size))
+    notes = ("CHANGELOG.md", changelog(name).encode())
+    members += [notes, asset] if changelog_first else [asset, notes]
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz", compresslevel=1) as tar:
+        for path, data in members:
+            info = tarfile.TarInfo(f"{name}-{version}/{path}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class MockRegistry:
+    """
+    Local stand-in for the pub.dev package API and archive downloads and for the
+    GitHub releases API, serving the same mock packages under any name.
+
+    latency      seconds every response is delayed by
+    payload_size bytes of incompressible assets in each package archive
+    rate_limit   GitHub requests allowed per rate_limit_window seconds; requests
+                 beyond it get a 429 with Retry-After and X-RateLimit-* headers
+
+    Requests, rate limited responses and bytes sent are counted per kind in counts.
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        payload_size=0,
+        rate_limit=None,
+        rate_limit_window=0.5,
+        changelog_first=False,
+    ):
+        self.latency = latency
+        self.payload_size = payload_size
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.changelog_first = changelog_first
+        self.counts = {}
+        self._archives = {}
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._window_requests = 0
+        self._server = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self):
+        handler = type("Handler", (_MockRegistryHandler,), {"registry": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def count(self, kind, amount=1):
+        with self._lock:
+            self.counts[kind] = self.counts.get(kind, 0) + amount
+
+    def reset_counts(self):
+        with self._lock:
+            self.counts = {}
+
+    def archive(self, version):
+        """
+        The archive served for a version of every package, built once so the
+        registry's own memory use doesn't grow with the number of packages.
+        """
+        with self._lock:
+            archive = self._archives.get(version)
+            if archive is None:
+                archive = self._archives[version] = build_archive(
+                    "package", version, self.payload_size, self.changelog_first
+                )
+        return archive
+
+    def rate_limit_headers(self):
+        """
+        Count a GitHub request against the rate limit. Returns the X-RateLimit-*
+        headers of the response and whether the request is over the limit.
+        """
+        if self.rate_limit is None:
+            return {}, False
+        with self._lock:
+            now = time.time()
+            if now - self._window_start >= self.rate_limit_window:
+                self._window_start = now
+                self._window_requests = 0
+            self._window_requests += 1
+            remaining = max(self.rate_limit - self._window_requests, 0)
+            reset_at = self._window_start + self.rate_limit_window
+            limited = self._window_requests > self.rate_limit
+        headers = {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": f"{reset_at:.3f}",
+        }
+        if limited:
+            headers["Retry-After"] = f"{max(reset_at - now, 0):.3f}"
+        return headers, limited
+
+    def package_document(self, name):
+        archive_url = f"{self.url}/packages/{name}/versions/{VERSIONS[-1]}.tar.gz"
+        return {
+            "name": name,
+            "latest": {
+                "version": VERSIONS[-1],
+                "published": PUBLISHED_AT,
+                "archive_url": archive_url,
+                "pubspec": {"repository": f"https://github.com/bench/{name}"},
+            },
+            "versions": [{"version": version} for version in VERSIONS],
+        }
+
+    @staticmethod
+    def release(repo, version):
+        return {
+            "tag_name": f"v{version}",
+            "name": f"{repo} {version}",
+            "body": f"- Changes of {repo} {version}.",
+            "published_at": PUBLISHED_AT,
+            "draft": False,
+            "prerelease": False,
+        }
+
+
+class _MockRegistryHandler(BaseHTTPRequestHandler):
+    registry = None
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs stall each response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        registry = self.registry
+        if registry.latency:
+            time.sleep(registry.latency)
+        url = urlsplit(self.path)
+
+        match = PACKAGE_PATH.match(url.path)
+        if match:
+            registry.count("package")
+            self.send_json(registry.package_document(match["name"]))
+            return
+        match = ARCHIVE_PATH.match(url.path)
+        if match:
+            registry.count("archive")
+            archive = registry.archive(match["version"])
+            self.send_body(archive, "application/octet-stream")
+            return
+
+        match = LATEST_RELEASE_PATH.match(url.path) or RELEASES_PATH.match(url.path)
+        if match:
+            headers, limited = registry.rate_limit_headers()
+            if limited:
+                registry.count("rate_limited")
+                self.send_json({"message": "API rate limit exceeded"}, 429, headers)
+                return
+            if url.path.endswith("/latest"):
+                registry.count("latest_release")
+                body = registry.release(match["repo"], VERSIONS[-1])
+            else:
+                registry.count("releases")
+                page = int(parse_qs(url.query).get("page", ["1"])[0])
+                body = (
+                    [
+                        registry.release(match["repo"], version)
+                        for version in reversed(VERSIONS)
+                    ]
+                    if page == 1
+                    else []
+                )
+            self.send_json(body, headers=headers)
+            return
+
+        registry.count("not_found")
+        self.send_json({"message": "Not Found"}, 404)
+
+    def send_json(self, data, status=200, headers=None):
+        self.send_body(
+            json.dumps(data).encode("utf-8"), "application/json", status, headers
+        )
+
+    def send_body(self, body, content_type, status=200, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped reading, e.g. once it found the changelog
+            return
+        self.registry.count("bytes_sent", len(body))
+
+    def log_message(self, format, *args):
+        pass
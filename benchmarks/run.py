@@ -0,0 +1,243 @@
+"""
+Benchmark the tracker end to end against a local mock registry and compare the
+results with a stored baseline.
+
+    python -m benchmarks.run                     # compare with benchmarks/baseline.json
+    python -m benchmarks.run --update-baseline   # record a new baseline
+
+Each scenario checks a generated fixture project in a fresh process, first with an
+empty cache ('cold') and then again with the cache of the first run ('warm'), and
+records the runtime, the peak RSS and the requests the mock registry received.
+The run fails when a scenario is slower or uses more memory than the baseline
+allows, or sends more requests than it did.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from benchmarks.fixtures import SIZES, WRITERS
+from benchmarks.mock_registry import MockRegistry
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baseline.json"
+)
+
+# Request counts of the mock registry compared with the baseline
+REQUEST_KINDS = ("package", "archive", "latest_release", "releases", "rate_limited")
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--readers", nargs="+", choices=sorted(WRITERS), default=sorted(WRITERS)
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.005,
+        help="Seconds every mock registry response is delayed by.",
+    )
+    parser.add_argument(
+        "--payload-size",
+        type=int,
+        default=256 * 1024,
+        help="Bytes of incompressible assets in each package archive.",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=int,
+        default=None,
+        help="GitHub requests allowed per half second before the mock answers 429.",
+    )
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results to the baseline instead of comparing with it.",
+    )
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative slowdown over the baseline runtime.",
+    )
+    parser.add_argument(
+        "--time-slack",
+        type=float,
+        default=0.5,
+        help="Seconds a scenario may additionally take, absorbing noise on short runs.",
+    )
+    parser.add_argument(
+        "--rss-tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative growth of the peak RSS over the baseline.",
+    )
+    parser.add_argument("--output", help="Also write the results to this JSON file.")
+    return parser.parse_args(argv)
+
+
+def run_tracker(project_path, registry, cache_dir, jobs):
+    """
+    Check a project in a new process. Returns its runtime, peak RSS and the
+    requests the registry received.
+    """
+    registry.reset_counts()
+    stats_path = os.path.join(cache_dir, "stats.json")
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [ROOT, os.getenv("PYTHONPATH")])),
+        "DEPENDENCY_TRACKER_PUB_URL": registry.url,
+        "DEPENDENCY_TRACKER_GITHUB_API_URL": registry.url,
+        "DEPENDENCY_TRACKER_CACHE_DIR": cache_dir,
+        "GITHUB_TOKEN": "benchmark",
+    }
+    for name in ("DEPENDENCY_TRACKER_CACHE_LOCATION", "DEPENDENCY_TRACKER_TIMEOUT"):
+        env.pop(name, None)
+    command = [
+        sys.executable,
+        "-m",
+        "dependency_release_tracker.main",
+        "--path",
+        project_path,
+        "--format",
+        "json",
+        "--jobs",
+        str(jobs),
+        "--stats-json",
+        stats_path,
+    ]
+    start = time.perf_counter()
+    process = subprocess.run(
+        command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    if process.returncode != 0:
+        sys.exit(f"{' '.join(command)} failed:\n{process.stderr}")
+    seconds = time.perf_counter() - start
+    with open(stats_path) as file:
+        stats = json.load(file)
+    return {
+        "seconds": round(seconds, 3),
+        "peak_rss_kb": stats["peak_rss_kb"],
+        "requests": {
+            kind: registry.counts.get(kind, 0)
+            for kind in REQUEST_KINDS
+            if registry.counts.get(kind)
+        },
+    }
+
+
+def run_benchmarks(args):
+    results = {}
+    registry = MockRegistry(
+        latency=args.latency,
+        payload_size=args.payload_size,
+        rate_limit=args.rate_limit,
+    )
+    with registry, tempfile.TemporaryDirectory() as directory:
+        for reader in args.readers:
+            for size in args.sizes:
+                project_path = WRITERS[reader](
+                    os.path.join(directory, f"{reader}-{size}"), size
+                )
+                cache_dir = os.path.join(directory, f"cache-{reader}-{size}")
+                os.makedirs(cache_dir)
+                for run in ("cold", "warm"):
+                    name = f"{reader}-{size}-{run}"
+                    results[name] = run_tracker(
+                        project_path, registry, cache_dir, args.jobs
+                    )
+                    print(f"{name:<20} {format_result(results[name])}")
+    return results
+
+
+def format_result(result):
+    requests = sum(result["requests"].values())
+    rss = result["peak_rss_kb"]
+    rss = f"{rss / 1024:.1f} MiB" if rss is not None else "n/a"
+    return f"{result['seconds']:7.3f}s  {rss:>10}  {requests:5} requests"
+
+
+def settings(args):
+    return {
+        "latency": args.latency,
+        "payload_size": args.payload_size,
+        "rate_limit": args.rate_limit,
+        "jobs": args.jobs,
+    }
+
+
+def compare(results, baseline, args):
+    """
+    Return a message for every scenario of results that regressed from the baseline.
+    """
+    regressions = []
+    for name, result in results.items():
+        expected = baseline["results"].get(name)
+        if expected is None:
+            continue
+        allowed = expected["seconds"] * (1 + args.time_tolerance) + args.time_slack
+        if result["seconds"] > allowed:
+            regressions.append(
+                f"{name}: {result['seconds']:.3f}s, baseline {expected['seconds']:.3f}s"
+            )
+        if result["peak_rss_kb"] and expected["peak_rss_kb"]:
+            allowed = expected["peak_rss_kb"] * (1 + args.rss_tolerance)
+            if result["peak_rss_kb"] > allowed:
+                regressions.append(
+                    f"{name}: peak RSS {result['peak_rss_kb']} KiB, "
+                    f"baseline {expected['peak_rss_kb']} KiB"
+                )
+        for kind in REQUEST_KINDS:
+            count = result["requests"].get(kind, 0)
+            expected_count = expected["requests"].get(kind, 0)
+            if count > expected_count:
+                regressions.append(
+                    f"{name}: {count} {kind} requests, baseline {expected_count}"
+                )
+    return regressions
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    baseline = None
+    if not args.update_baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline["settings"] != settings(args):
+            print(
+                f"The baseline was recorded with {baseline['settings']}, "
+                f"not {settings(args)}; record a new one with --update-baseline.",
+                file=sys.stderr,
+            )
+            return 2
+
+    results = run_benchmarks(args)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if baseline is None:
+        with open(args.baseline, "w") as file:
+            json.dump({"settings": settings(args), "results": results}, file, indent=2)
+            file.write("\n")
+        print(f"Wrote the baseline to {args.baseline}.")
+        return 0
+
+    regressions = compare(results, baseline, args)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if not regressions:
+        print("No regressions against the baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,90 @@
 import os
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+
+# Registry endpoints, overridable to point runs at a mirror or a local stand-in registry
+PUB_DEV_URL = os.getenv("DEPENDENCY_TRACKER_PUB_URL", "https://pub.dev").rstrip("/")
+GITHUB_API_URL = os.getenv(
+    "DEPENDENCY_TRACKER_GITHUB_API_URL", "https://api.github.com"
+).rstrip("/")
+
+# Number of worker threads used to look up dependencies concurrently
+MAX_WORKERS = int(os.getenv("DEPENDENCY_TRACKER_JOBS", "8"))
+
+# Retries for GitHub responses rejected by the rate limiter (403/429)
+GITHUB_MAX_RETRIES = int(os.getenv("DEPENDENCY_TRACKER_GITHUB_RETRIES", "3"))
+# Longest time, in seconds, to wait for the GitHub rate limit to reset
+GITHUB_MAX_RATE_LIMIT_WAIT = int(os.getenv("DEPENDENCY_TRACKER_GITHUB_MAX_WAIT", "60"))
+
+# GitHub API used to look up Swift releases: "rest" or "graphql"
+GITHUB_API = os.getenv("DEPENDENCY_TRACKER_GITHUB_API", "rest")
+# Number of repositories resolved by a single GraphQL query
+GITHUB_GRAPHQL_BATCH_SIZE = int(os.getenv("DEPENDENCY_TRACKER_GRAPHQL_BATCH", "50"))
+
+# Directory of local git mirrors (<dir>/<host>/<path>.git) used to list the tags of
+# Swift packages not hosted on GitHub; the remote is asked when there is no mirror
+GIT_MIRROR_DIR = os.getenv("DEPENDENCY_TRACKER_GIT_MIRRORS")
+# Longest time, in seconds, a 'git ls-remote' may take
+GIT_TIMEOUT = float(os.getenv("DEPENDENCY_TRACKER_GIT_TIMEOUT", "30"))
+
+# Directory holding the HTTP cache and the release notes store
+CACHE_DIR = os.getenv(
+    "DEPENDENCY_TRACKER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "dependency_release_tracker_cache"),
+)
+# Where registry metadata and release notes are cached, e.g. a directory shared by
+# CI jobs; per-machine data such as the run state stays in CACHE_DIR
+CACHE_LOCATION = os.getenv("DEPENDENCY_TRACKER_CACHE_LOCATION", CACHE_DIR)
+# Cache backend: "sqlite" (one database, shared by concurrent runs on a machine),
+# "files" (one file per entry, for network file systems) or "package.module:ClassName"
+CACHE_BACKEND = os.getenv("DEPENDENCY_TRACKER_CACHE_BACKEND", "sqlite")
+# Seconds a run waits for another run's lock on the SQLite cache
+CACHE_BUSY_TIMEOUT = float(os.getenv("DEPENDENCY_TRACKER_CACHE_BUSY_TIMEOUT", "30"))
+# Entries unused for this many days are removed by --cache-prune
+CACHE_PRUNE_DAYS = float(os.getenv("DEPENDENCY_TRACKER_CACHE_PRUNE_DAYS", "30"))
+# Size cap, in bytes, of the release notes store (least recently used entries are evicted)
+CACHE_MAX_SIZE = int(
+    os.getenv("DEPENDENCY_TRACKER_CACHE_MAX_SIZE", str(64 * 1024 * 1024))
+)
+# How long, in seconds, a "latest version" lookup is reused before asking the registry again
+LATEST_VERSION_TTL = int(os.getenv("DEPENDENCY_TRACKER_LATEST_TTL", "1800"))
+
+# HTTP client settings shared by all readers
+HTTP_CONNECT_TIMEOUT = float(os.getenv("DEPENDENCY_TRACKER_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("DEPENDENCY_TRACKER_READ_TIMEOUT", "30"))
+# Time budget, in seconds, of a whole run; lookups still outstanding are reported as incomplete (unset means no limit)
+RUN_TIMEOUT = (
+    float(os.getenv("DEPENDENCY_TRACKER_TIMEOUT"))
+    if os.getenv("DEPENDENCY_TRACKER_TIMEOUT")
+    else None
+)
+# Retries for connection errors and 5xx responses, with jittered exponential backoff
+HTTP_MAX_RETRIES = int(os.getenv("DEPENDENCY_TRACKER_HTTP_RETRIES", "3"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("DEPENDENCY_TRACKER_HTTP_BACKOFF", "0.5"))
+
+# Extra directory names or glob patterns skipped while looking for projects (comma separated)
+DISCOVERY_IGNORES = [
+    pattern.strip()
+    for pattern in os.getenv("DEPENDENCY_TRACKER_IGNORE", "").split(",")
+    if pattern.strip()
+]
+# How many directory levels below the project path are searched (unset means no limit)
+DISCOVERY_MAX_DEPTH = (
+    int(os.getenv("DEPENDENCY_TRACKER_MAX_DEPTH"))
+    if os.getenv("DEPENDENCY_TRACKER_MAX_DEPTH")
+    else None
+)
+
+# Manifests to parse add up to at least this many bytes before a multi-project run parses
+# them in a pool of processes; below it, starting the pool costs more than it saves
+MANIFEST_PROCESSES_MIN_SIZE = int(
+    os.getenv("DEPENDENCY_TRACKER_PARSE_PROCESSES_MIN_SIZE", str(512 * 1024))
+)
+
+# Local port of the --serve HTTP endpoint
+SERVER_PORT = int(os.getenv("DEPENDENCY_TRACKER_PORT", "8765"))
+
+# Results of the previous run are reused for this many seconds while a package's pinned version is unchanged
+RUN_STATE_MAX_AGE = int(
+    os.getenv("DEPENDENCY_TRACKER_STATE_MAX_AGE", str(LATEST_VERSION_TTL))
+)
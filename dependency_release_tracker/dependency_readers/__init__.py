@@ -1,3 +1,13 @@
-from .base_reader import DependencyReaderBase
-from .swift_reader import SwiftDependencyReader
-from .flutter_reader import FlutterDependencyReader
+from dependency_release_tracker.utils.lazy_exports import lazy_exports
+
+_exports = {
+    "DependencyReaderBase": ".base_reader",
+    "SwiftDependencyReader": ".swift_reader",
+    "FlutterDependencyReader": ".flutter_reader",
+    "ProjectScanner": ".project_scanner",
+    "ReaderRegistry": ".registry",
+}
+
+__all__ = list(_exports)
+
+__getattr__ = lazy_exports(__name__, _exports)
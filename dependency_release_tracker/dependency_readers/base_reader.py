@@ -1,15 +1,90 @@
+import os
+import time
 from abc import ABC, abstractmethod
-from dependency_release_tracker.display.dependency_display import (
-    DependencyDisplay,
-)
+from concurrent.futures import FIRST_COMPLETED, wait
+from dependency_release_tracker.config import MAX_WORKERS, RUN_STATE_MAX_AGE
+from dependency_release_tracker.utils.deadline import DeadlineExceeded, get_deadline
 from dependency_release_tracker.utils.progress_manager import ProgressManager
+from dependency_release_tracker.utils.run_stats import get_run_stats
+from dependency_release_tracker.utils.worker_pool import WorkerPool
+from dependency_release_tracker.utils.versioning import is_newer
 
 
 class DependencyReaderBase(ABC):
-    def __init__(self, project_path):
+    def __init__(
+        self,
+        project_path,
+        jobs=None,
+        manifest_path=None,
+        dependency_display=None,
+        offline=False,
+        package_index=None,
+        max_age=None,
+        since_last_run=False,
+        history=False,
+        only=None,
+        refresh=False,
+        **options,
+    ):
         self.project_path = project_path
-        self.dependency_display = DependencyDisplay()
-        self.progress_manager = ProgressManager()
+        # Manifest found by project discovery, so readers don't have to search for it again
+        self.manifest_path = manifest_path
+        self.jobs = max(1, jobs or MAX_WORKERS)
+        if dependency_display is None:
+            from dependency_release_tracker.display.dependency_display import (
+                DependencyDisplay,
+            )
+
+            dependency_display = DependencyDisplay()
+        self.dependency_display = dependency_display
+        self.progress_manager = ProgressManager(
+            enabled=self.dependency_display.show_progress
+        )
+        # False while reporting on a progress display started and finished by the caller
+        self.owns_progress = True
+        # Called with each dependency to display as soon as its lookup finishes
+        self.result_listener = None
+        # Offline runs only answer from the package index and the cache store
+        self.offline = offline
+        self.package_index = package_index
+        # Results of the previous run younger than max_age seconds are reused
+        self.max_age = RUN_STATE_MAX_AGE if max_age is None else max_age
+        self.since_last_run = since_last_run
+        # Collect the notes of every release between the current and the latest version
+        self.history = history
+        # Only report updates of this type: 'major', 'minor' or 'patch'
+        self.only = only
+        # Look everything up again, ignoring the previous run's results and cache store
+        # entries that expire, such as latest-version lookups
+        self.refresh = refresh
+        # Options meant for other readers, e.g. the GitHub API of the Swift reader
+        self.options = options
+
+    # The cache and the HTTP client are only set up once a lookup actually needs them
+
+    @property
+    def cache_store(self):
+        from dependency_release_tracker.utils.cache_store import get_cache_store
+
+        return get_cache_store()
+
+    @property
+    def revalidation(self):
+        from dependency_release_tracker.utils.revalidation import (
+            get_revalidation_cache,
+        )
+
+        return get_revalidation_cache()
+
+    @property
+    def http_client(self):
+        from dependency_release_tracker.utils.http_client import get_http_client
+
+        return get_http_client()
+
+    @property
+    def state_variant(self):
+        return "history" if self.history else None
 
     @abstractmethod
     def read_dependencies(self):
@@ -28,26 +103,293 @@ class DependencyReaderBase(ABC):
         pass
 
     def process(self, all_versions=False, simple_output=False):
-        dependencies = self.read_dependencies()
+        stats = get_run_stats()
+        with stats.phase("read manifests"):
+            dependencies = self.read_dependencies()
         if dependencies:
-            self.start_progress(total=len(dependencies))
+            from dependency_release_tracker.utils.run_state import RunState
+
+            state = RunState.load(self.project_path, variant=self.state_variant)
+
+            def stream(dependency):
+                if self.should_display(dependency, all_versions, state):
+                    self.dependency_display.stream(
+                        dependency,
+                        simple_output=simple_output,
+                        project_path=self.project_path,
+                        manifest_path=self.manifest_path,
+                    )
+
+            self.result_listener = stream
             try:
-                updated_dependencies = self.check_updates(
-                    dependencies, all_versions=all_versions
-                )
+                with stats.phase("check updates"):
+                    checked_dependencies = self.check_with_state(dependencies, state)
             finally:
                 self.complete_progress()
-            self.dependency_display.display(
-                updated_dependencies, simple_output=simple_output
-            )
+                self.result_listener = None
+            with stats.phase("display"):
+                self.dependency_display.display(
+                    [
+                        dependency
+                        for dependency in checked_dependencies
+                        if self.should_display(dependency, all_versions, state)
+                    ],
+                    simple_output=simple_output,
+                    project_path=self.project_path,
+                    manifest_path=self.manifest_path,
+                )
         else:
             print("No dependencies found.")
 
+    def check_with_state(self, dependencies, state):
+        """
+        Reuse the results of the previous run for dependencies whose pinned version is
+        unchanged and whose result is younger than max_age, and look up the others.
+        New results are recorded in the run state, except incomplete ones and those of
+        offline runs, which only reflect local data of unknown age.
+        Returns every dependency that has a result, in the order given.
+        """
+        pending = []
+        reused = set()
+        for dependency in dependencies:
+            entry = (
+                None
+                if self.refresh
+                else state.fresh_entry(
+                    self.dependency_key(dependency),
+                    dependency.current_version,
+                    self.max_age,
+                )
+            )
+            if entry is None:
+                pending.append(dependency)
+                continue
+            dependency.update_from_dict(entry)
+            reused.add(id(dependency))
+            if self.result_listener:
+                self.result_listener(dependency)
+
+        resolved = set()
+        if pending:
+            self.start_progress(total=len(pending))
+            for dependency in self.check_updates(pending, all_versions=True):
+                resolved.add(id(dependency))
+                if not (dependency.incomplete or self.offline):
+                    state.record(self.dependency_key(dependency), dependency)
+            if not self.offline:
+                state.save()
+
+        return [
+            dependency
+            for dependency in dependencies
+            if id(dependency) in reused or id(dependency) in resolved
+        ]
+
+    def should_display(self, dependency, all_versions=False, state=None):
+        """
+        Whether a checked dependency is reported: only updates unless all_versions,
+        only updates of one type with only, and with since_last_run only releases
+        that appeared after the previous run. Incomplete results are always reported.
+        """
+        if dependency.incomplete:
+            return True
+        if not (all_versions or self.has_update(dependency, dependency.latest_version)):
+            return False
+        if self.only and dependency.update_type != self.only:
+            return False
+        if self.since_last_run and state is not None:
+            return state.is_new_release(
+                self.dependency_key(dependency), dependency.latest_version
+            )
+        return True
+
+    def read_manifest(self, path, parse):
+        """
+        Return parse(path), reusing the result stored in the cache store while the
+        file keeps the same size and modification time.
+        """
+        key, signature, data = self.stored_manifest(path, parse)
+        if data is None:
+            data = parse(os.path.abspath(path))
+            self.store_manifest(key, signature, data)
+        return data
+
+    def manifest_files(self):
+        """
+        The (path, parse) pairs read_dependencies passes to read_manifest, so a
+        multi-project run can parse them ahead of time in other processes.
+        """
+        return []
+
+    def stored_manifest(self, path, parse):
+        """
+        Return the cache key and signature of a manifest with its stored parse, or
+        None for data if the file changed since. Raises OSError when the file can't be read.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        signature = [stat.st_mtime_ns, stat.st_size]
+        key = f"{parse.__name__}:{path}"
+        entry = self.cache_store.get("manifests", key)
+        if entry is not None and entry["signature"] == signature:
+            return key, signature, entry["data"]
+        return key, signature, None
+
+    def store_manifest(self, key, signature, data):
+        self.cache_store.set("manifests", key, {"signature": signature, "data": data})
+
+    def cached(self, namespace, key, max_age=None):
+        """
+        Look a value up in local data. Offline runs check the package index first
+        and accept cache store entries of any age; refreshing runs skip entries that expire.
+        """
+        if self.offline:
+            if self.package_index is not None:
+                value = self.package_index.get(namespace, key)
+                if value is not None:
+                    return value
+            max_age = None
+        elif self.refresh and max_age is not None:
+            return None
+        return self.cache_store.get(namespace, key, max_age=max_age)
+
+    def cache_keys(self, dependency):
+        """
+        The (namespace, key) pairs under which the lookup results of a checked
+        dependency are kept, used to export them to a package index.
+        """
+        return []
+
+    def dependency_key(self, dependency):
+        """
+        Identity of the package behind a dependency, shared by every project that uses it.
+        """
+        return dependency.name
+
+    def range_notes(self, package, current_version):
+        """
+        Notes of the update to the latest version of a checked package for a project
+        pinned to current_version rather than the version the package was looked up
+        with. Readers with history narrow the range to that pin; otherwise every pin
+        shares the notes of the latest version.
+        """
+        return package.notes
+
+    def has_update(self, dependency, latest_version):
+        return is_newer(latest_version, dependency.current_version)
+
+    @staticmethod
+    def timed_out(dependency, fetching_notes):
+        """
+        Mark a dependency whose lookup didn't finish before the deadline as incomplete.
+        """
+        get_deadline().record_missed()
+        dependency.incomplete = True
+        dependency.notes = (
+            "Release notes not fetched before the deadline."
+            if fetching_notes
+            else "Not checked before the deadline."
+        )
+        return dependency
+
+    @staticmethod
+    def not_available_offline(dependency):
+        """
+        Mark a dependency an offline run has no local data for as incomplete.
+        """
+        dependency.incomplete = True
+        dependency.notes = "Not in the package index or the local cache."
+        return dependency
+
+    def run_concurrently(self, func, items, on_timeout=None):
+        """
+        Call func for every item on a pool of worker threads.
+        Progress advances as each item finishes and the results keep the order of items.
+        Results other than None are also passed to the result listener as they arrive.
+        func may return a function instead of a result, for expensive follow-up work
+        such as downloading release notes. It is queued behind every item not started
+        yet, so cheap lookups come first, and its return value becomes the item's result.
+        Once the deadline of the run passes, outstanding work is cancelled and its
+        items get the result of on_timeout(item, follow_up), or None. Workers run
+        on daemon threads, so one still blocked then doesn't delay the exit of the process.
+        """
+        stats = get_run_stats()
+
+        def call(function, item, *args):
+            start = time.perf_counter()
+            try:
+                return function(*args)
+            finally:
+                stats.package_time(
+                    getattr(item, "name", str(item)), time.perf_counter() - start
+                )
+
+        def finish(index, result):
+            results[index] = result
+            finished.add(index)
+            if result is not None and self.result_listener:
+                self.result_listener(result)
+            self.update_progress()
+
+        def time_out(index):
+            finish(
+                index,
+                on_timeout(items[index], index in follow_ups) if on_timeout else None,
+            )
+
+        results = [None] * len(items)
+        finished = set()
+        follow_ups = set()
+        deadline = get_deadline()
+        executor = WorkerPool(max_workers=min(self.jobs, len(items)))
+        futures = {}
+        try:
+            if not deadline.expired:
+                futures = {
+                    executor.submit(call, func, item, item): index
+                    for index, item in enumerate(items)
+                }
+            while futures and not deadline.expired:
+                done, _ = wait(
+                    futures, timeout=deadline.remaining(), return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    index = futures.pop(future)
+                    try:
+                        result = future.result()
+                    except DeadlineExceeded:
+                        time_out(index)
+                        continue
+                    if callable(result):
+                        follow_ups.add(index)
+                        futures[executor.submit(call, result, items[index])] = index
+                    else:
+                        finish(index, result)
+        except BaseException:
+            # Don't wait for queued lookups when interrupted or on an unexpected error
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        # Past the deadline, work still running is left to time out on its own
+        executor.shutdown(wait=not futures, cancel_futures=True)
+        for index in range(len(items)):
+            if index not in finished:
+                time_out(index)
+        return results
+
+    def share_progress(self, progress_manager):
+        """
+        Advance a progress display shared with other readers instead of the reader's own.
+        """
+        self.progress_manager = progress_manager
+        self.owns_progress = False
+
     def start_progress(self, total):
-        self.progress_manager.start_task("[cyan]Checking versions...", total)
+        if self.owns_progress:
+            self.progress_manager.start_task("[cyan]Checking versions...", total)
 
     def update_progress(self):
         self.progress_manager.advance()
 
     def complete_progress(self):
-        self.progress_manager.finish()
+        if self.owns_progress:
+            self.progress_manager.finish()
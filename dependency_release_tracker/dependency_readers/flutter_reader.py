@@ -5,18 +5,33 @@ from dependency_release_tracker.dependency_readers.base_reader import (
     DependencyReaderBase,
 )
 from dependency_release_tracker.models.dependency import Dependency
-from datetime import datetime
+from dependency_release_tracker.config import LATEST_VERSION_TTL, PUB_DEV_URL
+from dependency_release_tracker.utils.deadline import DeadlineExceeded
+from dependency_release_tracker.utils.http_client import OfflineError
+from dependency_release_tracker.utils.run_stats import get_run_stats
+from dependency_release_tracker.utils.versioning import is_newer, version_key
 import tarfile
-from io import BytesIO
 import re
-from tempfile import NamedTemporaryFile
 from rich.console import Console
 
+# libyaml's C loader parses large lock files many times faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# A changelog line that starts the section of a version
+CHANGELOG_HEADING = re.compile(
+    r"(?:##?\s*|v)?\s*\[?v?(\d+\.\d+\.\d+(?:[-+][0-9A-Za-z.+-]*)?)\]?"
+)
+
 
 class FlutterDependencyReader(DependencyReaderBase):
-    def __init__(self, project_path):
-        super().__init__(project_path)
-        self.pubspec_path = os.path.join(self.project_path, "pubspec.yaml")
+    def __init__(self, project_path, **options):
+        super().__init__(project_path, **options)
+        self.pubspec_path = self.manifest_path or os.path.join(
+            self.project_path, "pubspec.yaml"
+        )
         self.pubspec_lock_path = os.path.join(self.project_path, "pubspec.lock")
         self.console = Console()
 
@@ -46,131 +61,331 @@ class FlutterDependencyReader(DependencyReaderBase):
 
         return dependencies
 
+    def manifest_files(self):
+        return [
+            (self.pubspec_path, self.parse_pubspec),
+            (self.pubspec_lock_path, self.parse_lock),
+        ]
+
     def read_yaml_dependencies(self):
         """
         Read dependencies from pubspec.yaml to get the desired versions.
         """
-        with open(self.pubspec_path, "r") as file:
-            pubspec = yaml.safe_load(file)
-            dependencies = pubspec.get("dependencies", {})
-            dev_dependencies = pubspec.get("dev_dependencies", {})
+        versions = self.read_manifest(self.pubspec_path, self.parse_pubspec)
+        return [
+            Dependency(
+                name=name, current_version=version, repo_url=None, ecosystem="flutter"
+            )
+            for name, version in versions.items()
+        ]
+
+    @staticmethod
+    def parse_pubspec(path):
+        with open(path, "r") as file:
+            pubspec = yaml.load(file, Loader=YamlLoader)
+            dependencies = pubspec.get("dependencies") or {}
+            dev_dependencies = pubspec.get("dev_dependencies") or {}
             all_dependencies = {**dependencies, **dev_dependencies}
-            return [
-                Dependency(name=name, current_version=version, repo_url=None)
+            return {
+                name: version
                 for name, version in all_dependencies.items()
                 if isinstance(version, str)
-            ]
+            }
 
     def read_lock_versions(self):
         """
         Read actual installed versions from pubspec.lock.
         """
         try:
-            with open(self.pubspec_lock_path, "r") as file:
-                lock_data = yaml.safe_load(file)
-                lock_versions = {}
-                for package, details in lock_data.get("packages", {}).items():
-                    lock_versions[package] = details["version"]
-                return lock_versions
+            return self.read_manifest(self.pubspec_lock_path, self.parse_lock)
         except FileNotFoundError:
             print(f"Error: The file '{self.pubspec_lock_path}' does not exist.")
             return {}
 
-    def fetch_changelog_from_archive(self, archive_url):
+    @staticmethod
+    def parse_lock(path):
+        with open(path, "r") as file:
+            lock_data = yaml.load(file, Loader=YamlLoader)
+            return {
+                package: details["version"]
+                for package, details in lock_data.get("packages", {}).items()
+            }
+
+    def fetch_release_notes(self, package_name, version, archive_url):
         """
-        Fetch the changelog of the latest version of a package by downloading and inspecting the tarball.
+        Return the release notes of a released version. A version's changelog never
+        changes, so once parsed it is served from the notes store without touching the archive.
+        """
+        cache_key = f"pub/{package_name}@{version}"
+        notes = self.cached("notes", cache_key)
+        if notes is None:
+            if self.offline:
+                return "Changelog not found."
+            notes = self.fetch_changelog_from_archive(archive_url, cache_key=cache_key)
+        return notes
+
+    def fetch_changelog_from_archive(self, archive_url, cache_key=None):
+        """
+        Fetch the changelog of the latest version of a package by streaming the tarball.
+        The archive is decompressed on the fly and the download stops as soon as the
+        CHANGELOG member has been read, so nothing is written to disk.
+        The changelog is split once; under cache_key the first section is saved in the
+        notes store and every section in the changelogs store.
         """
         try:
-            with NamedTemporaryFile() as temp_file:
-                response = requests.get(archive_url, stream=True)
-                if response.status_code == 200:
-                    for chunk in response.iter_content(chunk_size=1024):
-                        temp_file.write(chunk)
-                    temp_file.flush()  # Ensure all data is written to the file
-                    temp_file.seek(0)  # Reset file pointer to the beginning
-
-                    with tarfile.open(fileobj=temp_file, mode="r:gz") as tar:
-                        changelog_files = [
-                            m for m in tar.getmembers() if "CHANGELOG" in m.name.upper()
-                        ]
-                        if changelog_files:
-                            changelog_file = tar.extractfile(changelog_files[0])
-                            changelog_content = changelog_file.read().decode("utf-8")
-                            return self.parse_changelog(changelog_content)
+            changelog_content = self.read_changelog_from_archive(archive_url)
+            if changelog_content is not None:
+                sections = self.split_changelog(changelog_content)
+                changelog = next(
+                    iter(sections.values()), "No detailed changelog available."
+                )
+                if cache_key:
+                    self.cache_store.set("notes", cache_key, changelog)
+                    self.cache_store.set("changelogs", cache_key, sections)
+                return changelog
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             print(f"Failed to process the changelog from the archive: {str(e)}")
         return "Changelog not found."
 
+    def fetch_changelog_sections(self, package_name, version, archive_url):
+        """
+        Return the changelog shipped with a released version as {version: section},
+        in the order of the file. Like the notes, it is parsed once and then served from the store.
+        """
+        cache_key = f"pub/{package_name}@{version}"
+        sections = self.cached("changelogs", cache_key)
+        if sections is None and not self.offline:
+            self.fetch_changelog_from_archive(archive_url, cache_key=cache_key)
+            sections = self.cached("changelogs", cache_key)
+        return sections or {}
+
+    def fetch_release_range(self, dependency, latest_version, archive_url):
+        """
+        Return the changelog sections of every version after the current one up to the
+        latest, newest first. Versions are compared by semantic version precedence.
+        """
+        sections = self.fetch_changelog_sections(
+            dependency.name, latest_version, archive_url
+        )
+        return self.join_sections(sections, dependency.current_version, latest_version)
+
+    @staticmethod
+    def join_sections(sections, current_version, latest_version):
+        if not sections:
+            return "Changelog not found."
+        notes = [
+            section
+            for version, section in sorted(
+                sections.items(),
+                key=lambda item: version_key(item[0]) or (),
+                reverse=True,
+            )
+            if is_newer(version, current_version)
+            and not is_newer(version, latest_version)
+        ]
+        return "\n\n".join(notes) or "No detailed changelog available."
+
+    def range_notes(self, package, current_version):
+        if not self.history or package.incomplete:
+            return package.notes
+        # The lookup already stored the changelog of the latest version
+        sections = self.cached(
+            "changelogs", f"pub/{package.name}@{package.latest_version}"
+        )
+        if not sections:
+            return package.notes
+        return self.join_sections(sections, current_version, package.latest_version)
+
+    def read_changelog_from_archive(self, archive_url):
+        """
+        Return the raw CHANGELOG text of a .tar.gz archive, or None if it has none.
+        """
+        with get_run_stats().operation("changelog archive"):
+            with self.http_client.get(archive_url, stream=True) as response:
+                if response.status_code != 200:
+                    return None
+                stream = _ResponseStream(
+                    self.http_client.iter_content(response, chunk_size=64 * 1024)
+                )
+                with tarfile.open(fileobj=stream, mode="r|gz") as tar:
+                    for member in tar:
+                        if member.isfile() and "CHANGELOG" in member.name.upper():
+                            return tar.extractfile(member).read().decode("utf-8")
+        return None
+
     def parse_changelog(self, content):
         """
         Extract the first version's changelog from the changelog content.
-        This version handles various formats including '## X.X.X', '# X.X.X', 'vX.X.X', '[X.X.X]' directly,
-        and versions enclosed in brackets like '## [X.X.X]'.
         """
-        pattern = r"(^|\n)(##?\s*|v)?\s*\[?(\d+\.\d+\.\d+)\]?(.*?)(?=(\n(##?\s*|v)?\s*\[?\d+\.\d+\.\d+\]?))"
-        matches = re.finditer(pattern, content, re.S)
-
-        for match in matches:
-            return match.group(0).strip()
+        sections = self.split_changelog(content)
+        return next(iter(sections.values()), "No detailed changelog available.")
 
-        return "No detailed changelog available."
+    @staticmethod
+    def split_changelog(content):
+        """
+        Split a changelog into {version: section} in a single pass over its lines.
+        Version headings come in various formats including '## X.X.X', '# X.X.X', 'vX.X.X',
+        '[X.X.X]' directly, and versions enclosed in brackets like '## [X.X.X]'.
+        Each section runs from its heading up to the next one; the first occurrence of a version wins.
+        """
+        sections = {}
+        version = None
+        lines = []
+        for line in content.splitlines():
+            match = CHANGELOG_HEADING.match(line)
+            if match:
+                if version is not None:
+                    sections.setdefault(version, "\n".join(lines).strip())
+                version = match.group(1)
+                lines = []
+            if version is not None:
+                lines.append(line)
+        if version is not None:
+            sections.setdefault(version, "\n".join(lines).strip())
+        return sections
 
     def fetch_latest_version(self, package_name):
         """
         Fetch the latest version of a package from pub.dev, including the publication date,
         archive URL, and attempt to capture the repository URL from the package metadata.
         """
-        url = f"https://pub.dev/api/packages/{package_name}"
-        response = requests.get(url)
-        if response.status_code == 200:
-            package_data = response.json()
-            version = package_data["latest"]["version"]
-            published_at = package_data["latest"].get("published")
-            archive_url = package_data["latest"].get("archive_url")
-            pubspec = package_data["latest"].get("pubspec", {})
+        latest = self.fetch_package_latest(package_name)
+        if latest:
+            version = latest["version"]
+            published_at = latest.get("published")
+            archive_url = latest.get("archive_url")
+            pubspec = latest.get("pubspec", {})
             homepage_url = pubspec.get("homepage")
-            repo_url = pubspec.get("repository", homepage_url if homepage_url else None)
+            repo_url = pubspec.get("repository") or homepage_url
 
-            if published_at:
-                published_at = datetime.fromisoformat(published_at.rstrip("Z")).replace(
-                    tzinfo=None
-                )
             return version, published_at, archive_url, repo_url
         return None, None, None, None
 
+    def fetch_package_latest(self, package_name):
+        """
+        Return the 'latest' section of the pub.dev package document, trimmed to the fields we use.
+        Lookups are kept in the cache store for LATEST_VERSION_TTL seconds and
+        revalidated with a conditional request once they expire.
+        """
+        cache_key = f"pub/{package_name}"
+        latest = self.cached("latest", cache_key, max_age=LATEST_VERSION_TTL)
+        if latest is not None:
+            return latest
+
+        url = f"{PUB_DEV_URL}/api/packages/{package_name}"
+        response = self.http_client.get(
+            url, headers=self.revalidation.request_headers(url)
+        )
+        latest = self.revalidation.resolve(url, response, self.trim_package_latest)
+        if latest is None:
+            return None
+        self.cache_store.set("latest", cache_key, latest)
+        return latest
+
+    @staticmethod
+    def trim_package_latest(package_data):
+        package_latest = package_data["latest"]
+        pubspec = package_latest.get("pubspec", {})
+        return {
+            "version": package_latest["version"],
+            "published": package_latest.get("published"),
+            "archive_url": package_latest.get("archive_url"),
+            "pubspec": {
+                "homepage": pubspec.get("homepage"),
+                "repository": pubspec.get("repository"),
+            },
+        }
+
+    def cache_keys(self, dependency):
+        return [
+            ("latest", f"pub/{dependency.name}"),
+            ("notes", f"pub/{dependency.name}@{dependency.latest_version}"),
+            ("changelogs", f"pub/{dependency.name}@{dependency.latest_version}"),
+        ]
+
     def check_updates(self, dependencies, all_versions=False):
         """
         Check for updates for each dependency. Fetch the latest version
         and publication date for each dependency and update the dependency object if newer versions are found.
         Display release notes for all dependencies if 'all_versions' is True, or only for those with updates if False.
+        Dependencies are looked up concurrently, latest versions before changelogs;
+        the returned list keeps the input order.
         """
         self.start_progress(total=len(dependencies))
-        updated_dependencies = []
-        for dependency in dependencies:
-            try:
-                latest_version, published_at, archive_url, repo_url = (
-                    self.fetch_latest_version(dependency.name)
+        results = self.run_concurrently(
+            lambda dependency: self.check_dependency(dependency, all_versions),
+            dependencies,
+            on_timeout=self.timed_out,
+        )
+        self.complete_progress()  # Ensure the progress is completed after all dependencies are processed
+        return [dependency for dependency in results if dependency is not None]
+
+    def check_dependency(self, dependency, all_versions=False):
+        """
+        Fetch the latest version of a single dependency.
+        Returns a function fetching its release notes if it has an update, the dependency
+        if it should be displayed without notes, otherwise None.
+        """
+        try:
+            latest_version, published_at, archive_url, repo_url = (
+                self.fetch_latest_version(dependency.name)
+            )
+            if latest_version:
+                dependency.latest_version = latest_version
+                dependency.published_at = published_at
+                dependency.url = repo_url
+
+                # Packages that are up to date need no release notes
+                if self.has_update(dependency, latest_version):
+                    return lambda: self.fetch_notes(
+                        dependency, latest_version, archive_url
+                    )
+                if all_versions:
+                    return dependency
+
+        except OfflineError:
+            return self.not_available_offline(dependency)
+        except requests.RequestException as e:
+            dependency.notes = f"Error checking updates: {e}"
+        return None
+
+    def fetch_notes(self, dependency, latest_version, archive_url):
+        """
+        Fetch the release notes of an update, from the changelog in the package archive.
+        """
+        try:
+            if self.history:
+                dependency.notes = self.fetch_release_range(
+                    dependency, latest_version, archive_url
                 )
-                if latest_version:
-                    dependency.latest_version = latest_version
-                    dependency.published_at = published_at
-                    dependency.url = repo_url
-
-                    # Always fetch release notes for the latest version
-                    dependency.notes = self.fetch_changelog_from_archive(archive_url)
-
-                    # Append to updated_dependencies if all_versions is True or there's an actual update
-                    if all_versions or latest_version != dependency.current_version:
-                        updated_dependencies.append(dependency)
-                    else:
-                        # If there's no update and all_versions is False, do not append
-                        # Could set notes to a different message if needed
-                        continue
-
-            except requests.RequestException as e:
-                dependency.notes = f"Error checking updates: {e}"
-            finally:
-                self.update_progress()  # Ensure progress is updated regardless of success or error
+            else:
+                dependency.notes = self.fetch_release_notes(
+                    dependency.name, latest_version, archive_url
+                )
+        except requests.RequestException as e:
+            dependency.notes = f"Error checking updates: {e}"
+        return dependency
 
-        self.complete_progress()  # Ensure the progress is completed after all dependencies are processed
-        return updated_dependencies
+
+class _ResponseStream:
+    """
+    Minimal read-only file object over an iterator of byte chunks,
+    used to feed a streamed HTTP body to tarfile in stream mode.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.buffer = b""
+
+    def read(self, size=-1):
+        while size < 0 or len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+        if size < 0:
+            size = len(self.buffer)
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
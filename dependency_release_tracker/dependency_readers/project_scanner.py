@@ -0,0 +1,275 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dependency_release_tracker.config import MANIFEST_PROCESSES_MIN_SIZE
+from dependency_release_tracker.models.dependency import Dependency
+from dependency_release_tracker.utils.run_state import RunState
+from dependency_release_tracker.utils.run_stats import get_run_stats
+from dependency_release_tracker.utils.worker_pool import WorkerPool
+from dependency_release_tracker.utils.dependency_manager_detector import (
+    DependencyManagerDetector,
+)
+
+
+class ProjectScanner:
+    """
+    Checks every project found below a root directory in one run.
+    Dependencies of all projects are grouped per ecosystem and each unique package
+    is looked up once, every ecosystem concurrently and on one progress display,
+    then the results are reported project by project.
+    """
+
+    def __init__(
+        self,
+        root_path,
+        reader_classes,
+        reader_options=None,
+        detector=None,
+        projects=None,
+        processes=True,
+    ):
+        self.root_path = root_path
+        self.detector = detector or DependencyManagerDetector(root_path)
+        # Reader class per ecosystem name
+        self.reader_classes = reader_classes
+        # Keyword arguments passed to every reader
+        self.reader_options = reader_options or {}
+        # Projects to check, every project the detector finds by default
+        self.projects = projects
+        # Whether large sets of manifests may be parsed in a pool of processes; a
+        # long-running multithreaded process such as the server shouldn't fork
+        self.processes = processes
+
+    def read_projects(self):
+        """
+        Returns a (project path, reader, dependencies) tuple for every supported project.
+        Manifests are read in parallel.
+        """
+        readers = []
+        projects = self.projects
+        if projects is None:
+            projects = self.detector.detect_all()
+        for project in projects:
+            reader_class = self.reader_classes.get(project.ecosystem)
+            if reader_class:
+                reader = reader_class(
+                    project.path,
+                    manifest_path=project.manifest_path,
+                    **self.reader_options,
+                )
+                readers.append((project.path, reader))
+        if not readers:
+            return []
+
+        self.parse_manifests([reader for _, reader in readers])
+        with ThreadPoolExecutor(max_workers=readers[0][1].jobs) as executor:
+            dependency_lists = list(
+                executor.map(lambda item: item[1].read_dependencies(), readers)
+            )
+        return [
+            (project_path, reader, dependencies)
+            for (project_path, reader), dependencies in zip(readers, dependency_lists)
+        ]
+
+    def parse_manifests(self, readers):
+        """
+        Parse the manifests whose stored parse is missing or outdated in a pool of
+        processes, since YAML parsing holds the GIL, and store the results for
+        read_dependencies. Manifests that fail here are left for it to report.
+        Fewer than MANIFEST_PROCESSES_MIN_SIZE bytes are left to read_dependencies
+        too, since they parse faster than the pool starts.
+        """
+        if not self.processes:
+            return
+        pending = []
+        for reader in readers:
+            for path, parse in reader.manifest_files():
+                try:
+                    key, signature, data = reader.stored_manifest(path, parse)
+                except OSError:
+                    continue
+                if data is None:
+                    pending.append((reader, path, parse, key, signature))
+        size = sum(signature[1] for *_, signature in pending)
+        if len(pending) < 2 or size < MANIFEST_PROCESSES_MIN_SIZE:
+            return
+
+        workers = min(len(pending), readers[0].jobs, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (executor.submit(parse, os.path.abspath(path)), reader, key, signature)
+                for reader, path, parse, key, signature in pending
+            ]
+            for future, reader, key, signature in futures:
+                try:
+                    data = future.result()
+                except Exception:
+                    continue
+                reader.store_manifest(key, signature, data)
+
+    def process(self, all_versions=False, simple_output=False):
+        stats = get_run_stats()
+        with stats.phase("read manifests"):
+            projects = self.read_projects()
+        if not projects:
+            return False
+
+        states = [
+            RunState.load(project_path, variant=reader.state_variant)
+            for project_path, reader, _ in projects
+        ]
+        with stats.phase("check updates"):
+            resolved = self.resolve(projects, states)
+
+        with stats.phase("display"):
+            for (project_path, reader, _), dependencies, state in zip(
+                projects, resolved, states
+            ):
+                reader.dependency_display.project_header(project_path)
+                updated_dependencies = [
+                    dependency
+                    for dependency in dependencies
+                    if reader.should_display(dependency, all_versions, state)
+                ]
+                if updated_dependencies:
+                    reader.dependency_display.display(
+                        updated_dependencies,
+                        simple_output=simple_output,
+                        project_path=project_path,
+                        manifest_path=reader.manifest_path,
+                    )
+                else:
+                    print("No updates found.")
+        return True
+
+    def export(self, package_index):
+        """
+        Look up every package of every project and copy the results from the cache
+        store into a package index for offline runs.
+        Returns the number of packages written, or None if no project was found.
+        """
+        projects = self.read_projects()
+        if not projects:
+            return None
+        resolved = self.resolve(projects)
+
+        exported = set()
+        for (_, reader, _), dependencies in zip(projects, resolved):
+            for dependency in dependencies:
+                for namespace, key in reader.cache_keys(dependency):
+                    value = reader.cache_store.get(namespace, key)
+                    if value is not None:
+                        package_index.set(namespace, key, value)
+                exported.add((type(reader), reader.dependency_key(dependency)))
+        package_index.compact()
+        return len(exported)
+
+    def check_groups(self, groups):
+        """
+        Check the packages of every (reader, packages) group concurrently, all of them
+        advancing one progress display. Returns the checked packages of each group.
+        """
+        if not groups:
+            return []
+        progress_manager = groups[0][0].progress_manager
+        for reader, _ in groups:
+            reader.share_progress(progress_manager)
+        progress_manager.start_task(
+            "[cyan]Checking versions...", sum(len(packages) for _, packages in groups)
+        )
+        pool = WorkerPool(max_workers=len(groups), name="ecosystem")
+        try:
+            futures = [
+                pool.submit(
+                    lambda reader, packages: reader.check_updates(
+                        packages, all_versions=True
+                    ),
+                    *group,
+                )
+                for group in groups
+            ]
+            results = [future.result() for future in futures]
+        except BaseException:
+            # Don't wait for lookups still queued or running, e.g. on Ctrl-C
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            progress_manager.finish()
+        pool.shutdown()
+        return results
+
+    def resolve(self, projects, states=None):
+        """
+        Look up each unique package once per ecosystem, with the oldest version any
+        project pins, and copy the result onto every project's dependency; with history
+        the notes are narrowed to each project's own pin. With run states, a project's dependencies
+        that have a fresh result from the previous run reuse it, and new results of
+        online runs are recorded.
+        Returns, per project, the dependencies that have a result.
+        """
+        states = states or [None] * len(projects)
+        groups = {}
+        reused = set()
+        for (_, reader, dependencies), state in zip(projects, states):
+            resolver, packages = groups.setdefault(type(reader), (reader, {}))
+            for dependency in dependencies:
+                key = resolver.dependency_key(dependency)
+                entry = (
+                    state.fresh_entry(key, dependency.current_version, reader.max_age)
+                    if state is not None and not reader.refresh
+                    else None
+                )
+                if entry is not None:
+                    dependency.update_from_dict(entry)
+                    reused.add(id(dependency))
+                    continue
+                package = packages.get(key)
+                if package is None:
+                    packages[key] = Dependency(
+                        name=dependency.name,
+                        current_version=dependency.current_version,
+                        repo_url=dependency.repo_url,
+                        ecosystem=dependency.ecosystem,
+                    )
+                elif (dependency.current_key or ()) < (package.current_key or ()):
+                    # Look the package up with its oldest pin, so notes are fetched
+                    # whenever any project is behind
+                    package.current_version = dependency.current_version
+
+        found = set()
+        for checked in self.check_groups(
+            [
+                (resolver, list(packages.values()))
+                for resolver, packages in groups.values()
+                if packages
+            ]
+        ):
+            found.update(map(id, checked))
+
+        resolved = []
+        for (_, reader, dependencies), state in zip(projects, states):
+            resolver, packages = groups[type(reader)]
+            resolved.append([])
+            for dependency in dependencies:
+                if id(dependency) in reused:
+                    resolved[-1].append(dependency)
+                    continue
+                key = reader.dependency_key(dependency)
+                package = packages[key]
+                dependency.latest_version = package.latest_version
+                dependency.notes = (
+                    package.notes
+                    if dependency.current_version == package.current_version
+                    else resolver.range_notes(package, dependency.current_version)
+                )
+                dependency.url = package.url
+                dependency.published_at = package.published_at
+                dependency.incomplete = package.incomplete
+                if id(package) in found:
+                    resolved[-1].append(dependency)
+                    if state is not None and not (
+                        dependency.incomplete or reader.offline
+                    ):
+                        state.record(key, dependency)
+            if state is not None and not reader.offline:
+                state.save()
+        return resolved
@@ -0,0 +1,93 @@
+import importlib
+
+# Installed packages add ecosystems by registering a reader class under this group:
+#   entry_points={"dependency_release_tracker.readers": ["cocoapods=pkg.module:Reader"]}
+ENTRY_POINT_GROUP = "dependency_release_tracker.readers"
+
+# They declare the file names that mark their projects under this group, mapped to
+# the ecosystem name, so discovery knows them without importing the reader:
+#   entry_points={"dependency_release_tracker.manifests": ["Podfile.lock=cocoapods"]}
+MANIFEST_ENTRY_POINT_GROUP = "dependency_release_tracker.manifests"
+
+# Readers shipped with the package, also available when it isn't installed
+BUILTIN_READERS = {
+    "swift": "dependency_release_tracker.dependency_readers.swift_reader:SwiftDependencyReader",
+    "flutter": "dependency_release_tracker.dependency_readers.flutter_reader:FlutterDependencyReader",
+}
+
+
+def load_class(path):
+    """
+    Import a class given as 'package.module:ClassName'.
+    """
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class ReaderRegistry:
+    """
+    Maps ecosystem names to reader classes: the built-in readers and the ones
+    installed packages register under the ENTRY_POINT_GROUP entry point group.
+    Entry points are only listed once a lookup needs them and a reader class is
+    only imported once a project of its ecosystem has been found.
+    """
+
+    def __init__(
+        self,
+        builtin_readers=None,
+        group=ENTRY_POINT_GROUP,
+        manifest_group=MANIFEST_ENTRY_POINT_GROUP,
+    ):
+        self.builtin_readers = dict(
+            BUILTIN_READERS if builtin_readers is None else builtin_readers
+        )
+        self.group = group
+        self.manifest_group = manifest_group
+        self._entry_points = None
+        self._classes = {}
+
+    @property
+    def entry_points(self):
+        if self._entry_points is None:
+            self._entry_points = {
+                entry_point.name: entry_point
+                for entry_point in self.list_entry_points(self.group)
+            }
+        return self._entry_points
+
+    @staticmethod
+    def list_entry_points(group):
+        from importlib.metadata import entry_points
+
+        return entry_points(group=group)
+
+    def names(self):
+        return sorted(set(self.builtin_readers) | set(self.entry_points))
+
+    def get(self, ecosystem):
+        """
+        Return the reader class of an ecosystem, or None if no reader handles it.
+        """
+        if ecosystem not in self._classes:
+            if ecosystem in self.builtin_readers:
+                reader_class = load_class(self.builtin_readers[ecosystem])
+            elif ecosystem in self.entry_points:
+                reader_class = self.entry_points[ecosystem].load()
+            else:
+                reader_class = None
+            self._classes[ecosystem] = reader_class
+        return self._classes[ecosystem]
+
+    def plugin_manifests(self):
+        """
+        Map the manifest file names of plugin ecosystems to their ecosystem name,
+        for project discovery. Built-in ecosystems are detected by discovery itself.
+        Names are read from entry point metadata; no plugin is imported.
+        """
+        manifests = {}
+        for entry_point in self.list_entry_points(self.manifest_group):
+            ecosystem = entry_point.value.strip()
+            if ecosystem in self.builtin_readers or ecosystem not in self.entry_points:
+                continue
+            manifests.setdefault(entry_point.name, ecosystem)
+        return manifests
@@ -1,25 +1,52 @@
 import requests
-import os
 import json
+import subprocess
 from .base_reader import DependencyReaderBase
 from dependency_release_tracker.models.dependency import Dependency
-from dependency_release_tracker.config import GITHUB_TOKEN
+from dependency_release_tracker.config import (
+    GITHUB_TOKEN,
+    GITHUB_API,
+    GITHUB_GRAPHQL_BATCH_SIZE,
+    LATEST_VERSION_TTL,
+)
+from dependency_release_tracker.utils.deadline import DeadlineExceeded
+from dependency_release_tracker.utils.git_tags import GitTagClient
+from dependency_release_tracker.utils.github_client import GitHubClient
+from dependency_release_tracker.utils.http_client import OfflineError
+from dependency_release_tracker.utils.project_discovery import ProjectDiscovery
+from dependency_release_tracker.utils.repository_url import parse_repository_url
+from dependency_release_tracker.utils.dependency_manager_types import DependencyManager
+from dependency_release_tracker.utils.versioning import (
+    clean_version,
+    is_newer,
+    is_prerelease,
+    version_key,
+)
 from rich.console import Console
 
+# Largest page size of the GitHub releases list
+RELEASES_PER_PAGE = 100
+
 
 class SwiftDependencyReader(DependencyReaderBase):
-    def __init__(self, project_path):
-        super().__init__(project_path)
+    def __init__(self, project_path, github_api=None, **options):
+        super().__init__(project_path, **options)
         self.console = Console()
+        self._github_client = None
+        self._git_client = None
+        self.github_api = github_api or GITHUB_API
         # Check if the GitHub token is available
         if not GITHUB_TOKEN:
             self.console.print(
                 "Warning: GITHUB_TOKEN is not set. It is required for accessing private repositories or to increase API rate limits.",
                 style="bold orange",
             )
+            if self.github_api == "graphql":
+                # The GraphQL API does not accept anonymous requests
+                self.github_api = "rest"
 
     def read_dependencies(self):
-        resolved_path = self.find_package_resolved()
+        resolved_path = self.manifest_path or self.find_package_resolved()
         if not resolved_path:
             self.console.print(
                 "Package.resolved file not found in any .xcworkspace directory. Please ensure you are executing the command from the root of your project.",
@@ -29,68 +56,342 @@ class SwiftDependencyReader(DependencyReaderBase):
         return self.read_package_resolved(resolved_path)
 
     def find_package_resolved(self):
-        for root, dirs, files in os.walk(self.project_path):
-            for dir_name in dirs:
-                if dir_name.endswith(".xcworkspace"):
-                    path = os.path.join(
-                        root, dir_name, "xcshareddata", "swiftpm", "Package.resolved"
-                    )
-                    if os.path.exists(path):
-                        return path
+        for project in ProjectDiscovery(self.project_path).discover():
+            if project.manager == DependencyManager.SWIFT:
+                return project.manifest_path
         return None
 
     def read_package_resolved(self, file_path):
+        """
+        Read the pins of a Package.resolved file. Version 1 files keep them under
+        'object' with 'package' and 'repositoryURL' keys, versions 2 and 3 at the top
+        level with 'identity' and 'location'. Pins without a remote repository, such as
+        local packages, have no releases to look up and are skipped.
+        """
         with open(file_path, "r") as file:
             data = json.load(file)
+        pins = data["object"]["pins"] if data.get("version") == 1 else data["pins"]
         dependencies = []
-        for package in data["pins"]:
-            package_name = package["identity"]
-            repo_url = package["location"]
-            current_version = package["state"].get("version", "")
+        for package in pins:
+            package_name = package.get("identity") or package["package"]
+            repo_url = package.get("location") or package.get("repositoryURL")
+            if parse_repository_url(repo_url) is None:
+                continue
+            current_version = (package.get("state") or {}).get("version") or ""
             dependencies.append(
                 Dependency(
                     name=package_name,
                     current_version=current_version,
                     repo_url=repo_url,
+                    ecosystem="swift",
                 )
             )
         return dependencies
 
+    @property
+    def github_client(self):
+        if self._github_client is None:
+            self._github_client = GitHubClient(http_client=self.http_client)
+        return self._github_client
+
+    @property
+    def git_client(self):
+        if self._git_client is None:
+            self._git_client = GitTagClient()
+        return self._git_client
+
     def check_updates(self, dependencies, all_versions=False):
+        """
+        Look up the latest GitHub release of every dependency concurrently.
+        Requests share one GitHubClient so they are throttled by the same rate limit.
+        Releases found in the cache store are reused. In GraphQL mode the remaining
+        releases are resolved in batches first and only the repositories the batch
+        could not resolve are requested one by one. Repositories hosted elsewhere
+        are looked up by their git tags instead. With history, the release lists are
+        paged through once every latest release is known.
+        """
         self.start_progress(total=len(dependencies))
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "Authorization": f"Bearer {GITHUB_TOKEN}",
-        }
-        updated_dependencies = []
+        github_dependencies = [
+            dependency for dependency in dependencies if dependency.repository.is_github
+        ]
+        releases = {}
+        for owner_repo in dict.fromkeys(
+            dependency.owner_repo for dependency in github_dependencies
+        ):
+            release_data = self.cached(
+                "latest", f"github/{owner_repo}", max_age=LATEST_VERSION_TTL
+            )
+            if release_data is not None:
+                releases[owner_repo] = release_data
+        if self.github_api == "graphql" and not self.offline:
+            missing = [
+                dependency.owner_repo
+                for dependency in github_dependencies
+                if dependency.owner_repo not in releases
+            ]
+            releases.update(self.fetch_latest_releases_graphql(missing))
+        results = self.run_concurrently(
+            lambda dependency: (
+                self.check_dependency(
+                    dependency, all_versions, releases.get(dependency.owner_repo)
+                )
+                if dependency.repository.is_github
+                else self.check_git_dependency(dependency, all_versions)
+            ),
+            dependencies,
+            on_timeout=self.timed_out,
+        )
+        self.complete_progress()
 
-        for dependency in dependencies:
-            try:
-                repo_url = dependency.repo_url.rstrip(".git")
-                path_parts = repo_url.split("/")
-                owner_repo = "/".join(path_parts[-2:])
-                api_url = f"https://api.github.com/repos/{owner_repo}/releases/latest"
+        return [dependency for dependency in results if dependency is not None]
 
-                response = requests.get(api_url, headers=headers)
-                response.raise_for_status()
-                release_data = response.json()
+    def check_dependency(self, dependency, all_versions=False, release_data=None):
+        """
+        Look up the latest release of a single dependency.
+        Returns the dependency if it should be displayed, otherwise None. With history,
+        updates return a function collecting the notes of every release in between instead.
+        """
+        try:
+            owner_repo = dependency.owner_repo
+            if release_data is None:
+                release_data = self.fetch_latest_release(owner_repo)
 
-                latest_version = release_data.get("tag_name", "").lstrip("v")
-                if all_versions or latest_version != dependency.current_version:
-                    dependency.latest_version = latest_version
-                    dependency.notes = release_data.get(
-                        "body", "No release notes found."
+            latest_version = clean_version(release_data.get("tag_name", ""))
+            if all_versions or self.has_update(dependency, latest_version):
+                dependency.latest_version = latest_version
+                dependency.notes = release_data.get("body", "No release notes found.")
+                dependency.url = f"https://github.com/{owner_repo}/releases"
+                dependency.published_at = release_data.get("published_at")
+                if self.history and self.has_update(dependency, latest_version):
+                    return lambda: self.fetch_history(
+                        dependency, owner_repo, latest_version
                     )
-                    dependency.url = f"https://github.com/{owner_repo}/releases"
-                    dependency.published_at = release_data.get("published_at")
-                    updated_dependencies.append(dependency)
+                return dependency
 
-            except requests.RequestException as e:
-                dependency.notes = f"Error checking updates: {e}"
+        except OfflineError:
+            return self.not_available_offline(dependency)
+        except requests.RequestException as e:
+            dependency.notes = f"Error checking updates: {e}"
 
-            finally:
-                self.update_progress()
+        return None
 
-        self.complete_progress()
+    def fetch_history(self, dependency, owner_repo, latest_version):
+        try:
+            dependency.notes = self.fetch_release_range(
+                owner_repo, dependency.current_version, latest_version
+            )
+        except requests.RequestException as e:
+            dependency.notes = f"Error checking updates: {e}"
+        return dependency
+
+    def range_notes(self, package, current_version):
+        if not (self.history and package.repository.is_github) or package.incomplete:
+            return package.notes
+        # The release list paged through for the oldest pin covers every newer one
+        try:
+            return self.fetch_release_range(
+                package.owner_repo, current_version, package.latest_version
+            )
+        except requests.RequestException as e:
+            return f"Error checking updates: {e}"
+
+    def check_git_dependency(self, dependency, all_versions=False):
+        """
+        Look up a dependency hosted outside GitHub by the highest release version
+        among its git tags. Tags carry no release notes.
+        """
+        repository = dependency.repository
+        try:
+            tags = self.fetch_tags(dependency)
+        except OfflineError:
+            return self.not_available_offline(dependency)
+        except (subprocess.SubprocessError, OSError) as e:
+            dependency.notes = f"Error checking updates: {e}"
+            return None
+
+        # Pre-release tags are skipped, like pre-releases on GitHub
+        keys = {tag: version_key(tag) for tag in tags}
+        releases = [tag for tag, key in keys.items() if key and not is_prerelease(key)]
+        if not releases:
+            return None
+        latest_version = clean_version(max(releases, key=keys.get))
+        if all_versions or self.has_update(dependency, latest_version):
+            dependency.latest_version = latest_version
+            dependency.notes = "No release notes found."
+            dependency.url = repository.web_url
+            return dependency
+        return None
+
+    def fetch_tags(self, dependency):
+        """
+        Return the tags of a repository not hosted on GitHub, kept in the cache
+        store for LATEST_VERSION_TTL seconds.
+        """
+        cache_key = f"git/{dependency.repository}"
+        tags = self.cached("tags", cache_key, max_age=LATEST_VERSION_TTL)
+        if tags is not None:
+            return tags
+        if self.offline:
+            raise OfflineError(
+                f"Tags of {dependency.repository} are not available offline"
+            )
+        tags = self.git_client.tags(dependency.repository, dependency.repo_url)
+        self.cache_store.set("tags", cache_key, tags)
+        return tags
 
-        return updated_dependencies
+    def cache_keys(self, dependency):
+        if not dependency.repository.is_github:
+            return [("tags", f"git/{dependency.repository}")]
+        owner_repo = dependency.owner_repo
+        return [
+            ("latest", f"github/{owner_repo}"),
+            ("releases", f"github/{owner_repo}"),
+        ]
+
+    def dependency_key(self, dependency):
+        if not dependency.repository.is_github:
+            return str(dependency.repository).lower()
+        return dependency.owner_repo.lower()
+
+    def fetch_latest_release(self, owner_repo):
+        """
+        Fetch the latest release of a repository from the REST API.
+        Known releases are revalidated with a conditional request.
+        """
+        path = f"/repos/{owner_repo}/releases/latest"
+        response = self.github_client.get(
+            path, headers=self.revalidation.request_headers(path)
+        )
+        if response.status_code != 304:
+            response.raise_for_status()
+        release = self.revalidation.resolve(path, response, self.trim_release)
+        if release is None:
+            raise requests.HTTPError(
+                f"Unexpected response for {path}", response=response
+            )
+        return self.store_release(owner_repo, release)
+
+    def store_release(self, owner_repo, release_data):
+        """
+        Keep the fields we use of a latest release in the cache store and return them.
+        """
+        release = self.trim_release(release_data)
+        self.cache_store.set("latest", f"github/{owner_repo}", release)
+        return release
+
+    def fetch_release_range(self, owner_repo, current_version, latest_version):
+        """
+        Return the notes of every release after the current version up to the latest,
+        newest first. Versions are compared by semantic version precedence.
+        """
+        releases = [
+            release
+            for release in self.fetch_releases(owner_repo, current_version)
+            if is_newer(release["tag_name"], current_version)
+            and not is_newer(release["tag_name"], latest_version)
+        ]
+        releases.sort(
+            key=lambda release: version_key(release["tag_name"]) or (), reverse=True
+        )
+        notes = [
+            f"## {release['tag_name']}\n\n{release['body']}" for release in releases
+        ]
+        return "\n\n".join(notes) or "No release notes found."
+
+    def fetch_releases(self, owner_repo, current_version):
+        """
+        Return the published releases of a repository, newest first. The REST API is paged
+        through RELEASES_PER_PAGE releases at a time and paging stops at the first page
+        reaching back to the current version. The list is kept in the cache store for LATEST_VERSION_TTL seconds.
+        """
+        cache_key = f"github/{owner_repo}"
+        cached = self.cached("releases", cache_key, max_age=LATEST_VERSION_TTL)
+        if cached is not None and (
+            self.offline
+            or cached["complete"]
+            or self.reaches_version(cached["releases"], current_version)
+        ):
+            return cached["releases"]
+        if self.offline:
+            return []
+
+        releases = []
+        page = 1
+        while True:
+            response = self.github_client.get(
+                f"/repos/{owner_repo}/releases?per_page={RELEASES_PER_PAGE}&page={page}"
+            )
+            response.raise_for_status()
+            batch = response.json()
+            releases.extend(
+                self.trim_release(release)
+                for release in batch
+                if not release.get("draft") and not release.get("prerelease")
+            )
+            complete = len(batch) < RELEASES_PER_PAGE
+            if complete or self.reaches_version(releases, current_version):
+                break
+            page += 1
+        self.cache_store.set(
+            "releases", cache_key, {"releases": releases, "complete": complete}
+        )
+        return releases
+
+    @staticmethod
+    def reaches_version(releases, version):
+        return any(not is_newer(release["tag_name"], version) for release in releases)
+
+    @staticmethod
+    def trim_release(release_data):
+        return {
+            "tag_name": release_data.get("tag_name") or "",
+            "published_at": release_data.get("published_at"),
+            "body": release_data.get("body") or "No release notes found.",
+        }
+
+    def fetch_latest_releases_graphql(self, owner_repos):
+        """
+        Resolve the latest release of all repositories with aliased GraphQL queries,
+        GITHUB_GRAPHQL_BATCH_SIZE repositories per request.
+        Returns a dict of 'owner/repo' to release data shaped like the REST response.
+        Repositories missing from the result are left for the REST fallback.
+        """
+        owner_repos = list(dict.fromkeys(owner_repos))
+        releases = {}
+        for start in range(0, len(owner_repos), GITHUB_GRAPHQL_BATCH_SIZE):
+            batch = owner_repos[start : start + GITHUB_GRAPHQL_BATCH_SIZE]
+            try:
+                response = self.github_client.graphql(self.build_releases_query(batch))
+                response.raise_for_status()
+                data = response.json().get("data") or {}
+            except (requests.RequestException, ValueError):
+                continue
+            except DeadlineExceeded:
+                # The lookups left are reported as incomplete
+                break
+
+            for index, owner_repo in enumerate(batch):
+                repository = data.get(f"r{index}")
+                if not repository or not repository.get("latestRelease"):
+                    continue
+                release = repository["latestRelease"]
+                releases[owner_repo] = self.store_release(
+                    owner_repo,
+                    {
+                        "tag_name": release.get("tagName"),
+                        "published_at": release.get("publishedAt"),
+                        "body": release.get("description"),
+                    },
+                )
+        return releases
+
+    @staticmethod
+    def build_releases_query(owner_repos):
+        fields = "latestRelease { tagName publishedAt description url }"
+        aliases = []
+        for index, owner_repo in enumerate(owner_repos):
+            owner, _, name = owner_repo.partition("/")
+            aliases.append(
+                f"r{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {fields} }}"
+            )
+        return "query { " + " ".join(aliases) + " }"
@@ -1 +1,13 @@
-from .dependency_display import DependencyDisplay
+from dependency_release_tracker.utils.lazy_exports import lazy_exports
+
+_exports = {
+    "DependencyDisplay": ".dependency_display",
+    "JsonDisplay": ".machine_output",
+    "JsonLinesDisplay": ".machine_output",
+    "SarifDisplay": ".machine_output",
+    "LiveDisplay": ".live_display",
+}
+
+__all__ = list(_exports)
+
+__getattr__ = lazy_exports(__name__, _exports)
@@ -1,25 +1,35 @@
 from rich.console import Console
-from rich.markdown import Markdown
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 import re
 
 
 class DependencyDisplay:
+    # Machine-readable displays turn the progress bar off
+    show_progress = True
+
     def __init__(self):
         self.console = Console()
 
-    def display(self, dependencies, simple_output=False):
+    def display(
+        self, dependencies, simple_output=False, project_path=None, manifest_path=None
+    ):
         """
         Display the dependencies information in the console using simple prints,
         with a full-width divider line between entries for both detailed and simple outputs.
 
         :param dependencies: A list of Dependency objects to display.
         :param simple_output: If True, display simplified output without release notes.
+        :param project_path: Directory of the project the dependencies belong to.
+        :param manifest_path: Manifest the dependencies were read from.
         """
 
+        if not simple_output:
+            # rich.markdown is slow to import and not needed for simple output
+            from rich.markdown import Markdown
+
         updated = "(UPDATED)"
         outdated = "(OUTDATED)"
+        incomplete = "(INCOMPLETE)"
 
         sorted_dependencies = sorted(
             dependencies,
@@ -28,12 +38,12 @@ class DependencyDisplay:
         )
 
         for dependency in sorted_dependencies:
-            version_status = (
-                updated
-                if dependency.current_version == dependency.latest_version
-                else outdated
-            )
-            version_status_color = "green" if version_status == updated else "red"
+            if dependency.incomplete:
+                version_status, version_status_color = incomplete, "yellow"
+            elif dependency.is_outdated:
+                version_status, version_status_color = outdated, "red"
+            else:
+                version_status, version_status_color = updated, "green"
             # published_at = self.format_date(dependency.published_at)
             published_at_formatted = self.format_date(dependency.published_at)
 
@@ -43,7 +53,7 @@ class DependencyDisplay:
                 style="bold",
             )
 
-            if dependency.current_version != dependency.latest_version:
+            if dependency.is_outdated:
                 self.console.print(
                     f"[red]Current version: {dependency.current_version}", style="bold"
                 )
@@ -59,17 +69,32 @@ class DependencyDisplay:
             self.console.rule(style="dim")
             self.console.print()
 
+    def project_header(self, project_path):
+        """
+        Announce the project whose dependencies are displayed next, in multi-project runs.
+        """
+        self.console.rule(f"[bold]{project_path}")
+
+    def stream(
+        self, dependency, simple_output=False, project_path=None, manifest_path=None
+    ):
+        """
+        Called as soon as a dependency has been checked. The console output waits for
+        the whole list so it can be sorted, see display().
+        """
+        pass
+
+    def close(self):
+        """
+        Called once every project has been displayed.
+        """
+        pass
+
     @staticmethod
-    def format_date(date_str):
-        if not date_str:
+    def format_date(published_at):
+        if not published_at:
             return "Date Unknown"
-        if isinstance(date_str, datetime):
-            return date_str.strftime("%Y-%m-%d %H:%M:%S")
-        try:
-            date_obj = datetime.fromisoformat(date_str.rstrip("Z") + "+00:00")
-            return date_obj.strftime("%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            return "Invalid Date"
+        return published_at.strftime("%Y-%m-%d %H:%M:%S")
 
     @staticmethod
     def process_notes(notes):
@@ -96,13 +121,9 @@ class DependencyDisplay:
                 processed_lines.append(line)
         return "\n".join(processed_lines)
 
-    def ensure_datetime(self, published_at):
+    @staticmethod
+    def ensure_datetime(published_at):
         """
-        Ensure that the published_at attribute is a datetime object.
+        Sort key of a publication date, parsed by the model; unknown dates sort last.
         """
-        if isinstance(published_at, str):
-            # Convert string to datetime, assuming the string ends with 'Z' for UTC
-            return datetime.fromisoformat(published_at.rstrip("Z") + "+00:00")
-        elif isinstance(published_at, datetime):
-            return published_at  # Return datetime if already converted
-        return datetime.min  # Return a minimum datetime for None or invalid types
+        return published_at or datetime.min.replace(tzinfo=timezone.utc)
@@ -0,0 +1,126 @@
+from rich.live import Live
+from rich.markup import escape
+from rich.table import Table
+from dependency_release_tracker.display.dependency_display import DependencyDisplay
+
+
+class LiveDisplay(DependencyDisplay):
+    """
+    Shows each dependency in a live table as soon as it has been checked, so the first
+    result appears after the first lookup instead of after the last one. Once a project
+    is complete the live table is replaced by the final table, sorted once by date.
+    Release notes are cut to their first line unless expand_notes is set, in which case
+    they are rendered in full below the table.
+    """
+
+    # The live table reports progress itself; a second live display can't run alongside
+    show_progress = False
+
+    def __init__(self, expand_notes=False, notes_width=60):
+        super().__init__()
+        self.expand_notes = expand_notes
+        self.notes_width = notes_width
+        self.live = None
+        self.rows = []
+
+    def stream(
+        self, dependency, simple_output=False, project_path=None, manifest_path=None
+    ):
+        self.rows.append(self.row(dependency, simple_output))
+        if self.live is None:
+            self.live = Live(
+                get_renderable=lambda: self.live_table(simple_output),
+                console=self.console,
+                refresh_per_second=8,
+                transient=True,
+            )
+            self.live.start()
+
+    def display(
+        self, dependencies, simple_output=False, project_path=None, manifest_path=None
+    ):
+        self.stop_live()
+        sorted_dependencies = sorted(
+            dependencies,
+            key=lambda dependency: self.ensure_datetime(dependency.published_at),
+            reverse=True,
+        )
+        table = self.table(simple_output)
+        for dependency in sorted_dependencies:
+            table.add_row(*self.row(dependency, simple_output))
+        table.caption = f"Packages: {len(sorted_dependencies)}"
+        self.console.print(table)
+
+        if self.expand_notes and not simple_output:
+            from rich.markdown import Markdown
+
+            for dependency in sorted_dependencies:
+                if dependency.notes:
+                    self.console.rule(f"[bold]{dependency.name}", style="dim")
+                    self.console.print(
+                        Markdown(self.process_notes(dependency.notes)),
+                    )
+
+    def close(self):
+        self.stop_live()
+
+    def stop_live(self):
+        if self.live is not None:
+            self.live.stop()
+            self.live = None
+        self.rows = []
+
+    def live_table(self, simple_output):
+        """
+        The most recent rows that fit the terminal, rebuilt at every refresh.
+        """
+        visible = max(1, self.console.size.height - 6)
+        table = self.table(simple_output)
+        for row in self.rows[-visible:]:
+            table.add_row(*row)
+        table.caption = f"Checking versions... {len(self.rows)} found"
+        return table
+
+    @staticmethod
+    def table(simple_output):
+        table = Table(expand=False)
+        table.add_column("Package", style="yellow", no_wrap=True)
+        table.add_column("Current")
+        table.add_column("Latest")
+        table.add_column("Update")
+        table.add_column("Published")
+        if not simple_output:
+            table.add_column("Notes", overflow="ellipsis", no_wrap=True)
+        return table
+
+    def row(self, dependency, simple_output):
+        update_type = dependency.update_type
+        row = [
+            escape(dependency.name),
+            escape(dependency.current_version or ""),
+            escape(dependency.latest_version or ""),
+            (
+                "[yellow]incomplete"
+                if dependency.incomplete
+                else f"[red]{update_type}" if update_type else "[green]up to date"
+            ),
+            self.format_date(dependency.published_at),
+        ]
+        if not simple_output:
+            row.append(escape(self.notes_summary(dependency.notes)))
+        return row
+
+    def notes_summary(self, notes):
+        """
+        First line of the release notes that isn't a heading, cut to notes_width characters.
+        """
+        for line in (notes or "").splitlines():
+            line = line.strip()
+            if line.startswith("#"):
+                continue
+            line = line.lstrip("*- ").strip()
+            if line:
+                if len(line) > self.notes_width:
+                    return line[: self.notes_width - 1] + "…"
+                return line
+        return ""
@@ -0,0 +1,167 @@
+import json
+import sys
+from dependency_release_tracker.version import __version__
+
+
+class JsonDisplay:
+    """
+    Writes the results as a single JSON document once every project has been checked.
+    Nothing is rendered with Rich and release notes are written as they were fetched.
+    """
+
+    show_progress = False
+
+    def __init__(self, output=None):
+        # Bind stdout now: the CLI sends any other output to stderr in this mode
+        self.output = output or sys.stdout
+        self.records = []
+
+    def record(self, dependency, project_path=None, manifest_path=None):
+        record = dependency.to_dict()
+        if dependency.incomplete:
+            record["status"] = "incomplete"
+        else:
+            record["status"] = "outdated" if dependency.is_outdated else "up-to-date"
+        record["update_type"] = dependency.update_type
+        if project_path is not None:
+            record["project"] = project_path
+        if manifest_path is not None:
+            record["manifest"] = manifest_path
+        return record
+
+    def display(
+        self, dependencies, simple_output=False, project_path=None, manifest_path=None
+    ):
+        for dependency in dependencies:
+            record = self.record(dependency, project_path, manifest_path)
+            if simple_output:
+                record.pop("notes")
+            self.records.append(record)
+
+    def project_header(self, project_path):
+        pass
+
+    def stream(
+        self, dependency, simple_output=False, project_path=None, manifest_path=None
+    ):
+        pass
+
+    def close(self):
+        json.dump(
+            {
+                "dependencies": self.records,
+                "incomplete": any(record["incomplete"] for record in self.records),
+            },
+            self.output,
+            indent=2,
+        )
+        self.output.write("\n")
+        self.output.flush()
+
+
+class JsonLinesDisplay(JsonDisplay):
+    """
+    Writes one JSON object per line as soon as each dependency has been checked,
+    so consumers can start working before the run is over.
+    """
+
+    def __init__(self, output=None):
+        super().__init__(output)
+        self.streamed = set()
+
+    def write(self, record):
+        self.output.write(json.dumps(record) + "\n")
+        self.output.flush()
+
+    def display(
+        self, dependencies, simple_output=False, project_path=None, manifest_path=None
+    ):
+        for dependency in dependencies:
+            if id(dependency) not in self.streamed:
+                record = self.record(dependency, project_path, manifest_path)
+                if simple_output:
+                    record.pop("notes")
+                self.write(record)
+
+    def stream(
+        self, dependency, simple_output=False, project_path=None, manifest_path=None
+    ):
+        self.streamed.add(id(dependency))
+        record = self.record(dependency, project_path, manifest_path)
+        if simple_output:
+            record.pop("notes")
+        self.write(record)
+
+    def close(self):
+        self.output.flush()
+
+
+class SarifDisplay(JsonDisplay):
+    """
+    Writes a SARIF 2.1.0 log with one result per dependency, for code scanning tools.
+    Outdated dependencies are reported as warnings, up to date and incomplete ones as notes.
+    """
+
+    RULE_ID = "outdated-dependency"
+
+    def close(self):
+        results = []
+        for record in self.records:
+            outdated = record["status"] == "outdated"
+            result = {
+                "ruleId": self.RULE_ID,
+                "level": "warning" if outdated else "note",
+                "message": {
+                    "text": (
+                        f"{record['name']} {record['current_version']} can be updated to {record['latest_version']}."
+                        if outdated
+                        else (
+                            f"{record['name']} {record['current_version']} was not checked before the deadline."
+                            if record["incomplete"]
+                            else f"{record['name']} {record['current_version']} is up to date."
+                        )
+                    )
+                },
+                "properties": {
+                    "currentVersion": record["current_version"],
+                    "latestVersion": record["latest_version"],
+                    "updateType": record["update_type"],
+                    "publishedAt": record["published_at"],
+                    "url": record["url"],
+                    "incomplete": record["incomplete"],
+                },
+            }
+            location = record.get("manifest") or record.get("project")
+            if location:
+                result["locations"] = [
+                    {"physicalLocation": {"artifactLocation": {"uri": location}}}
+                ]
+            results.append(result)
+
+        log = {
+            "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+            "version": "2.1.0",
+            "runs": [
+                {
+                    "tool": {
+                        "driver": {
+                            "name": "dependency-release-tracker",
+                            "version": __version__,
+                            "informationUri": "https://github.com/hugovanderlei/DependencyReleaseTracker",
+                            "rules": [
+                                {
+                                    "id": self.RULE_ID,
+                                    "shortDescription": {
+                                        "text": "A newer release of the dependency is available."
+                                    },
+                                }
+                            ],
+                        }
+                    },
+                    "results": results,
+                }
+            ],
+        }
+        json.dump(log, self.output, indent=2)
+        self.output.write("\n")
+        self.output.flush()
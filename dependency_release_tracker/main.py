@@ -1,30 +1,41 @@
 import argparse
-import sys
+import contextlib
+import json
 import os
-from rich.console import Console
-from dependency_release_tracker.dependency_readers.swift_reader import (
-    SwiftDependencyReader,
+import sys
+from dependency_release_tracker.dependency_readers.registry import (
+    ReaderRegistry,
+    load_class,
 )
 from dependency_release_tracker.utils.dependency_manager_detector import (
     DependencyManagerDetector,
 )
-from dependency_release_tracker.utils.dependency_manager_types import DependencyManager
-from dependency_release_tracker.dependency_readers.flutter_reader import (
-    FlutterDependencyReader,
-)
+from dependency_release_tracker.utils.deadline import set_deadline
+from dependency_release_tracker.utils.run_stats import get_run_stats
 from dependency_release_tracker.version import __version__
-import requests_cache
-
-console = Console()
-
-cache_folder = "dependency_release_tracker_cache"
-cache_dir = os.path.join(os.path.expanduser("~"), ".cache", cache_folder)
+from dependency_release_tracker.config import (
+    MAX_WORKERS,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    HTTP_MAX_RETRIES,
+    RUN_TIMEOUT,
+    LATEST_VERSION_TTL,
+    SERVER_PORT,
+    CACHE_PRUNE_DAYS,
+    DISCOVERY_MAX_DEPTH,
+)
 
-if not os.path.exists(cache_dir):
-    os.makedirs(cache_dir)
+# Readers and displays are imported when they are used, which keeps the startup
+# of --version, --help and runs without a supported project fast.
+reader_registry = ReaderRegistry()
 
-cache_path = os.path.join(cache_dir, cache_folder)
-requests_cache.install_cache(cache_path, expire_after=1800)
+display_classes = {
+    "text": "dependency_release_tracker.display.dependency_display:DependencyDisplay",
+    "live": "dependency_release_tracker.display.live_display:LiveDisplay",
+    "json": "dependency_release_tracker.display.machine_output:JsonDisplay",
+    "jsonl": "dependency_release_tracker.display.machine_output:JsonLinesDisplay",
+    "sarif": "dependency_release_tracker.display.machine_output:SarifDisplay",
+}
 
 
 def main():
@@ -45,31 +56,496 @@ def main():
     parser.add_argument(
         "--path", type=str, default=".", help="Path to the project directory"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of dependencies to check concurrently.",
+    )
+    parser.add_argument(
+        "--github-api",
+        choices=["rest", "graphql"],
+        default=None,
+        help="GitHub API used to look up Swift releases. 'graphql' resolves many repositories per request and requires GITHUB_TOKEN.",
+    )
+    parser.add_argument(
+        "--revalidation-stats",
+        action="store_true",
+        help="Report how many expired lookups were answered with 304 Not Modified.",
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=HTTP_CONNECT_TIMEOUT,
+        help="Seconds to wait for a connection to a registry.",
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=HTTP_READ_TIMEOUT,
+        help="Seconds to wait for a registry to send data.",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=HTTP_MAX_RETRIES,
+        help="Retries for connection errors and server errors.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=RUN_TIMEOUT,
+        help="Seconds the whole run may take. Latest versions are looked up before release notes, and what isn't done in time is reported as incomplete.",
+    )
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Check every project below --path, looking up shared packages once.",
+    )
+    parser.add_argument(
+        "--ignore",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Directory name or glob pattern to skip while looking for projects. Can be repeated.",
+    )
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        default=DISCOVERY_MAX_DEPTH,
+        help="How many directory levels below --path are searched for projects.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=list(display_classes),
+        default="text",
+        help="Output format. 'live' and 'jsonl' show each dependency as soon as it has been checked.",
+    )
+    parser.add_argument(
+        "--expand-notes",
+        action="store_true",
+        help="With --format live, print the full release notes below the table instead of their first line.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Don't use the network; answer from --index and the local cache only.",
+    )
+    parser.add_argument(
+        "--index",
+        type=str,
+        default=None,
+        help="Package index written by --prefetch, used by --offline runs.",
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=str,
+        default=None,
+        metavar="INDEX",
+        help="Look up the packages of every project below --path and write them to a package index file.",
+    )
+    parser.add_argument(
+        "--max-age",
+        type=int,
+        default=None,
+        help="Seconds during which the previous run's results are reused for packages whose pinned version is unchanged. 0 looks everything up again.",
+    )
+    parser.add_argument(
+        "--since-last-run",
+        action="store_true",
+        help="Only list releases that appeared since the previous run.",
+    )
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help="Show the release notes of every version between the current and the latest one.",
+    )
+    parser.add_argument(
+        "--only",
+        choices=["major", "minor", "patch"],
+        help="Only list updates of this type.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print timings, request counts and cache hit rates to stderr at the end of the run.",
+    )
+    parser.add_argument(
+        "--stats-json",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Write timings, request counts and cache hit rates to a JSON file.",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Run under cProfile and write the profile to PATH, for python -m pstats or snakeviz.",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run a local server that keeps results in memory, watches the manifests and lock files of the projects it is asked about and refreshes them on a schedule.",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=SERVER_PORT,
+        help="Port of the --serve endpoint on 127.0.0.1.",
+    )
+    parser.add_argument(
+        "--refresh-interval",
+        type=int,
+        default=LATEST_VERSION_TTL,
+        help="Seconds after which --serve checks a project again even if its files are unchanged.",
+    )
+    parser.add_argument(
+        "--server",
+        type=str,
+        default=None,
+        metavar="URL",
+        help="Ask a running --serve instance, e.g. http://127.0.0.1:8765, instead of checking locally.",
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Print the number of entries and bytes in the cache per namespace.",
+    )
+    parser.add_argument(
+        "--cache-prune",
+        type=float,
+        nargs="?",
+        const=CACHE_PRUNE_DAYS,
+        default=None,
+        metavar="DAYS",
+        help=f"Remove cache entries unused for DAYS days (default: {CACHE_PRUNE_DAYS:g}) and the least recently used ones beyond the size cap.",
+    )
     args = parser.parse_args()
 
-    try:
-        detector = DependencyManagerDetector(args.path)
-        manager_type = detector.detect()
-
-        reader_classes = {
-            DependencyManager.SWIFT: SwiftDependencyReader,
-            DependencyManager.FLUTTER: FlutterDependencyReader,
-        }
-
-        reader_class = reader_classes.get(manager_type)
-        if reader_class:
-            reader = reader_class(args.path)
-            reader.process(all_versions=args.all, simple_output=args.simple)
-        else:
-            console.print(
-                "Supported dependency manager not found in the specified directory.",
-                style="bold red",
-            )
+    # The server answers queries for as long as it runs; the deadline is for single runs
+    deadline = set_deadline(None if args.serve else args.timeout)
+    stats = get_run_stats()
+    if args.profile or args.stats_json:
+        stats.enable()
+    profiler = None
+    if args.profile_output:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    from rich.console import Console
+
+    console = Console()
+    display_options = (
+        {"expand_notes": args.expand_notes} if args.format == "live" else {}
+    )
+    dependency_display = load_class(display_classes[args.format])(**display_options)
+
+    package_index = None
+    if args.index:
+        from dependency_release_tracker.utils.package_index import PackageIndex
+
+        try:
+            package_index = PackageIndex.open(args.index)
+        except FileNotFoundError as e:
+            console.print(str(e), style="bold red")
             sys.exit(1)
 
+    # Options of every reader; each reader picks the ones it knows
+    reader_options = {
+        "jobs": args.jobs,
+        "dependency_display": dependency_display,
+        "github_api": args.github_api,
+        "offline": args.offline,
+        "package_index": package_index,
+        "max_age": args.max_age,
+        "since_last_run": args.since_last_run,
+        "history": args.history,
+        "only": args.only,
+    }
+
+    # Keep stdout for the machine-readable output; warnings and messages go to stderr
+    if args.format in ("text", "live"):
+        output_redirect = contextlib.nullcontext()
+    else:
+        output_redirect = contextlib.redirect_stdout(sys.stderr)
+
+    try:
+        if args.cache_stats or args.cache_prune is not None:
+            manage_cache(args, console)
+            return
+
+        if args.prefetch:
+            prefetch_index(args, reader_options, console)
+            return
+
+        if args.serve:
+            serve(args, reader_options, console)
+            return
+
+        if args.server:
+            with output_redirect:
+                query_server(args, dependency_display, console)
+            dependency_display.close()
+            return
+
+        with output_redirect:
+            found = check_projects(args, reader_options)
+            if not found:
+                console.print(
+                    "Supported dependency manager not found in the specified directory.",
+                    style="bold red",
+                )
+                sys.exit(1)
+
+            if deadline.missed:
+                console.print(
+                    f"Stopped after {args.timeout:g}s: {deadline.missed} lookups are incomplete.",
+                    style="bold yellow",
+                )
+
+            if args.revalidation_stats:
+                from dependency_release_tracker.utils.revalidation import (
+                    get_revalidation_cache,
+                )
+
+                console.print(get_revalidation_cache().summary(), style="dim")
+        with stats.phase("write output"):
+            dependency_display.close()
+
     except KeyboardInterrupt:
         console.print("\nOperation cancelled by the user.\n", style="bold yellow")
         sys.exit(1)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile_output)
+        report_stats(args)
+
+
+def detect_projects(args, recursive, path=None):
+    """
+    Find the projects to check below path (default --path): every project when
+    recursive, otherwise the first project of each ecosystem. Returns the detector,
+    the projects with a reader and the reader class of each of their ecosystems.
+    """
+    with get_run_stats().phase("detect projects"):
+        detector = DependencyManagerDetector(
+            path or args.path,
+            ignore=args.ignore,
+            max_depth=args.max_depth,
+            manifests=reader_registry.plugin_manifests(),
+        )
+        projects = detector.detect_all() if recursive else detector.detect_ecosystems()
+        projects = [
+            project for project in projects if reader_registry.get(project.ecosystem)
+        ]
+    project_reader_classes = {
+        project.ecosystem: reader_registry.get(project.ecosystem)
+        for project in projects
+    }
+    return detector, projects, project_reader_classes
+
+
+def check_projects(args, reader_options):
+    """
+    Check the projects at --path, or every project below it with --recursive.
+    Returns False when no supported project was found.
+    """
+    detector, projects, project_reader_classes = detect_projects(args, args.recursive)
+    if not projects:
+        return False
+
+    configure_http(args)
+
+    if len(projects) > 1:
+        from dependency_release_tracker.dependency_readers.project_scanner import (
+            ProjectScanner,
+        )
+
+        scanner = ProjectScanner(
+            args.path,
+            project_reader_classes,
+            reader_options,
+            detector=detector,
+            projects=projects,
+        )
+        return scanner.process(all_versions=args.all, simple_output=args.simple)
+
+    project = projects[0]
+    reader_class = project_reader_classes[project.ecosystem]
+    reader = reader_class(
+        project.path,
+        manifest_path=project.manifest_path,
+        **reader_options,
+    )
+    reader.process(all_versions=args.all, simple_output=args.simple)
+    return True
+
+
+def manage_cache(args, console):
+    """
+    Prune the cache store with --cache-prune, then print its contents with --cache-stats.
+    """
+    from rich.table import Table
+    from dependency_release_tracker.config import CACHE_BACKEND, CACHE_LOCATION
+    from dependency_release_tracker.utils.cache_store import get_cache_store
+
+    cache_store = get_cache_store()
+    if args.cache_prune is not None:
+        removed, freed = cache_store.prune(args.cache_prune * 24 * 3600)
+        console.print(
+            f"Removed {removed} cache entries ({freed / 1024:.1f} KiB).",
+            style="bold green",
+        )
+    if args.cache_stats:
+        table = Table(
+            title=f"Cache ({CACHE_BACKEND}) in {CACHE_LOCATION}", title_justify="left"
+        )
+        table.add_column("Namespace")
+        table.add_column("Entries", justify="right")
+        table.add_column("Bytes", justify="right")
+        stats = cache_store.stats()
+        for namespace, counts in stats.items():
+            table.add_row(namespace, str(counts["entries"]), str(counts["bytes"]))
+        table.add_row(
+            "total",
+            str(sum(counts["entries"] for counts in stats.values())),
+            str(sum(counts["bytes"] for counts in stats.values())),
+            style="bold",
+        )
+        console.print(table)
+
+
+def prefetch_index(args, reader_options, console):
+    """
+    Look up every package of every project below --path and snapshot the results
+    into the package index given with --prefetch.
+    """
+    from dependency_release_tracker.dependency_readers.project_scanner import (
+        ProjectScanner,
+    )
+    from dependency_release_tracker.utils.package_index import PackageIndex
+
+    detector, projects, project_reader_classes = detect_projects(args, True)
+    configure_http(args)
+    scanner = ProjectScanner(
+        args.path,
+        project_reader_classes,
+        reader_options,
+        detector=detector,
+        projects=projects,
+    )
+    count = scanner.export(PackageIndex(args.prefetch))
+    if count is None:
+        console.print(
+            "Supported dependency manager not found in the specified directory.",
+            style="bold red",
+        )
+        sys.exit(1)
+    console.print(f"Wrote {count} packages to {args.prefetch}.", style="bold green")
+
+
+def serve(args, reader_options, console):
+    """
+    Run the local server of --serve until interrupted, starting with the projects at --path.
+    """
+    from dependency_release_tracker.server import TrackerService, serve
+
+    def detect(path):
+        _, projects, project_reader_classes = detect_projects(
+            args, args.recursive, path=path
+        )
+        return projects, project_reader_classes
+
+    configure_http(args)
+    service = TrackerService(detect, reader_options, args.refresh_interval)
+    if service.project(args.path) is not None:
+        service.results(args.path)
+    console.print(
+        f"Serving on http://127.0.0.1:{args.port} (GET /projects?path=<dir>, GET /status)",
+        style="bold green",
+    )
+    serve(service, args.port)
+
+
+def query_server(args, dependency_display, console):
+    """
+    Show the results of the project at --path as answered by a --serve instance.
+    """
+    import urllib.error
+    import urllib.parse
+    import urllib.request
+    from dependency_release_tracker.models.dependency import Dependency
+
+    query = urllib.parse.urlencode(
+        {"path": os.path.abspath(args.path), "all": "1" if args.all else "0"}
+    )
+    url = f"{args.server.rstrip('/')}/projects?{query}"
+    try:
+        with urllib.request.urlopen(url, timeout=args.read_timeout) as response:
+            result = json.load(response)
+    except urllib.error.HTTPError as e:
+        console.print(json.load(e).get("error", str(e)), style="bold red")
+        sys.exit(1)
+    except (urllib.error.URLError, OSError) as e:
+        console.print(f"Could not reach {args.server}: {e}", style="bold red")
+        sys.exit(1)
+
+    if result.get("error"):
+        console.print(result["error"], style="bold red")
+    manifests = {}
+    for record in result["dependencies"]:
+        if args.only and record.get("update_type") != args.only:
+            continue
+        dependency = Dependency.from_dict(record)
+        manifests.setdefault(
+            (record.get("project"), record.get("manifest")), []
+        ).append(dependency)
+    if not manifests:
+        print("No updates found.")
+    for (project_path, manifest_path), dependencies in manifests.items():
+        if len(manifests) > 1:
+            dependency_display.project_header(project_path)
+        dependency_display.display(
+            dependencies,
+            simple_output=args.simple,
+            project_path=project_path,
+            manifest_path=manifest_path,
+        )
+
+
+def report_stats(args):
+    """
+    Print the run statistics with --profile and write them to the --stats-json file.
+    """
+    stats = get_run_stats()
+    if not stats.enabled:
+        return
+    if args.profile:
+        from rich.console import Console
+
+        console = Console(stderr=True)
+        for table in stats.summary_tables():
+            console.print(table)
+    if args.stats_json:
+        with open(args.stats_json, "w") as file:
+            json.dump(stats.to_dict(), file, indent=2)
+
+
+def configure_http(args):
+    from dependency_release_tracker.utils.http_client import configure_http_client
+
+    configure_http_client(
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        max_retries=args.retries,
+        pool_size=args.jobs or MAX_WORKERS,
+        offline=args.offline,
+    )
 
 
 if __name__ == "__main__":
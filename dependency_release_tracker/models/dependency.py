@@ -1,4 +1,48 @@
+from datetime import datetime, timezone
+from dependency_release_tracker.utils.repository_url import parse_repository_url
+from dependency_release_tracker.utils.versioning import classify_update, version_key
+
+
+def parse_datetime(value):
+    """
+    Return value as a timezone-aware datetime. ISO 8601 strings, with or without a
+    trailing 'Z', and naive datetimes are taken as UTC. Returns None for missing or invalid dates.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
 class Dependency:
+    """
+    A package used by a project and the result of its lookup.
+    Fields are normalized once when they are set: versions are parsed into version keys,
+    the repository URL into its host and path and the publication date into a
+    timezone-aware datetime, so sorting, comparing and grouping never parse them again.
+    Slots keep the many instances of large multi-project scans small.
+    """
+
+    __slots__ = (
+        "name",
+        "ecosystem",
+        "notes",
+        "url",
+        "incomplete",
+        "_current_version",
+        "current_key",
+        "_latest_version",
+        "latest_key",
+        "_repo_url",
+        "repository",
+        "_published_at",
+    )
 
     def __init__(
         self,
@@ -9,14 +53,118 @@ class Dependency:
         notes=None,
         url=None,
         published_at=None,
+        ecosystem=None,
+        incomplete=False,
     ):
         self.name = name
+        self.ecosystem = ecosystem
         self.current_version = current_version
         self.repo_url = repo_url
         self.latest_version = latest_version or current_version
         self.notes = notes
         self.url = url
         self.published_at = published_at
+        # Set when the deadline of the run passed before the lookup finished
+        self.incomplete = incomplete
+
+    @property
+    def current_version(self):
+        return self._current_version
+
+    @current_version.setter
+    def current_version(self, value):
+        self._current_version = value
+        self.current_key = version_key(value)
+
+    @property
+    def latest_version(self):
+        return self._latest_version
+
+    @latest_version.setter
+    def latest_version(self, value):
+        self._latest_version = value
+        self.latest_key = version_key(value)
+
+    @property
+    def repo_url(self):
+        return self._repo_url
+
+    @repo_url.setter
+    def repo_url(self, value):
+        self._repo_url = value
+        self.repository = parse_repository_url(value)
+
+    @property
+    def owner_repo(self):
+        """
+        The 'owner/repo' part of the repository URL, or None without a remote repository.
+        """
+        return self.repository.owner_repo if self.repository else None
+
+    @property
+    def published_at(self):
+        return self._published_at
+
+    @published_at.setter
+    def published_at(self, value):
+        self._published_at = parse_datetime(value)
 
     def __str__(self):
         return f"{self.name} [{self.current_version} -> {self.latest_version}]"
+
+    def __repr__(self):
+        return f"Dependency({self.name!r}, {self.current_version!r}, latest_version={self.latest_version!r})"
+
+    @property
+    def is_outdated(self):
+        return self.update_type is not None
+
+    @property
+    def update_type(self):
+        """
+        'major', 'minor' or 'patch' when the latest version is an update, otherwise None.
+        """
+        return classify_update(
+            self.current_key, self.latest_key, self.current_version, self.latest_version
+        )
+
+    def to_dict(self):
+        published_at = self._published_at
+        return {
+            "name": self.name,
+            "ecosystem": self.ecosystem,
+            "current_version": self._current_version,
+            "latest_version": self._latest_version,
+            "published_at": published_at.isoformat() if published_at else None,
+            "url": self.url,
+            "repo_url": self._repo_url,
+            "notes": self.notes,
+            "incomplete": self.incomplete,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a dependency from a dict written by to_dict.
+        """
+        return cls(
+            data["name"],
+            data["current_version"],
+            repo_url=data.get("repo_url"),
+            latest_version=data.get("latest_version"),
+            notes=data.get("notes"),
+            url=data.get("url"),
+            published_at=data.get("published_at"),
+            ecosystem=data.get("ecosystem"),
+            incomplete=data.get("incomplete", False),
+        )
+
+    def update_from_dict(self, data):
+        """
+        Restore the lookup results saved by to_dict.
+        """
+        self.latest_version = data.get("latest_version") or self.current_version
+        self.published_at = data.get("published_at")
+        self.url = data.get("url")
+        self.notes = data.get("notes")
+        self.incomplete = data.get("incomplete", False)
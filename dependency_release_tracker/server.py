@@ -0,0 +1,252 @@
+import io
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from dependency_release_tracker.dependency_readers.project_scanner import (
+    ProjectScanner,
+)
+from dependency_release_tracker.display.machine_output import JsonDisplay
+from dependency_release_tracker.utils.run_state import RunState
+
+
+class WatchedProject:
+    """
+    A project directory known to the server: the projects found in it, the
+    manifest and lock files whose changes trigger a new check, and the last results.
+    """
+
+    def __init__(self, path, projects, reader_classes):
+        self.path = path
+        self.projects = projects
+        self.reader_classes = reader_classes
+        self.results = None
+        self.checked_at = None
+        self.signature = None
+        self.error = None
+        self.lock = threading.Lock()
+
+    def files(self):
+        for project in self.projects:
+            yield project.manifest_path
+            if project.lock_path:
+                yield project.lock_path
+
+    def file_signature(self):
+        signature = []
+        for path in self.files():
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((path, None, None))
+        return signature
+
+
+class TrackerService:
+    """
+    Keeps the results of every project queried so far in memory, together with the
+    process-wide cache store and pooled HTTP connections. A background thread polls
+    the projects' manifest and lock files every poll_interval seconds and checks a
+    project again when they change or once its results are older than refresh_interval.
+    """
+
+    def __init__(self, detect, reader_options, refresh_interval, poll_interval=2):
+        # detect(path) returns the projects in path and the reader class per ecosystem
+        self.detect = detect
+        self.refresh_interval = refresh_interval
+        self.poll_interval = poll_interval
+        self.projects = {}
+        self.lock = threading.Lock()
+        # Records are built by a JSON display, which also keeps progress bars off
+        self.display = JsonDisplay(output=io.StringIO())
+        self.reader_options = {**reader_options, "dependency_display": self.display}
+        self._stopped = threading.Event()
+
+    def project(self, path):
+        """
+        Return the watched project for a directory, detecting its projects on first use.
+        Returns None when the directory holds no supported project.
+        """
+        path = os.path.abspath(path)
+        with self.lock:
+            watched = self.projects.get(path)
+        if watched is not None:
+            return watched
+        # Detection walks the directory, so it runs outside the lock; of concurrent
+        # first requests for one path, the first to finish is kept
+        projects, reader_classes = self.detect(path)
+        if not projects:
+            return None
+        with self.lock:
+            return self.projects.setdefault(
+                path, WatchedProject(path, projects, reader_classes)
+            )
+
+    def results(self, path, all_versions=False, refresh=False):
+        """
+        Return the results of a project directory as a JSON-ready dict, checking it
+        first if it has never been checked, changed since or refresh is requested.
+        Returns None when the directory holds no supported project.
+        """
+        watched = self.project(path)
+        if watched is None:
+            return None
+        if refresh or watched.results is None or self.is_stale(watched):
+            self.check(watched, refresh=refresh or self.is_expired(watched))
+
+        dependencies = []
+        for project_path, reader, checked in watched.results or []:
+            dependencies.extend(
+                self.display.record(dependency, project_path, reader.manifest_path)
+                for dependency in checked
+                if reader.should_display(dependency, all_versions)
+            )
+        return {
+            "path": watched.path,
+            "checked_at": watched.checked_at,
+            "error": watched.error,
+            "dependencies": dependencies,
+        }
+
+    def is_stale(self, watched):
+        return watched.signature != watched.file_signature() or self.is_expired(watched)
+
+    def is_expired(self, watched):
+        return (
+            watched.checked_at is not None
+            and time.time() - watched.checked_at > self.refresh_interval
+        )
+
+    def check(self, watched, refresh=False):
+        """
+        Check a project again. A changed project reuses the results of unchanged pins;
+        a refresh, requested or scheduled, looks every package up in the registries again.
+        A check that waited for another one of the same project is skipped when that
+        one left the project up to date.
+        """
+        checked_at = watched.checked_at
+        with watched.lock:
+            if watched.checked_at != checked_at and not self.is_stale(watched):
+                return
+            signature = watched.file_signature()
+            scanner = ProjectScanner(
+                watched.path,
+                watched.reader_classes,
+                {**self.reader_options, "refresh": refresh},
+                projects=watched.projects,
+                processes=False,
+            )
+            try:
+                projects = scanner.read_projects()
+                states = [
+                    RunState.load(project_path, variant=reader.state_variant)
+                    for project_path, reader, _ in projects
+                ]
+                resolved = scanner.resolve(projects, states)
+            except Exception as e:
+                watched.error = str(e)
+            else:
+                watched.results = [
+                    (project_path, reader, dependencies)
+                    for (project_path, reader, _), dependencies in zip(
+                        projects, resolved
+                    )
+                ]
+                watched.error = None
+            watched.signature = signature
+            watched.checked_at = time.time()
+
+    def status(self):
+        with self.lock:
+            watched_projects = list(self.projects.values())
+        return {
+            "projects": [
+                {
+                    "path": watched.path,
+                    "checked_at": watched.checked_at,
+                    "error": watched.error,
+                    "files": list(watched.files()),
+                }
+                for watched in watched_projects
+            ]
+        }
+
+    def watch(self):
+        while not self._stopped.wait(self.poll_interval):
+            with self.lock:
+                watched_projects = list(self.projects.values())
+            for watched in watched_projects:
+                if watched.checked_at is not None and self.is_stale(watched):
+                    self.check(watched, refresh=self.is_expired(watched))
+
+    def start(self):
+        threading.Thread(target=self.watch, daemon=True).start()
+
+    def stop(self):
+        self._stopped.set()
+
+
+class TrackerRequestHandler(BaseHTTPRequestHandler):
+    """
+    Local HTTP endpoint of the server:
+
+    GET /projects?path=<dir>[&all=1][&refresh=1]  results of the projects in dir
+    GET /status                                   projects being watched
+    """
+
+    service = None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/projects":
+            path = query.get("path", [None])[0]
+            if not path:
+                self.send_json(400, {"error": "The path parameter is required."})
+                return
+            result = self.service.results(
+                path,
+                all_versions=query.get("all") == ["1"],
+                refresh=query.get("refresh") == ["1"],
+            )
+            if result is None:
+                self.send_json(
+                    404,
+                    {
+                        "error": "Supported dependency manager not found in the specified directory."
+                    },
+                )
+                return
+            self.send_json(200, result)
+        elif url.path == "/status":
+            self.send_json(200, self.service.status())
+        else:
+            self.send_json(404, {"error": f"Unknown endpoint {url.path}"})
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(service, port, host="127.0.0.1"):
+    """
+    Answer queries for the service on http://host:port until interrupted.
+    """
+    handler = type("Handler", (TrackerRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    service.start()
+    try:
+        server.serve_forever()
+    finally:
+        service.stop()
+        server.server_close()
@@ -1,3 +1,41 @@
-from .progress_manager import ProgressManager
-from .dependency_manager_types import DependencyManager
-from .dependency_manager_detector import DependencyManagerDetector
+from .lazy_exports import lazy_exports
+
+_exports = {
+    "ProgressManager": ".progress_manager",
+    "DependencyManager": ".dependency_manager_types",
+    "DependencyManagerDetector": ".dependency_manager_detector",
+    "GitHubClient": ".github_client",
+    "CacheStore": ".cache_store",
+    "FileCacheStore": ".cache_store",
+    "get_cache_store": ".cache_store",
+    "open_cache_store": ".cache_store",
+    "RevalidationCache": ".revalidation",
+    "get_revalidation_cache": ".revalidation",
+    "HttpClient": ".http_client",
+    "get_http_client": ".http_client",
+    "configure_http_client": ".http_client",
+    "ProjectDiscovery": ".project_discovery",
+    "DiscoveredProject": ".project_discovery",
+    "PackageIndex": ".package_index",
+    "RunState": ".run_state",
+    "version_key": ".versioning",
+    "clean_version": ".versioning",
+    "is_newer": ".versioning",
+    "is_prerelease": ".versioning",
+    "update_type": ".versioning",
+    "classify_update": ".versioning",
+    "Repository": ".repository_url",
+    "parse_repository_url": ".repository_url",
+    "GitTagClient": ".git_tags",
+    "Deadline": ".deadline",
+    "DeadlineExceeded": ".deadline",
+    "get_deadline": ".deadline",
+    "set_deadline": ".deadline",
+    "WorkerPool": ".worker_pool",
+    "RunStats": ".run_stats",
+    "get_run_stats": ".run_stats",
+}
+
+__all__ = list(_exports)
+
+__getattr__ = lazy_exports(__name__, _exports)
@@ -0,0 +1,316 @@
+import hashlib
+import importlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dependency_release_tracker.config import (
+    CACHE_BACKEND,
+    CACHE_BUSY_TIMEOUT,
+    CACHE_LOCATION,
+    CACHE_MAX_SIZE,
+)
+from dependency_release_tracker.utils.run_stats import get_run_stats
+
+# Last use of an entry is only written again after this many seconds, so reads
+# from many concurrent runs don't all turn into writes
+ACCESS_RESOLUTION = 3600
+
+
+class CacheStore:
+    """
+    Persistent key/value store for data extracted from registries, kept in SQLite.
+    Entries live in namespaces such as 'notes' (release notes of a released version,
+    which never change) and 'latest' (latest version lookups, read with a max_age).
+    Once the store grows past max_size the least recently used entries are evicted;
+    a max_size of None keeps every entry.
+    The database runs in WAL mode and waits up to busy_timeout seconds for a lock, so
+    concurrent runs on one machine share it. WAL needs shared memory, so a store on a
+    network file system should use FileCacheStore instead.
+    """
+
+    journal_mode = "wal"
+
+    def __init__(self, path, max_size=CACHE_MAX_SIZE, busy_timeout=CACHE_BUSY_TIMEOUT):
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=busy_timeout, check_same_thread=False
+        )
+        self._connection.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        if self.journal_mode == "wal":
+            # Safe with WAL: a crash may lose the last writes but never corrupts the database
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+        with self._connection:
+            # One transaction, so no concurrent run writes before the triggers exist
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """)
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+            )
+            # Running total of the entry sizes, kept up to date by triggers so eviction
+            # doesn't have to sum the whole table on every write
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS totals (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    size INTEGER NOT NULL
+                )
+                """)
+            self._connection.execute(
+                "INSERT OR IGNORE INTO totals SELECT 0, COALESCE(SUM(size), 0) FROM entries"
+            )
+            for name, event, change in (
+                ("entries_insert", "INSERT", "NEW.size"),
+                ("entries_update", "UPDATE OF size", "NEW.size - OLD.size"),
+                ("entries_delete", "DELETE", "-OLD.size"),
+            ):
+                self._connection.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON entries BEGIN
+                        UPDATE totals SET size = size + {change};
+                    END
+                    """)
+
+    def get(self, namespace, key, max_age=None):
+        """
+        Return the stored value, or None if it is missing or older than max_age seconds.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, created_at, accessed_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None or (max_age is not None and now - row[1] > max_age):
+                get_run_stats().count(f"cache.{namespace}.misses")
+                return None
+            if now - row[2] > ACCESS_RESOLUTION:
+                with self._connection:
+                    self._connection.execute(
+                        "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                        (now, namespace, key),
+                    )
+        get_run_stats().count(f"cache.{namespace}.hits")
+        return json.loads(row[0])
+
+    def set(self, namespace, key, value):
+        data = json.dumps(value)
+        now = time.time()
+        with self._lock, self._connection:
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete wouldn't
+            # fire the trigger keeping the total size
+            self._connection.execute(
+                """
+                INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value,
+                    size = excluded.size, created_at = excluded.created_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (namespace, key, data, len(data), now, now),
+            )
+            self._evict()
+
+    def _evict(self):
+        if self.max_size is None:
+            return 0, 0
+        (total,) = self._connection.execute("SELECT size FROM totals").fetchone()
+        if total <= self.max_size:
+            return 0, 0
+        rows = self._connection.execute(
+            "SELECT rowid, size FROM entries ORDER BY accessed_at"
+        )
+        evicted = []
+        freed = 0
+        for rowid, size in rows:
+            if total - freed <= self.max_size:
+                break
+            evicted.append((rowid,))
+            freed += size
+        self._connection.executemany("DELETE FROM entries WHERE rowid = ?", evicted)
+        return len(evicted), freed
+
+    def stats(self):
+        """
+        Return {namespace: {'entries': count, 'bytes': size}}.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT namespace, COUNT(*), SUM(size) FROM entries GROUP BY namespace ORDER BY namespace"
+            ).fetchall()
+        return {
+            namespace: {"entries": count, "bytes": size}
+            for namespace, count, size in rows
+        }
+
+    def prune(self, max_unused):
+        """
+        Remove the entries not used for max_unused seconds, then the least recently
+        used ones beyond max_size. Returns the number of entries and bytes removed.
+        """
+        cutoff = time.time() - max_unused
+        with self._lock, self._connection:
+            removed, freed = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE accessed_at < ?",
+                (cutoff,),
+            ).fetchone()
+            self._connection.execute(
+                "DELETE FROM entries WHERE accessed_at < ?", (cutoff,)
+            )
+            evicted, evicted_size = self._evict()
+        return removed + evicted, freed + evicted_size
+
+
+class FileCacheStore:
+    """
+    CacheStore kept as one JSON file per entry under a directory, for a cache shared
+    by many machines, e.g. on an NFS mount, where SQLite locking can't be relied on.
+    Entries are written to a temporary file and renamed into place, so concurrent
+    readers and writers never see a partial entry; the last writer wins.
+    Checking the size of a shared directory on every write would be slow, so
+    max_size is only enforced by prune.
+    """
+
+    def __init__(self, path, max_size=CACHE_MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+
+    def entry_path(self, namespace, key):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.path, namespace, digest[:2], f"{digest}.json")
+
+    def get(self, namespace, key, max_age=None):
+        """
+        Return the stored value, or None if it is missing or older than max_age seconds.
+        """
+        path = self.entry_path(namespace, key)
+        now = time.time()
+        try:
+            with open(path, "r") as file:
+                entry = json.load(file)
+            accessed_at = os.stat(path).st_mtime
+        except (OSError, ValueError):
+            entry = None
+        if (
+            entry is None
+            or entry["key"] != key
+            or (max_age is not None and now - entry["created_at"] > max_age)
+        ):
+            get_run_stats().count(f"cache.{namespace}.misses")
+            return None
+        if now - accessed_at > ACCESS_RESOLUTION:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        get_run_stats().count(f"cache.{namespace}.hits")
+        return entry["value"]
+
+    def set(self, namespace, key, value):
+        path = self.entry_path(namespace, key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, suffix=".tmp", delete=False
+        ) as file:
+            json.dump({"key": key, "created_at": time.time(), "value": value}, file)
+        os.replace(file.name, path)
+
+    def entries(self):
+        """
+        Yield (namespace, path, size, last use) of every entry.
+        """
+        if not os.path.isdir(self.path):
+            return
+        for namespace in sorted(os.listdir(self.path)):
+            for directory, _, files in os.walk(os.path.join(self.path, namespace)):
+                for name in files:
+                    if not name.endswith(".json"):
+                        continue
+                    path = os.path.join(directory, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    yield namespace, path, stat.st_size, stat.st_mtime
+
+    def stats(self):
+        """
+        Return {namespace: {'entries': count, 'bytes': size}}.
+        """
+        stats = {}
+        for namespace, _, size, _ in self.entries():
+            counts = stats.setdefault(namespace, {"entries": 0, "bytes": 0})
+            counts["entries"] += 1
+            counts["bytes"] += size
+        return stats
+
+    def prune(self, max_unused):
+        """
+        Remove the entries not used for max_unused seconds, then the least recently
+        used ones beyond max_size. Returns the number of entries and bytes removed.
+        """
+        cutoff = time.time() - max_unused
+        kept = []
+        removed = freed = 0
+        for _, path, size, accessed_at in self.entries():
+            if accessed_at < cutoff:
+                removed, freed = removed + self._remove(path), freed + size
+            else:
+                kept.append((accessed_at, path, size))
+        if self.max_size is not None:
+            total = sum(size for _, _, size in kept)
+            for _, path, size in sorted(kept):
+                if total <= self.max_size:
+                    break
+                removed, freed = removed + self._remove(path), freed + size
+                total -= size
+        return removed, freed
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Removed by a concurrent prune
+            return 0
+        return 1
+
+
+def open_cache_store(backend=CACHE_BACKEND, location=CACHE_LOCATION):
+    """
+    Open the cache store of a backend at location, a directory.
+    """
+    os.makedirs(location, exist_ok=True)
+    if backend == "sqlite":
+        return CacheStore(os.path.join(location, "release_notes.sqlite"))
+    if backend == "files":
+        return FileCacheStore(os.path.join(location, "entries"))
+    module_name, _, class_name = backend.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)(location)
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_cache_store():
+    """
+    Return the store shared by all readers, opening it under CACHE_LOCATION on first use.
+    """
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = open_cache_store()
+    return _default_store
@@ -0,0 +1,88 @@
+import threading
+import time
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised for work started, or still running, once the deadline of the run has passed.
+    Unlike requests.Timeout it isn't handled as a failed lookup: the dependency is
+    reported as incomplete instead.
+    """
+
+
+class Deadline:
+    """
+    Time budget of a run, shared by every reader and worker thread. Without a
+    budget nothing is limited. With one, each request's timeouts are cut to the time
+    left, waits that would outlast it fail right away, and work still outstanding when
+    it passes is reported as incomplete.
+    """
+
+    def __init__(self, seconds=None):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds if seconds else None
+        self.missed = 0
+        self._lock = threading.Lock()
+
+    def remaining(self):
+        """
+        Seconds left, or None without a deadline.
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self):
+        return self.remaining() == 0
+
+    def check(self):
+        if self.expired:
+            raise DeadlineExceeded(f"Deadline of {self.seconds:g}s exceeded")
+
+    def budget(self, timeout):
+        """
+        Cut a timeout, a number of seconds or a (connect, read) pair as requests takes
+        it, to the time left. Raises DeadlineExceeded when no time is left.
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        self.check()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        return min(timeout, remaining)
+
+    def sleep(self, seconds):
+        """
+        Sleep, unless the deadline would pass first.
+        """
+        remaining = self.remaining()
+        if remaining is not None and seconds >= remaining:
+            raise DeadlineExceeded(f"Deadline of {self.seconds:g}s exceeded")
+        time.sleep(seconds)
+
+    def record_missed(self, count=1):
+        with self._lock:
+            self.missed += count
+
+
+_default_deadline = Deadline()
+
+
+def set_deadline(seconds):
+    """
+    Start the deadline of the run: seconds from now, or none for None.
+    """
+    global _default_deadline
+    _default_deadline = Deadline(seconds)
+    return _default_deadline
+
+
+def get_deadline():
+    """
+    Return the deadline shared by every part of the run.
+    """
+    return _default_deadline
@@ -1,28 +1,44 @@
-import os
+from dependency_release_tracker.config import DISCOVERY_MAX_DEPTH
 from .dependency_manager_types import DependencyManager
+from .project_discovery import ProjectDiscovery
 
 
 class DependencyManagerDetector:
-    def __init__(self, path):
+    def __init__(
+        self, path, ignore=None, max_depth=DISCOVERY_MAX_DEPTH, manifests=None
+    ):
         self.path = path
+        self.discovery = ProjectDiscovery(
+            path, ignore=ignore, max_depth=max_depth, manifests=manifests
+        )
+        self._projects = None
+
+    @property
+    def projects(self):
+        """Every project below the path, discovered once in a single pass."""
+        if self._projects is None:
+            self._projects = self.discovery.discover()
+        return self._projects
 
     def detect(self):
-        """Detects the dependency manager by checking for specific files or directories."""
-        # Checking for Swift Package Manager
-        for root, dirs, files in os.walk(self.path):
-            if any(dir.endswith(".xcworkspace") for dir in dirs):
-                xcworkspace_path = os.path.join(
-                    root, [dir for dir in dirs if dir.endswith(".xcworkspace")][0]
-                )
-                if os.path.exists(
-                    os.path.join(
-                        xcworkspace_path, "xcshareddata", "swiftpm", "Package.resolved"
-                    )
-                ):
-                    return DependencyManager.SWIFT
+        """Detects the dependency manager of the first project found below the path."""
+        if self.projects:
+            return self.projects[0].manager
+        return DependencyManager.UNKNOWN
 
-            # Checking for Flutter
-            if "pubspec.yaml" in files:
-                return DependencyManager.FLUTTER
+    def detect_all(self):
+        """
+        Detects every project below the path.
+        Returns a list of DiscoveredProject objects in discovery order.
+        """
+        return list(self.projects)
 
-        return DependencyManager.UNKNOWN
+    def detect_ecosystems(self):
+        """
+        Detects the first project of every ecosystem below the path, so a repository
+        holding e.g. a Flutter app and a Swift package gets both checked.
+        """
+        projects = {}
+        for project in self.projects:
+            projects.setdefault(project.ecosystem, project)
+        return list(projects.values())
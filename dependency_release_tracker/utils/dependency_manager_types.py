@@ -6,4 +6,6 @@ from enum import Enum, auto
 class DependencyManager(Enum):
     SWIFT = auto()
     FLUTTER = auto()
+    # An ecosystem handled by a reader plugin, named by DiscoveredProject.ecosystem
+    PLUGIN = auto()
     UNKNOWN = auto()
@@ -0,0 +1,57 @@
+import os
+import subprocess
+from dependency_release_tracker.config import GIT_MIRROR_DIR, GIT_TIMEOUT
+from dependency_release_tracker.utils.deadline import get_deadline
+from dependency_release_tracker.utils.run_stats import get_run_stats
+
+
+class GitTagClient:
+    """
+    Lists the tags of git repositories that aren't hosted on GitHub, so no API
+    call is spent on hosts that can't answer it. Tags are read with
+    'git ls-remote', from a local mirror under mirror_dir when one exists
+    (e.g. <mirror_dir>/gitlab.com/group/repo.git) and from the remote otherwise.
+    """
+
+    def __init__(self, mirror_dir=GIT_MIRROR_DIR, timeout=GIT_TIMEOUT):
+        self.mirror_dir = mirror_dir
+        self.timeout = timeout
+
+    def mirror_path(self, repository):
+        if not self.mirror_dir:
+            return None
+        for path in (
+            os.path.join(self.mirror_dir, repository.host, f"{repository.path}.git"),
+            os.path.join(self.mirror_dir, repository.host, repository.path),
+        ):
+            if os.path.isdir(path):
+                return path
+        return None
+
+    def tags(self, repository, url):
+        """
+        Return the tag names of a repository. Raises subprocess.CalledProcessError
+        when git fails, subprocess.TimeoutExpired after timeout seconds and OSError
+        when git isn't installed. Past the deadline of the run it raises DeadlineExceeded.
+        """
+        source = self.mirror_path(repository) or url
+        deadline = get_deadline()
+        with get_run_stats().operation("git ls-remote"):
+            try:
+                result = subprocess.run(
+                    ["git", "ls-remote", "--tags", "--refs", source],
+                    capture_output=True,
+                    text=True,
+                    timeout=deadline.budget(self.timeout),
+                    check=True,
+                    # Fail instead of prompting for credentials of private repositories
+                    env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+                )
+            except subprocess.TimeoutExpired:
+                deadline.check()
+                raise
+        return [
+            line.split("refs/tags/", 1)[1]
+            for line in result.stdout.splitlines()
+            if "refs/tags/" in line
+        ]
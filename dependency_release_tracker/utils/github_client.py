@@ -0,0 +1,172 @@
+import threading
+import time
+from dependency_release_tracker.utils.deadline import get_deadline
+from dependency_release_tracker.utils.http_client import get_http_client
+from dependency_release_tracker.utils.run_stats import get_run_stats
+from dependency_release_tracker.config import (
+    GITHUB_TOKEN,
+    GITHUB_API_URL,
+    GITHUB_MAX_RETRIES,
+    GITHUB_MAX_RATE_LIMIT_WAIT,
+)
+
+
+class GitHubClient:
+    """
+    Thin wrapper around the GitHub REST and GraphQL APIs that can be shared between worker threads.
+    It tracks the X-RateLimit-* headers of every response, paces requests when the
+    remaining quota runs low and backs off and retries on 403/429 rate limit responses.
+    """
+
+    API_URL = GITHUB_API_URL
+
+    def __init__(
+        self,
+        token=GITHUB_TOKEN,
+        max_retries=GITHUB_MAX_RETRIES,
+        max_wait=GITHUB_MAX_RATE_LIMIT_WAIT,
+        http_client=None,
+    ):
+        self.http_client = http_client or get_http_client()
+        self.headers = {"Accept": "application/vnd.github.v3+json"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        # Notified whenever a response arrives, for workers waiting to learn the new quota
+        self._responded = threading.Condition(self._lock)
+        self._remaining = None
+        self._reset_at = None
+        # Whether a request is out to learn the quota of a new rate limit window
+        self._probing = False
+        # Requests sent, or about to be, whose response hasn't arrived yet
+        self._in_flight = 0
+
+    def get(self, path, headers=None):
+        """
+        GET an API path such as '/repos/{owner}/{repo}/releases/latest'.
+        Extra headers, such as conditional request validators, are sent along.
+        Returns the final response after any rate limit retries.
+        """
+        return self._request("get", path, headers=headers)
+
+    def graphql(self, query):
+        """
+        POST a query to the GraphQL API. Returns the final response after any rate limit retries.
+        """
+        return self._request("post", "/graphql", json={"query": query})
+
+    def _request(self, method, path, headers=None, **kwargs):
+        url = f"{self.API_URL}{path}"
+        headers = {**self.headers, **(headers or {})}
+        attempt = 0
+        while True:
+            self._wait_for_quota()
+            try:
+                response = self.http_client.request(
+                    method, url, headers=headers, **kwargs
+                )
+            except BaseException:
+                self._update_rate_limit(None)
+                raise
+            self._update_rate_limit(response)
+
+            if response.status_code not in (403, 429) or attempt >= self.max_retries:
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            if delay is None or delay > self.max_wait:
+                return response
+            get_run_stats().count("github.rate_limit_retries")
+            get_deadline().sleep(delay)
+            attempt += 1
+
+    def _wait_for_quota(self):
+        """
+        Block until a request may be sent. Once the quota is exhausted, wait for the
+        reset; when it is running low, spread the remaining requests over the window.
+        After a reset, one request goes out to learn the new quota while the others
+        wait for its response, so they don't all hit the new window at once.
+        """
+        deadline = get_deadline()
+        while True:
+            reset_wait = delay = 0
+            with self._lock:
+                if self._remaining is not None and self._reset_at is not None:
+                    window = self._reset_at - time.time()
+                    if window <= 0:
+                        if self._probing:
+                            self._responded.wait(deadline.remaining())
+                            deadline.check()
+                            continue
+                        self._probing = True
+                    elif self._remaining <= 0:
+                        # Past max_wait, the request is sent and fails with the
+                        # rate limit response instead
+                        reset_wait = window if window <= self.max_wait else 0
+                    elif self._remaining < 10:
+                        delay = min(window / self._remaining, self.max_wait)
+                    if not reset_wait:
+                        # Count the request we are about to send so concurrent
+                        # workers don't overshoot
+                        self._remaining -= 1
+                if not reset_wait:
+                    self._in_flight += 1
+            if reset_wait:
+                deadline.sleep(reset_wait)
+                continue
+            if delay:
+                try:
+                    deadline.sleep(delay)
+                except BaseException:
+                    # The request is given up before it is sent
+                    self._update_rate_limit(None)
+                    raise
+            return
+
+    def _update_rate_limit(self, response):
+        """
+        Track the quota reported by a response, or None for a request that failed.
+        Requests still in flight aren't in the reported quota yet, so they are
+        taken off it; responses from an earlier window are ignored.
+        """
+        headers = response.headers if response is not None else {}
+        with self._lock:
+            self._in_flight -= 1
+            try:
+                remaining = int(headers["X-RateLimit-Remaining"])
+                reset_at = float(headers["X-RateLimit-Reset"])
+            except (KeyError, ValueError):
+                if self._probing:
+                    # The quota of the new window is still unknown, so stop pacing
+                    self._remaining = None
+            else:
+                if self._reset_at is None or reset_at >= self._reset_at:
+                    self._remaining = remaining - self._in_flight
+                    self._reset_at = reset_at
+            self._probing = False
+            self._responded.notify_all()
+
+    def _retry_delay(self, response, attempt):
+        """
+        Work out how long to wait before retrying a 403/429 response.
+        Returns None when the response is not caused by rate limiting.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0)
+            except ValueError:
+                pass
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = response.headers.get("X-RateLimit-Reset")
+            if reset is not None:
+                try:
+                    return max(float(reset) - time.time(), 0) + 1
+                except ValueError:
+                    pass
+        if response.status_code == 429:
+            return 2**attempt
+        # A 403 without rate limit information is a permission error
+        return None
@@ -0,0 +1,139 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dependency_release_tracker.config import (
+    MAX_WORKERS,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR,
+)
+from dependency_release_tracker.utils.deadline import get_deadline
+from dependency_release_tracker.utils.run_stats import get_run_stats
+
+
+class OfflineError(requests.ConnectionError):
+    """
+    Raised for any request made while the client is offline.
+    """
+
+
+class DeadlineRetry(Retry):
+    """
+    Retry policy that gives up once the backoff before the next attempt would
+    reach the deadline of the run, so retries never outlast it.
+    """
+
+    def is_exhausted(self):
+        remaining = get_deadline().remaining()
+        if remaining is not None and self.get_backoff_time() >= remaining:
+            return True
+        return super().is_exhausted()
+
+
+class HttpClient:
+    """
+    Pooled HTTP client shared by all readers and their worker threads.
+    Connections are kept alive per host, every request gets a connect and read timeout,
+    and connection errors and 5xx responses are retried with jittered exponential backoff.
+    Rate limit responses (403/429) are left to the caller, see GitHubClient.
+    An offline client refuses every request with OfflineError.
+    Timeouts are cut to the time left before the deadline of the run, retries stop
+    once they would run past it, and once it has passed requests and streamed bodies
+    fail with DeadlineExceeded.
+    """
+
+    def __init__(
+        self,
+        connect_timeout=HTTP_CONNECT_TIMEOUT,
+        read_timeout=HTTP_READ_TIMEOUT,
+        max_retries=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        pool_size=MAX_WORKERS,
+        offline=False,
+    ):
+        self.offline = offline
+        self.timeout = (connect_timeout, read_timeout)
+        retry = DeadlineRetry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD", "POST"]),
+            raise_on_status=False,
+            # Rate limit waits are bounded by GitHubClient, not slept on here
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=max(1, pool_size), max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method, url, **kwargs):
+        if self.offline:
+            raise OfflineError(f"{url} is not available offline")
+        deadline = get_deadline()
+        kwargs["timeout"] = deadline.budget(kwargs.get("timeout", self.timeout))
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException:
+            # A timeout cut short by the deadline isn't a failure of the registry
+            deadline.check()
+            raise
+        stats = get_run_stats()
+        if stats.enabled:
+            retries = getattr(response.raw, "retries", None)
+            stats.record_request(
+                url,
+                size=0 if kwargs.get("stream") else len(response.content),
+                retries=len(retries.history) if retries else 0,
+            )
+        return response
+
+    def iter_content(self, response, chunk_size):
+        """
+        Iterate over the body of a streamed response, counting the bytes received.
+        """
+        stats = get_run_stats()
+        deadline = get_deadline()
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                deadline.check()
+                stats.record_bytes(response.url, len(chunk))
+                yield chunk
+        except requests.RequestException:
+            deadline.check()
+            raise
+
+    def get(self, url, **kwargs):
+        return self.request("get", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("post", url, **kwargs)
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def configure_http_client(**settings):
+    """
+    Replace the shared client with one built from the given settings,
+    e.g. the timeouts and retries passed on the command line.
+    """
+    global _default_client
+    with _default_client_lock:
+        _default_client = HttpClient(**settings)
+    return _default_client
+
+
+def get_http_client():
+    """
+    Return the client shared by all readers.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+    return _default_client
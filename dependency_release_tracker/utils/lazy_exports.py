@@ -0,0 +1,19 @@
+import importlib
+import sys
+
+
+def lazy_exports(package, exports):
+    """
+    Return a module __getattr__ for package that imports each name of exports,
+    {name: relative submodule}, from its submodule on first access, so importing
+    one module of the package doesn't load the others and their dependencies.
+    """
+
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
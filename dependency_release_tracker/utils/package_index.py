@@ -0,0 +1,30 @@
+import os
+from .cache_store import CacheStore
+
+
+class PackageIndex(CacheStore):
+    """
+    Snapshot of latest-version metadata and parsed release notes for offline runs.
+    It uses the namespaces and keys of the cache store in a single SQLite file that
+    can be copied between machines; lookups go through the (namespace, key) primary key.
+    Entries never expire and are never evicted.
+    """
+
+    # A single file without -wal and -shm companions, so it can be copied as is
+    journal_mode = "delete"
+
+    def __init__(self, path):
+        super().__init__(path, max_size=None)
+
+    @classmethod
+    def open(cls, path):
+        """
+        Open an existing index, failing instead of creating an empty one for a mistyped path.
+        """
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Package index '{path}' does not exist.")
+        return cls(path)
+
+    def compact(self):
+        with self._lock:
+            self._connection.execute("VACUUM")
@@ -1,24 +1,27 @@
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    BarColumn,
-    TimeRemainingColumn,
-)
-
-
 class ProgressManager:
-    def __init__(self):
-        self.progress = Progress(
-            SpinnerColumn(),
-            TextColumn("{task.description}"),
-            BarColumn(),
-            TimeRemainingColumn(),
-        )
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.progress = None
+        if enabled:
+            # Imported here so machine-readable runs never load rich.progress
+            from rich.progress import (
+                Progress,
+                SpinnerColumn,
+                TextColumn,
+                BarColumn,
+                TimeRemainingColumn,
+            )
+
+            self.progress = Progress(
+                SpinnerColumn(),
+                TextColumn("{task.description}"),
+                BarColumn(),
+                TimeRemainingColumn(),
+            )
         self.active = False
 
     def start_task(self, description, total):
-        if not self.active:
+        if self.enabled and not self.active:
             self.task = self.progress.add_task(description, total=total)
             self.progress.start()
             self.active = True
@@ -0,0 +1,123 @@
+import os
+from fnmatch import fnmatch
+from dependency_release_tracker.config import DISCOVERY_IGNORES, DISCOVERY_MAX_DEPTH
+from .dependency_manager_types import DependencyManager
+
+# Directories that never contain project manifests but can hold huge trees
+DEFAULT_PRUNED_DIRS = frozenset(
+    {
+        ".git",
+        "Pods",
+        "build",
+        "DerivedData",
+        ".dart_tool",
+        "node_modules",
+        ".build",
+    }
+)
+
+
+class DiscoveredProject:
+    """
+    A project found on disk: its dependency manager, its directory and the manifest
+    a reader should load (Package.resolved for Swift, pubspec.yaml for Flutter).
+    The ecosystem names the reader that handles it, e.g. 'swift' or a plugin's name.
+    """
+
+    def __init__(self, manager, path, manifest_path, lock_path=None, ecosystem=None):
+        self.manager = manager
+        self.path = path
+        self.manifest_path = manifest_path
+        self.lock_path = lock_path
+        self.ecosystem = ecosystem or manager.name.lower()
+
+    def __repr__(self):
+        return f"DiscoveredProject({self.ecosystem}, {self.path!r})"
+
+
+class ProjectDiscovery:
+    """
+    Finds every project below a directory in a single os.scandir pass.
+    Directories in DEFAULT_PRUNED_DIRS and those matching the ignore patterns are not entered,
+    and the search stops max_depth levels below the root when a limit is given.
+    Files named in manifests ({file name: ecosystem}) are reported as projects of reader plugins.
+    """
+
+    def __init__(
+        self, path, ignore=None, max_depth=DISCOVERY_MAX_DEPTH, manifests=None
+    ):
+        self.path = path
+        self.ignore = list(DISCOVERY_IGNORES) + list(ignore or [])
+        self.max_depth = max_depth
+        self.manifests = manifests or {}
+
+    def discover(self):
+        """
+        Returns the discovered projects in depth-first order, entries of a directory sorted by name.
+        Within a directory, Swift workspaces are listed before a Flutter pubspec,
+        then plugin manifests by file name.
+        """
+        projects = []
+        stack = [(self.path, 0)]
+        while stack:
+            directory, depth = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    entries = sorted(entries, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            subdirectories = []
+            pubspec_path = lock_path = None
+            plugin_projects = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name.endswith(".xcworkspace"):
+                        resolved_path = os.path.join(
+                            entry.path, "xcshareddata", "swiftpm", "Package.resolved"
+                        )
+                        if os.path.isfile(resolved_path):
+                            projects.append(
+                                DiscoveredProject(
+                                    DependencyManager.SWIFT, directory, resolved_path
+                                )
+                            )
+                    elif not self.is_pruned(entry):
+                        subdirectories.append(entry.path)
+                elif entry.name == "pubspec.yaml":
+                    pubspec_path = entry.path
+                elif entry.name == "pubspec.lock":
+                    lock_path = entry.path
+                elif entry.name in self.manifests:
+                    plugin_projects.append(
+                        DiscoveredProject(
+                            DependencyManager.PLUGIN,
+                            directory,
+                            entry.path,
+                            ecosystem=self.manifests[entry.name],
+                        )
+                    )
+
+            if pubspec_path:
+                projects.append(
+                    DiscoveredProject(
+                        DependencyManager.FLUTTER, directory, pubspec_path, lock_path
+                    )
+                )
+            projects.extend(plugin_projects)
+
+            if self.max_depth is None or depth < self.max_depth:
+                stack.extend(
+                    (subdirectory, depth + 1)
+                    for subdirectory in reversed(subdirectories)
+                )
+        return projects
+
+    def is_pruned(self, entry):
+        if entry.name in DEFAULT_PRUNED_DIRS:
+            return True
+        relative_path = os.path.relpath(entry.path, self.path)
+        return any(
+            fnmatch(entry.name, pattern) or fnmatch(relative_path, pattern)
+            for pattern in self.ignore
+        )
@@ -0,0 +1,62 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+# [scheme://][user@]host[:port]/path or the SCP-like form user@host:path, with an optional .git suffix
+REPOSITORY_URL_PATTERN = re.compile(
+    r"^(?:(?P<scheme>[A-Za-z][A-Za-z0-9+.-]*)://)?(?:[^@/]+@)?"
+    r"(?P<host>[^/:@]+)(?::(?P<port>\d+)(?=/))?[:/]+"
+    r"(?P<path>.+?)(?:\.git)?/*$"
+)
+
+GITHUB_HOST = "github.com"
+
+
+class Repository(namedtuple("Repository", ["host", "path", "owner_repo"])):
+    """
+    Identity of a git repository: its lowercased host, its path on the host and the
+    'owner/repo' end of that path as used by the GitHub API, e.g.
+    ('github.com', 'apple/swift-algorithms', 'apple/swift-algorithms').
+    """
+
+    __slots__ = ()
+
+    @property
+    def is_github(self):
+        return self.host == GITHUB_HOST
+
+    @property
+    def web_url(self):
+        return f"https://{self.host}/{self.path}"
+
+    def __str__(self):
+        return f"{self.host}/{self.path}"
+
+
+@lru_cache(maxsize=4096)
+def parse_repository_url(url):
+    """
+    Return the Repository of an HTTPS, SSH, git or SCP-like ('git@host:owner/repo.git')
+    URL, or None for local paths, URLs that can't be parsed and GitHub URLs without
+    both an owner and a repository. Results are memoized, so a repository used by
+    many projects is parsed once per process.
+    """
+    if not url or url.startswith(("/", ".", "file:")):
+        return None
+    match = REPOSITORY_URL_PATTERN.match(url.strip())
+    if not match:
+        return None
+    if match["scheme"] is None and "@" not in url and "." not in match["host"]:
+        # A relative path such as 'Packages/Local' rather than a host
+        return None
+    host = match["host"].lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = match["path"]
+    parts = path.split("/")
+    if host == GITHUB_HOST:
+        # GitHub repositories are always owner/repo; deeper paths point into one
+        if len(parts) < 2:
+            return None
+        return Repository(host, path, "/".join(parts[:2]))
+    return Repository(host, path, "/".join(parts[-2:]))
@@ -0,0 +1,95 @@
+import threading
+from dependency_release_tracker.utils.cache_store import get_cache_store
+from dependency_release_tracker.utils.run_stats import get_run_stats
+
+
+class RevalidationCache:
+    """
+    Keeps the ETag / Last-Modified validators of API responses in the cache store,
+    together with the value extracted from the response body. Requests for a known URL
+    are sent as conditional requests and a 304 Not Modified answer is served from the
+    stored value, which also doesn't count against GitHub's rate limit.
+    """
+
+    def __init__(self, cache_store):
+        self.cache_store = cache_store
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def request_headers(self, url, headers=None):
+        """
+        Return headers for a request to url, with the validators stored for it.
+        """
+        headers = dict(headers or {})
+        entry = self.cache_store.get("validators", url)
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def resolve(self, url, response, extract):
+        """
+        Return the value of a response to a conditional request: the stored value for a
+        304 answer, or extract(response.json()) for a 200 answer, stored with its validators.
+        Returns None for any other status.
+        """
+        if response.status_code == 304:
+            entry = self.cache_store.get("validators", url)
+            if entry is None:
+                return None
+            self._count(hit=True)
+            return entry["value"]
+
+        if response.status_code != 200:
+            return None
+        self._count(hit=False)
+        value = extract(response.json())
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self.cache_store.set(
+                "validators",
+                url,
+                {"etag": etag, "last_modified": last_modified, "value": value},
+            )
+        return value
+
+    def _count(self, hit):
+        get_run_stats().count(
+            "revalidation.not_modified" if hit else "revalidation.modified"
+        )
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @property
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self):
+        total = self.hits + self.misses
+        return (
+            f"Revalidated lookups: {self.hits}/{total} not modified "
+            f"({self.hit_ratio:.0%} hit ratio)"
+        )
+
+
+_default_revalidation_cache = None
+_default_revalidation_cache_lock = threading.Lock()
+
+
+def get_revalidation_cache():
+    """
+    Return the revalidation cache shared by all readers.
+    """
+    global _default_revalidation_cache
+    with _default_revalidation_cache_lock:
+        if _default_revalidation_cache is None:
+            _default_revalidation_cache = RevalidationCache(get_cache_store())
+    return _default_revalidation_cache
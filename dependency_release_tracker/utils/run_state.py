@@ -0,0 +1,75 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dependency_release_tracker.config import CACHE_DIR
+
+
+class RunState:
+    """
+    Results of the previous runs for one project, kept in a JSON file per project
+    under CACHE_DIR/run_state. For every package it records the pinned version,
+    the lookup result and when it was checked, so the next run only looks up
+    packages whose pin changed or whose result is older than the freshness threshold.
+    """
+
+    def __init__(self, path, entries=None):
+        self.path = path
+        # Entries as loaded, to tell which releases appeared since the last run
+        self.previous = entries or {}
+        self.entries = dict(self.previous)
+
+    @classmethod
+    def load(cls, project_path, variant=None):
+        key = os.path.abspath(project_path)
+        if variant:
+            # Runs in another mode record different notes, so they keep their own state
+            key = f"{key}#{variant}"
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        path = os.path.join(CACHE_DIR, "run_state", f"{digest}.json")
+        try:
+            with open(path, "r") as file:
+                return cls(path, json.load(file).get("packages", {}))
+        except (FileNotFoundError, ValueError):
+            return cls(path)
+
+    def fresh_entry(self, key, current_version, max_age):
+        """
+        Return the recorded result for a package if it was checked for the same
+        pinned version less than max_age seconds ago, otherwise None.
+        """
+        entry = self.previous.get(key)
+        if (
+            entry is None
+            or entry["current_version"] != current_version
+            or time.time() - entry["checked_at"] > max_age
+        ):
+            return None
+        return entry["dependency"]
+
+    def is_new_release(self, key, latest_version):
+        """
+        True if latest_version was not yet available in the last run.
+        """
+        entry = self.previous.get(key)
+        return entry is None or entry["dependency"]["latest_version"] != latest_version
+
+    def record(self, key, dependency, checked_at=None):
+        self.entries[key] = {
+            "current_version": dependency.current_version,
+            "checked_at": checked_at or time.time(),
+            "dependency": dependency.to_dict(),
+        }
+
+    def save(self):
+        """
+        Write the state atomically, so concurrent runs never read a partial file.
+        """
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, suffix=".tmp", delete=False
+        ) as file:
+            json.dump({"packages": self.entries}, file)
+        os.replace(file.name, self.path)
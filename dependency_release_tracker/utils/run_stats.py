@@ -0,0 +1,197 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+class RunStats:
+    """
+    Timings and counters of one run: wall time per phase and per package, time spent
+    in named operations across all threads, requests, bytes and retries per host,
+    and cache hits and misses. Nothing is recorded until the stats are enabled,
+    so the hooks cost a flag check in normal runs.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.started_at = time.perf_counter()
+        self.phases = {}
+        self.packages = {}
+        self.operations = {}
+        self.hosts = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+        self.started_at = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time a phase of the run, such as reading manifests or displaying results.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(self.phases, name, time.perf_counter() - start)
+
+    @contextmanager
+    def operation(self, name):
+        """
+        Time an operation that runs on many threads, e.g. changelog downloads.
+        Calls and their durations are summed up.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                calls, seconds = self.operations.get(name, (0, 0.0))
+                self.operations[name] = (calls + 1, seconds + elapsed)
+
+    def package_time(self, name, seconds):
+        if self.enabled:
+            self._add(self.packages, name, seconds)
+
+    def count(self, name, amount=1):
+        if self.enabled:
+            self._add(self.counters, name, amount)
+
+    def record_request(self, url, size=0, retries=0):
+        """
+        Count a request to the host of url, with the bytes received and urllib3 retries.
+        """
+        if self.enabled:
+            self._add_host(url, requests=1, bytes=size, retries=retries)
+
+    def record_bytes(self, url, size):
+        """
+        Count bytes of a streamed body, received after its request was recorded.
+        """
+        if self.enabled:
+            self._add_host(url, bytes=size)
+
+    def _add(self, values, name, amount):
+        with self._lock:
+            values[name] = values.get(name, 0) + amount
+
+    def _add_host(self, url, **amounts):
+        host = urlsplit(url).netloc
+        with self._lock:
+            counts = self.hosts.setdefault(
+                host, {"requests": 0, "bytes": 0, "retries": 0}
+            )
+            for name, amount in amounts.items():
+                counts[name] += amount
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "total_seconds": round(time.perf_counter() - self.started_at, 4),
+                "peak_rss_kb": peak_rss_kb(),
+                "phases": {name: round(s, 4) for name, s in self.phases.items()},
+                "operations": {
+                    name: {"calls": calls, "seconds": round(seconds, 4)}
+                    for name, (calls, seconds) in self.operations.items()
+                },
+                "packages": {
+                    name: round(seconds, 4)
+                    for name, seconds in sorted(
+                        self.packages.items(), key=lambda item: -item[1]
+                    )
+                },
+                "hosts": {host: dict(counts) for host, counts in self.hosts.items()},
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+    def summary_tables(self, slowest=10):
+        """
+        Rich tables of the stats: timings, the slowest packages and network and cache counters.
+        """
+        from rich.table import Table
+
+        stats = self.to_dict()
+        timings = Table(title="Timings", title_justify="left")
+        timings.add_column("Phase / operation")
+        timings.add_column("Calls", justify="right")
+        timings.add_column("Seconds", justify="right")
+        for name, seconds in stats["phases"].items():
+            timings.add_row(name, "", f"{seconds:.3f}")
+        for name, operation in stats["operations"].items():
+            timings.add_row(
+                name, str(operation["calls"]), f"{operation['seconds']:.3f}"
+            )
+        timings.add_row("total", "", f"{stats['total_seconds']:.3f}", style="bold")
+        if stats["peak_rss_kb"] is not None:
+            timings.caption = f"Peak RSS: {stats['peak_rss_kb'] / 1024:.1f} MiB"
+
+        packages = Table(title=f"Slowest {slowest} packages", title_justify="left")
+        packages.add_column("Package")
+        packages.add_column("Seconds", justify="right")
+        for name, seconds in list(stats["packages"].items())[:slowest]:
+            packages.add_row(name, f"{seconds:.3f}")
+
+        network = Table(title="Requests", title_justify="left")
+        network.add_column("Host")
+        network.add_column("Requests", justify="right")
+        network.add_column("Bytes", justify="right")
+        network.add_column("Retries", justify="right")
+        for host, counts in stats["hosts"].items():
+            network.add_row(
+                host,
+                str(counts["requests"]),
+                str(counts["bytes"]),
+                str(counts["retries"]),
+            )
+
+        counters = Table(title="Counters", title_justify="left")
+        counters.add_column("Counter")
+        counters.add_column("Value", justify="right")
+        for name, value in stats["counters"].items():
+            counters.add_row(name, str(value))
+        return [timings, packages, network, counters]
+
+
+def peak_rss_kb():
+    """
+    Peak resident set size of the process in KiB, or None where it isn't available.
+    On Linux it is read from /proc, as ru_maxrss also covers the memory the parent
+    process had when it started this one.
+    """
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+_default_run_stats = RunStats()
+
+
+def get_run_stats():
+    """
+    Return the stats shared by every part of the run.
+    """
+    return _default_run_stats
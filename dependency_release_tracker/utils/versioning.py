@@ -0,0 +1,105 @@
+import re
+from functools import lru_cache
+
+# Leading constraint operators and tag prefixes, then MAJOR[.MINOR[.PATCH[.MORE...]]][-PRE][+BUILD],
+# which must end the version or be followed by the next part of a constraint ('>=1.2.0 <2.0.0')
+VERSION_PATTERN = re.compile(
+    r"[\s^~<>=vV]*(\d+(?:\.\d+)*)"
+    r"(?:-([0-9A-Za-z.-]+))?(?:\+([0-9A-Za-z.-]+))?(?=[\s,]|$)"
+)
+
+UPDATE_TYPES = ("major", "minor", "patch")
+
+
+def _identifiers_key(identifiers):
+    # Numeric identifiers compare numerically and sort before alphanumeric ones
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in identifiers.split(".")
+    )
+
+
+@lru_cache(maxsize=4096)
+def version_key(version):
+    """
+    Return a tuple ordering versions by semantic version precedence, or None when the
+    version can't be parsed. Pre-releases sort before their release and build metadata
+    only breaks ties, as pub does. Constraint operators ('^1.2.0') and tag prefixes
+    ('v1.2.0') are ignored. Components after the patch number ('1.2.3.4') are kept, with
+    trailing zeros dropped so '1.2.3.0' ties with '1.2.3'.
+    """
+    match = VERSION_PATTERN.match(version or "")
+    if not match:
+        return None
+    release, pre, build = match.groups()
+    numbers = [int(part) for part in release.split(".")] + [0, 0]
+    extra = tuple(numbers[3:-2])
+    while extra and extra[-1] == 0:
+        extra = extra[:-1]
+    return (
+        numbers[0],
+        numbers[1],
+        numbers[2],
+        extra,
+        (0,) + _identifiers_key(pre) if pre else (1,),
+        _identifiers_key(build) if build else (),
+    )
+
+
+def is_prerelease(key):
+    """
+    Whether a version_key belongs to a pre-release such as '2.0.0-beta.1'.
+    """
+    return key[4] != (1,)
+
+
+@lru_cache(maxsize=4096)
+def clean_version(version):
+    """
+    Return the version without constraint operators or tag prefix, e.g. 'v1.2.0' -> '1.2.0'.
+    Versions that can't be parsed, e.g. '1.2.3foo', are returned unchanged.
+    """
+    match = VERSION_PATTERN.match(version or "")
+    if not match:
+        return version
+    return version[match.start(1) : match.end()]
+
+
+def is_newer(version, other):
+    """
+    Whether version comes after other. Versions that can't be parsed are only
+    compared for equality.
+    """
+    key, other_key = version_key(version), version_key(other)
+    if key is None or other_key is None:
+        return version != other
+    return key > other_key
+
+
+def update_type(current_version, latest_version):
+    """
+    Classify the update from current_version to latest_version as 'major', 'minor'
+    or 'patch' (which includes pre-release and build changes), or None when there is no update.
+    """
+    return classify_update(
+        version_key(current_version),
+        version_key(latest_version),
+        current_version,
+        latest_version,
+    )
+
+
+def classify_update(current_key, latest_key, current_version, latest_version):
+    """
+    update_type for versions whose keys are already parsed. Versions that can't be
+    parsed (a key of None) are a 'major' update whenever they differ.
+    """
+    if current_key is None or latest_key is None:
+        return "major" if latest_version != current_version else None
+    if latest_key <= current_key:
+        return None
+    if latest_key[0] != current_key[0]:
+        return "major"
+    if latest_key[1] != current_key[1]:
+        return "minor"
+    return "patch"
@@ -0,0 +1,77 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+
+class WorkerPool:
+    """
+    Minimal executor running submitted calls in FIFO order on daemon threads.
+    Unlike ThreadPoolExecutor, whose workers are joined when the interpreter exits,
+    a worker still blocked on a lookup abandoned at the deadline of the run doesn't
+    keep the process alive. Futures work with concurrent.futures.wait.
+    """
+
+    def __init__(self, max_workers, name="worker"):
+        self.max_workers = max(1, max_workers)
+        self.name = name
+        self._queue = queue.SimpleQueue()
+        self._threads = []
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+
+    def submit(self, function, *args):
+        future = Future()
+        self._queue.put((future, function, args))
+        self._adjust_workers()
+        return future
+
+    def _adjust_workers(self):
+        # Start another worker only when none is waiting for work
+        if self._idle.acquire(blocking=False):
+            return
+        with self._lock:
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self.name}_{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, function, args = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = function(*args)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            del item, future
+            self._idle.release()
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """
+        Stop the workers once the queued calls have run, or cancel the queued calls
+        with cancel_futures. Without wait, calls still running are left to finish on their own.
+        """
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        with self._lock:
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
@@ -4,17 +4,20 @@ from dependency_release_tracker.version import __version__
 setup(
     name="dependency_release_tracker",
     version=__version__,
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*", "tests", "tests.*"]),
     install_requires=[
         "requests",
+        "urllib3>=2",
         "rich",
         "argparse",
-        "requests_cache",
-        "pytz",
         "PyYAML",
     ],
     entry_points={
-        "console_scripts": ["dependency-tracker=dependency_release_tracker.main:main"]
+        "console_scripts": ["dependency-tracker=dependency_release_tracker.main:main"],
+        "dependency_release_tracker.readers": [
+            "swift=dependency_release_tracker.dependency_readers.swift_reader:SwiftDependencyReader",
+            "flutter=dependency_release_tracker.dependency_readers.flutter_reader:FlutterDependencyReader",
+        ],
     },
     author="Hugo Vanderlei",
     author_email="hugocvcosta@gmail.com",
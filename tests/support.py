@@ -0,0 +1,65 @@
+import io
+import os
+import tempfile
+from unittest import mock
+from benchmarks.mock_registry import MockRegistry
+from dependency_release_tracker.dependency_readers import flutter_reader, swift_reader
+from dependency_release_tracker.display.machine_output import JsonDisplay
+from dependency_release_tracker.utils import (
+    cache_store,
+    deadline,
+    http_client,
+    revalidation,
+    run_state,
+    run_stats,
+)
+from dependency_release_tracker.utils.cache_store import CacheStore
+from dependency_release_tracker.utils.github_client import GitHubClient
+
+
+def isolate(testcase):
+    """
+    Give a test its own cache store, run state directory, HTTP client, run stats
+    and deadline, undone when the test ends. Returns the temporary directory.
+    """
+    directory = tempfile.TemporaryDirectory()
+    testcase.addCleanup(directory.cleanup)
+    store = CacheStore(os.path.join(directory.name, "cache.sqlite"))
+    testcase.addCleanup(store._connection.close)
+    for target, name, value in (
+        (cache_store, "_default_store", store),
+        (revalidation, "_default_revalidation_cache", None),
+        (run_state, "CACHE_DIR", directory.name),
+        (http_client, "_default_client", None),
+        (run_stats, "_default_run_stats", run_stats.RunStats()),
+        (deadline, "_default_deadline", deadline.Deadline()),
+    ):
+        patcher = mock.patch.object(target, name, value)
+        patcher.start()
+        testcase.addCleanup(patcher.stop)
+    return directory.name
+
+
+def start_registry(testcase, **settings):
+    """
+    Start a MockRegistry for a test and point the readers at it.
+    """
+    registry = MockRegistry(**settings).start()
+    testcase.addCleanup(registry.stop)
+    for target, name, value in (
+        (flutter_reader, "PUB_DEV_URL", registry.url),
+        (GitHubClient, "API_URL", registry.url),
+        # Keeps the Swift reader from warning about a missing token
+        (swift_reader, "GITHUB_TOKEN", "test"),
+    ):
+        patcher = mock.patch.object(target, name, value)
+        patcher.start()
+        testcase.addCleanup(patcher.stop)
+    return registry
+
+
+def reader_options(**options):
+    """
+    Reader options for tests: no progress bars and output kept in memory.
+    """
+    return {"dependency_display": JsonDisplay(output=io.StringIO()), **options}
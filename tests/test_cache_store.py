@@ -0,0 +1,161 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from dependency_release_tracker.utils import cache_store
+from dependency_release_tracker.utils.cache_store import (
+    ACCESS_RESOLUTION,
+    CacheStore,
+    FileCacheStore,
+)
+
+# Serialized as 102 bytes
+VALUE = "x" * 100
+
+
+class Clock:
+    """
+    Stand-in for the time module that only moves when told to.
+    """
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class StoreTestCase(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.clock = Clock()
+        patcher = mock.patch.object(cache_store, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def keys(self, store, namespace="notes"):
+        return [key for key in "abcd" if store.get(namespace, key) is not None]
+
+
+class CacheStoreTest(StoreTestCase):
+    def open_store(self, max_size=None):
+        store = CacheStore(os.path.join(self.directory, "cache.sqlite"), max_size)
+        self.addCleanup(store._connection.close)
+        return store
+
+    def assertTotalMatches(self, store):
+        (total,) = store._connection.execute("SELECT size FROM totals").fetchone()
+        (size,) = store._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        self.assertEqual(total, size)
+        return total
+
+    def test_evicts_the_least_recently_used_entries(self):
+        store = self.open_store(max_size=3 * 102)
+        for key in "abc":
+            store.set("notes", key, VALUE)
+            self.clock.advance(1)
+        # Reading a after the access resolution marks it as used
+        self.clock.advance(ACCESS_RESOLUTION + 1)
+        self.assertEqual(store.get("notes", "a"), VALUE)
+
+        store.set("notes", "d", VALUE)
+
+        self.assertEqual(self.keys(store), ["a", "c", "d"])
+        self.assertEqual(self.assertTotalMatches(store), 3 * 102)
+
+    def test_total_size_follows_inserts_updates_and_deletes(self):
+        store = self.open_store()
+        store.set("notes", "a", VALUE)
+        store.set("latest", "a", "1.0.0")
+        self.assertEqual(self.assertTotalMatches(store), 102 + 7)
+
+        store.set("notes", "a", VALUE * 2)
+        self.assertEqual(self.assertTotalMatches(store), 202 + 7)
+
+        self.clock.advance(10)
+        store.set("notes", "b", VALUE)
+        self.assertEqual(store.prune(max_unused=5), (2, 202 + 7))
+        self.assertEqual(self.assertTotalMatches(store), 102)
+
+        # Reopening keeps the stored total rather than starting over
+        self.assertEqual(self.assertTotalMatches(self.open_store()), 102)
+
+    def test_prune_removes_unused_entries_then_the_oldest_beyond_max_size(self):
+        store = self.open_store()
+        for key in "abcd":
+            store.set("notes", key, VALUE)
+            self.clock.advance(100)
+
+        self.assertEqual(store.prune(max_unused=250), (2, 2 * 102))
+        self.assertEqual(self.keys(store), ["c", "d"])
+
+        store.max_size = 102
+        self.assertEqual(store.prune(max_unused=1000), (1, 102))
+        self.assertEqual(self.keys(store), ["d"])
+        self.assertTotalMatches(store)
+
+    def test_max_age(self):
+        store = self.open_store()
+        store.set("latest", "a", "1.0.0")
+        self.clock.advance(60)
+
+        self.assertEqual(store.get("latest", "a", max_age=120), "1.0.0")
+        self.assertIsNone(store.get("latest", "a", max_age=30))
+
+
+class FileCacheStoreTest(StoreTestCase):
+    def open_store(self, max_size=None):
+        return FileCacheStore(os.path.join(self.directory, "entries"), max_size)
+
+    def write(self, store, keys):
+        """
+        Write an entry per key, each last used 100 seconds after the one before.
+        Returns the size of an entry.
+        """
+        for index, key in enumerate(keys):
+            store.set("notes", key, VALUE)
+            used = self.clock.now - 100 * (len(keys) - index)
+            os.utime(store.entry_path("notes", key), (used, used))
+        return os.path.getsize(store.entry_path("notes", keys[0]))
+
+    def test_prune_removes_unused_entries_then_the_oldest_beyond_max_size(self):
+        store = self.open_store()
+        size = self.write(store, "abcd")
+
+        self.assertEqual(store.prune(max_unused=250), (2, 2 * size))
+        self.assertEqual(self.keys(store), ["c", "d"])
+
+        store.max_size = size
+        self.assertEqual(store.prune(max_unused=1000), (1, size))
+        self.assertEqual(self.keys(store), ["d"])
+        self.assertEqual(store.stats(), {"notes": {"entries": 1, "bytes": size}})
+
+    def test_reading_marks_an_entry_as_used(self):
+        store = self.open_store()
+        self.write(store, "ab")
+        self.clock.advance(ACCESS_RESOLUTION)
+
+        # Touches the file at the real time, long after the clock's
+        self.assertEqual(store.get("notes", "a"), VALUE)
+
+        self.assertEqual(store.prune(max_unused=ACCESS_RESOLUTION), (1, mock.ANY))
+        self.assertEqual(self.keys(store), ["a"])
+
+    def test_max_age(self):
+        store = self.open_store()
+        store.set("latest", "a", "1.0.0")
+        self.clock.advance(60)
+
+        self.assertEqual(store.get("latest", "a", max_age=120), "1.0.0")
+        self.assertIsNone(store.get("latest", "a", max_age=30))
+
+
+if __name__ == "__main__":
+    unittest.main()
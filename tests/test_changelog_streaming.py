@@ -0,0 +1,116 @@
+import tarfile
+import tempfile
+import tracemalloc
+import unittest
+from urllib.parse import urlsplit
+import requests
+from benchmarks.mock_registry import VERSIONS, changelog
+from dependency_release_tracker.dependency_readers.flutter_reader import (
+    FlutterDependencyReader,
+)
+from dependency_release_tracker.utils.run_stats import get_run_stats
+from tests.support import isolate, reader_options, start_registry
+
+# Incompressible assets of the large archives, stored next to the changelog
+PAYLOAD_SIZE = 8 * 1024 * 1024
+# Most memory a changelog lookup may take, whatever the size of the archive
+PEAK_MEMORY_BUDGET = 1024 * 1024
+
+
+def download_and_scan(archive_url):
+    """
+    The lookup as it was before streaming: download the whole archive to a
+    temporary file, then list every member to find the changelog.
+    Returns the changelog and the bytes received.
+    """
+    with tempfile.NamedTemporaryFile() as file:
+        response = requests.get(archive_url, stream=True)
+        for chunk in response.iter_content(chunk_size=1024):
+            file.write(chunk)
+        file.flush()
+        received = file.tell()
+        file.seek(0)
+        with tarfile.open(fileobj=file, mode="r:gz") as tar:
+            members = [m for m in tar.getmembers() if "CHANGELOG" in m.name.upper()]
+            return tar.extractfile(members[0]).read().decode("utf-8"), received
+
+
+def traced(lookup):
+    """
+    Run a lookup while tracing allocations. Returns its result and the peak
+    memory it allocated.
+    """
+    tracemalloc.start()
+    try:
+        result = lookup()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+class ChangelogStreamingTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = isolate(self)
+        get_run_stats().enable()
+
+    def start_registry(self, changelog_first):
+        """
+        Serve large archives. Returns the registry and the latest archive's URL.
+        """
+        registry = start_registry(
+            self, payload_size=PAYLOAD_SIZE, changelog_first=changelog_first
+        )
+        # Build the archive up front, so the registry's copy isn't traced
+        registry.archive(VERSIONS[-1])
+        archive_url = f"{registry.url}/packages/package/versions/{VERSIONS[-1]}.tar.gz"
+        return registry, archive_url
+
+    def read_changelog(self, changelog_first):
+        """
+        Read the changelog of a large archive. Returns the changelog, the archive
+        size, the bytes received and the peak memory allocated by the lookup.
+        """
+        registry, archive_url = self.start_registry(changelog_first)
+        reader = FlutterDependencyReader(self.directory, **reader_options())
+
+        content, peak = traced(lambda: reader.read_changelog_from_archive(archive_url))
+        received = get_run_stats().hosts[urlsplit(registry.url).netloc]["bytes"]
+        return content, len(registry.archive(VERSIONS[-1])), received, peak
+
+    def test_stops_downloading_once_the_changelog_is_read(self):
+        content, archive_size, received, peak = self.read_changelog(
+            changelog_first=True
+        )
+
+        self.assertEqual(content, changelog("package"))
+        self.assertLess(received, archive_size / 16)
+        self.assertLess(peak, PEAK_MEMORY_BUDGET)
+
+    def test_changelog_at_the_end_is_read_in_bounded_memory(self):
+        content, archive_size, received, peak = self.read_changelog(
+            changelog_first=False
+        )
+
+        self.assertEqual(content, changelog("package"))
+        self.assertEqual(received, archive_size)
+        self.assertLess(peak, PEAK_MEMORY_BUDGET)
+
+    def test_reads_less_than_a_full_download(self):
+        registry, archive_url = self.start_registry(changelog_first=True)
+        reader = FlutterDependencyReader(self.directory, **reader_options())
+
+        content, peak = traced(lambda: reader.read_changelog_from_archive(archive_url))
+        (old_content, old_received), old_peak = traced(
+            lambda: download_and_scan(archive_url)
+        )
+
+        received = get_run_stats().hosts[urlsplit(registry.url).netloc]["bytes"]
+        self.assertEqual(content, old_content)
+        self.assertEqual(old_received, len(registry.archive(VERSIONS[-1])))
+        self.assertLess(received, old_received / 16)
+        self.assertLess(peak, old_peak)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from benchmarks.fixtures import package_names
+from benchmarks.mock_registry import VERSIONS
+from dependency_release_tracker.dependency_readers.swift_reader import (
+    SwiftDependencyReader,
+)
+from dependency_release_tracker.models.dependency import Dependency
+from dependency_release_tracker.utils.github_client import GitHubClient
+from tests.support import isolate, reader_options, start_registry
+
+
+def swift_dependencies(count):
+    return [
+        Dependency(
+            name=name,
+            current_version=VERSIONS[0],
+            repo_url=f"https://github.com/bench/{name}.git",
+            ecosystem="swift",
+        )
+        for name in package_names(count)
+    ]
+
+
+class GitHubRateLimitTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = isolate(self)
+
+    def test_paced_lookups_stay_within_the_rate_limit(self):
+        registry = start_registry(self, rate_limit=5, rate_limit_window=0.3)
+        reader = SwiftDependencyReader(
+            self.directory, **reader_options(jobs=8, github_api="rest")
+        )
+
+        dependencies = reader.check_updates(swift_dependencies(30))
+
+        self.assertEqual(len(dependencies), 30)
+        for dependency in dependencies:
+            self.assertEqual(dependency.latest_version, VERSIONS[-1])
+            self.assertNotIn("Error checking updates", dependency.notes)
+        self.assertEqual(registry.counts["latest_release"], 30)
+        # Only the first requests, sent before any quota is known, are rejected
+        self.assertLessEqual(registry.counts.get("rate_limited", 0), 8 - 5)
+
+    def test_rate_limited_request_is_retried_after_retry_after(self):
+        # Another client sharing the quota uses it up, so this one only learns of
+        # the limit from the 429 response
+        registry = start_registry(self, rate_limit=1, rate_limit_window=0.3)
+        path = "/repos/bench/package/releases/latest"
+        self.assertEqual(GitHubClient().get(path).status_code, 200)
+
+        response = GitHubClient().get(path)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["tag_name"], f"v{VERSIONS[-1]}")
+        self.assertEqual(registry.counts["rate_limited"], 1)
+        self.assertEqual(registry.counts["latest_release"], 2)
+
+    def test_gives_up_when_the_wait_is_too_long(self):
+        registry = start_registry(self, rate_limit=1, rate_limit_window=30)
+        path = "/repos/bench/package/releases/latest"
+        GitHubClient().get(path)
+
+        response = GitHubClient(max_wait=1).get(path)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(registry.counts["rate_limited"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE = "dependency_release_tracker.main"
+# Cumulative import time allowed for the CLI entry module, in milliseconds; the
+# lazy imports keep it near 15 ms on a developer machine
+IMPORT_TIME_BUDGET = float(os.getenv("DEPENDENCY_TRACKER_IMPORT_BUDGET_MS", "50"))
+# Imports deferred until a run actually needs them
+DEFERRED_MODULES = ("rich", "requests", "urllib3", "yaml", "tarfile", "sqlite3")
+RUNS = 10
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_times(module):
+    """
+    Import a module in a new interpreter with -X importtime.
+    Returns {module name: cumulative microseconds} of every module it imported.
+    """
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [ROOT, os.getenv("PYTHONPATH")])),
+    }
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_cli_imports_within_budget(self):
+        # The fastest of a few runs, so a busy machine doesn't fail the budget
+        cumulative = min(import_times(MODULE)[MODULE] for _ in range(RUNS)) / 1000
+
+        self.assertLess(
+            cumulative,
+            IMPORT_TIME_BUDGET,
+            f"import {MODULE} took {cumulative:.1f} ms, "
+            f"the budget is {IMPORT_TIME_BUDGET:.0f} ms",
+        )
+
+    def test_heavy_dependencies_are_imported_lazily(self):
+        imported = import_times(MODULE)
+
+        for module in DEFERRED_MODULES:
+            with self.subTest(module=module):
+                self.assertNotIn(module, imported)
+
+
+if __name__ == "__main__":
+    unittest.main()
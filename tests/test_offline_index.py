@@ -0,0 +1,131 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from benchmarks.fixtures import write_flutter_project, write_swift_project
+from benchmarks.mock_registry import VERSIONS, MockRegistry
+from dependency_release_tracker.utils.package_index import PackageIndex
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Nothing listens here, so a run that goes to the network fails
+CLOSED_URL = "http://127.0.0.1:9"
+
+
+class OfflineIndexTest(unittest.TestCase):
+    """
+    Prefetch a package index for a project with Flutter and Swift dependencies
+    from the mock registry, then check the project offline on another "machine"
+    with an empty cache directory.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.project = os.path.join(self.directory, "project")
+        self.write_project(3)
+        self.index_path = os.path.join(self.directory, "index.sqlite")
+        self.registry = MockRegistry().start()
+        self.addCleanup(self.registry.stop)
+
+    def write_project(self, count):
+        write_flutter_project(self.project, count)
+        write_swift_project(self.project, count)
+
+    def run_tracker(self, registry_url, cache_dir, *args):
+        env = {
+            **os.environ,
+            "PYTHONPATH": ROOT,
+            "DEPENDENCY_TRACKER_PUB_URL": registry_url,
+            "DEPENDENCY_TRACKER_GITHUB_API_URL": registry_url,
+            "DEPENDENCY_TRACKER_CACHE_DIR": os.path.join(self.directory, cache_dir),
+            "GITHUB_TOKEN": "test",
+        }
+        env.pop("DEPENDENCY_TRACKER_CACHE_LOCATION", None)
+        command = [sys.executable, "-m", "dependency_release_tracker.main"]
+        return subprocess.run(
+            command + ["--path", self.project, *args],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+    def prefetch(self):
+        process = self.run_tracker(
+            self.registry.url, "online-cache", "--prefetch", self.index_path
+        )
+        self.assertEqual(process.returncode, 0, process.stderr)
+        return process
+
+    def run_offline(self, registry_url=CLOSED_URL):
+        process = self.run_tracker(
+            registry_url,
+            "offline-cache",
+            "--offline",
+            "--index",
+            self.index_path,
+            "--format",
+            "json",
+        )
+        self.assertNotIn("Traceback", process.stderr)
+        self.assertEqual(process.returncode, 0, process.stderr)
+        return {
+            (record["ecosystem"], record["name"]): record
+            for record in json.loads(process.stdout)["dependencies"]
+        }
+
+    def test_prefetch_writes_the_index(self):
+        process = self.prefetch()
+
+        self.assertIn("Wrote 6 packages", process.stdout)
+        index = PackageIndex.open(self.index_path)
+        self.addCleanup(index._connection.close)
+        stats = index.stats()
+        self.assertEqual(stats["latest"]["entries"], 6)
+        self.assertEqual(stats["notes"]["entries"], 3)
+
+    def test_offline_run_answers_from_the_index(self):
+        self.prefetch()
+        self.registry.reset_counts()
+
+        # Even with the registry reachable, nothing is requested
+        records = self.run_offline(self.registry.url)
+
+        self.assertEqual(self.registry.counts, {})
+        self.assertEqual(len(records), 6)
+        for record in records.values():
+            self.assertEqual(record["status"], "outdated")
+            self.assertEqual(record["latest_version"], VERSIONS[-1])
+            self.assertIn(VERSIONS[-1], record["notes"])
+
+    def test_package_missing_from_the_index_is_reported_as_incomplete(self):
+        self.prefetch()
+        self.write_project(4)
+
+        records = self.run_offline()
+
+        self.assertEqual(len(records), 8)
+        missing = [
+            record for record in records.values() if record["status"] == "incomplete"
+        ]
+        self.assertEqual(
+            sorted(record["ecosystem"] for record in missing), ["flutter", "swift"]
+        )
+        for record in missing:
+            self.assertEqual(record["name"], "bench_package_0003")
+            self.assertIn("package index", record["notes"])
+
+    def test_missing_index_file_is_reported(self):
+        process = self.run_tracker(
+            CLOSED_URL, "offline-cache", "--offline", "--index", self.index_path
+        )
+
+        self.assertEqual(process.returncode, 1)
+        self.assertIn("does not exist", process.stdout + process.stderr)
+        self.assertNotIn("Traceback", process.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from benchmarks.fixtures import write_flutter_project, write_swift_project
+from dependency_release_tracker.utils import project_discovery
+from dependency_release_tracker.utils.dependency_manager_detector import (
+    DependencyManagerDetector,
+)
+from dependency_release_tracker.utils.project_discovery import ProjectDiscovery
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Directories below each heavy directory, e.g. packages of node_modules
+HEAVY_WIDTH = 40
+HEAVY_DEPTH = 3
+
+
+def write_heavy_tree(path, width=HEAVY_WIDTH, depth=HEAVY_DEPTH):
+    """
+    Write width directories per level, depth levels deep, with a decoy pubspec in
+    every leaf, like the packages of node_modules or the sources of Pods.
+    """
+    if depth == 0:
+        write_flutter_project(path, 1)
+        return
+    for index in range(width if depth == HEAVY_DEPTH else 2):
+        write_heavy_tree(os.path.join(path, f"dir{index:02d}"), width, depth - 1)
+
+
+def write_monorepo(root):
+    """
+    Write a monorepo with projects at several depths next to build output,
+    dependencies and VCS data that hold decoy manifests. Returns the project paths.
+    """
+    projects = [
+        write_flutter_project(os.path.join(root, "apps", "mobile"), 2),
+        write_swift_project(os.path.join(root, "apps", "ios"), 2),
+        write_flutter_project(
+            os.path.join(root, "packages", "a", "b", "c", "d", "e", "deep"), 2
+        ),
+    ]
+    for heavy in ("node_modules", "Pods", "build", ".dart_tool", ".git"):
+        write_heavy_tree(os.path.join(root, "apps", "mobile", heavy))
+    write_heavy_tree(os.path.join(root, "vendor"))
+    return projects
+
+
+class ProjectDiscoveryTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Discovery only reads the tree, so the tests share one
+        directory = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(directory.cleanup)
+        cls.root = directory.name
+        cls.projects = write_monorepo(cls.root)
+
+    def discover(self, **options):
+        """
+        Discover the projects of the monorepo. Returns their paths and the number
+        of directories listed.
+        """
+        scandir = os.scandir
+        listed = []
+
+        def counting_scandir(path):
+            listed.append(path)
+            return scandir(path)
+
+        with mock.patch.object(project_discovery.os, "scandir", counting_scandir):
+            projects = ProjectDiscovery(self.root, **options).discover()
+        return [project.path for project in projects], len(listed)
+
+    def test_finds_projects_without_entering_heavy_directories(self):
+        paths, listed = self.discover(ignore=["vendor"])
+        walked = sum(1 for _ in os.walk(self.root))
+
+        self.assertEqual(sorted(paths), sorted(self.projects))
+        # The full tree has over a thousand directories; only the projects' own
+        # directories and the ones leading to them are listed
+        self.assertGreater(walked, 1000)
+        self.assertLess(listed, 30)
+
+    def test_ignored_directories_are_not_entered(self):
+        paths, _ = self.discover()
+        self.assertEqual(len(paths), len(self.projects) + 2**2 * HEAVY_WIDTH)
+
+        paths, _ = self.discover(ignore=["vendor", "packages/a/*"])
+
+        self.assertNotIn(self.projects[2], paths)
+        self.assertEqual(len(paths), len(self.projects) - 1)
+
+    def test_max_depth_stops_the_search(self):
+        paths, listed = self.discover(ignore=["vendor"], max_depth=2)
+
+        self.assertEqual(sorted(paths), sorted(self.projects[:2]))
+        self.assertLess(listed, 10)
+
+
+class MaxDepthSettingTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = directory.name
+        write_flutter_project(os.path.join(self.root, "apps", "mobile"), 2)
+
+    def run_tracker(self, max_depth, *args):
+        env = {
+            **os.environ,
+            "PYTHONPATH": ROOT,
+            "DEPENDENCY_TRACKER_MAX_DEPTH": max_depth,
+            "DEPENDENCY_TRACKER_CACHE_DIR": os.path.join(self.root, "cache"),
+            # Projects that are found are checked against a closed port
+            "DEPENDENCY_TRACKER_PUB_URL": "http://127.0.0.1:9",
+            "DEPENDENCY_TRACKER_HTTP_RETRIES": "0",
+        }
+        command = [sys.executable, "-m", "dependency_release_tracker.main"]
+        command += ["--path", self.root, "--recursive", "--format", "json"]
+        return subprocess.run(
+            command + list(args), env=env, capture_output=True, text=True
+        )
+
+    def test_detector_keeps_the_discovery_depth_default(self):
+        detector = DependencyManagerDetector(self.root)
+
+        self.assertEqual(
+            detector.discovery.max_depth, ProjectDiscovery(self.root).max_depth
+        )
+
+    def test_cli_uses_the_environment_setting(self):
+        process = self.run_tracker("0")
+
+        self.assertEqual(process.returncode, 1)
+        self.assertIn("not found", process.stdout + process.stderr)
+
+    def test_max_depth_flag_overrides_the_environment(self):
+        process = self.run_tracker("0", "--max-depth", "2")
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import concurrent.futures
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+from benchmarks.fixtures import write_flutter_project
+from dependency_release_tracker.dependency_readers import project_scanner
+from dependency_release_tracker.dependency_readers.flutter_reader import (
+    FlutterDependencyReader,
+)
+from dependency_release_tracker.dependency_readers.project_scanner import (
+    ProjectScanner,
+)
+from dependency_release_tracker.utils.progress_manager import ProgressManager
+from tests.support import isolate, reader_options
+
+
+class ManifestParsingTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = isolate(self)
+        self.root = os.path.join(self.directory, "projects")
+        for name in ("a", "b"):
+            write_flutter_project(os.path.join(self.root, name), 5)
+        pool = mock.patch.object(
+            project_scanner,
+            "ProcessPoolExecutor",
+            wraps=concurrent.futures.ProcessPoolExecutor,
+        )
+        self.pool = pool.start()
+        self.addCleanup(pool.stop)
+
+    def read_projects(self, **options):
+        scanner = ProjectScanner(
+            self.root, {"flutter": FlutterDependencyReader}, reader_options(), **options
+        )
+        return [len(dependencies) for _, _, dependencies in scanner.read_projects()]
+
+    def test_small_manifests_are_parsed_in_process(self):
+        self.assertEqual(self.read_projects(), [5, 5])
+        self.assertFalse(self.pool.called)
+
+    def test_large_manifests_are_parsed_in_processes(self):
+        with mock.patch.object(project_scanner, "MANIFEST_PROCESSES_MIN_SIZE", 0):
+            self.assertEqual(self.read_projects(), [5, 5])
+        self.assertTrue(self.pool.called)
+
+    def test_no_processes_when_disabled(self):
+        with mock.patch.object(project_scanner, "MANIFEST_PROCESSES_MIN_SIZE", 0):
+            self.assertEqual(self.read_projects(processes=False), [5, 5])
+        self.assertFalse(self.pool.called)
+
+
+class GroupReader:
+    """
+    Stand-in reader whose check_updates runs a given function.
+    """
+
+    def __init__(self, check):
+        self.check = check
+        self.progress_manager = ProgressManager(enabled=False)
+
+    def share_progress(self, progress_manager):
+        self.progress_manager = progress_manager
+
+    def check_updates(self, packages, all_versions=False):
+        return self.check(packages)
+
+
+class CheckGroupsTest(unittest.TestCase):
+    def test_returns_the_results_of_every_group(self):
+        scanner = ProjectScanner(".", {}, projects=[])
+        groups = [(GroupReader(lambda packages: packages[::-1]), [1, 2]) for _ in "ab"]
+
+        self.assertEqual(scanner.check_groups(groups), [[2, 1], [2, 1]])
+
+    def test_interrupt_does_not_wait_for_other_groups(self):
+        started = threading.Event()
+        released = threading.Event()
+        self.addCleanup(released.set)
+
+        def interrupt(packages):
+            # Once the other group's lookups are running
+            started.wait(5)
+            raise KeyboardInterrupt
+
+        def block(packages):
+            started.set()
+            released.wait(10)
+
+        scanner = ProjectScanner(".", {}, projects=[])
+        groups = [(GroupReader(interrupt), [1]), (GroupReader(block), [1])]
+
+        start = time.perf_counter()
+        with self.assertRaises(KeyboardInterrupt):
+            scanner.check_groups(groups)
+        self.assertLess(time.perf_counter() - start, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
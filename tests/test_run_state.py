@@ -0,0 +1,112 @@
+import unittest
+from dependency_release_tracker.dependency_readers.base_reader import (
+    DependencyReaderBase,
+)
+from dependency_release_tracker.models.dependency import Dependency
+from dependency_release_tracker.utils.run_state import RunState
+from tests.support import isolate, reader_options
+
+
+class StubReader(DependencyReaderBase):
+    """
+    Reader whose lookups answer from a dict of latest versions and record which
+    packages were looked up.
+    """
+
+    def __init__(self, project_path, latest, incomplete=(), **options):
+        super().__init__(project_path, **reader_options(**options))
+        self.latest = latest
+        self.incomplete = set(incomplete)
+        self.checked = []
+
+    def read_dependencies(self):
+        return []
+
+    def check_updates(self, dependencies, all_versions=False):
+        for dependency in dependencies:
+            self.checked.append(dependency.name)
+            dependency.latest_version = self.latest[dependency.name]
+            dependency.incomplete = dependency.name in self.incomplete
+        return dependencies
+
+
+class CheckWithStateTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = isolate(self)
+        self.latest = {"a": "2.0.0", "b": "2.0.0"}
+
+    def run_reader(self, pins=None, **options):
+        """
+        Check the packages pinned at 1.0.0, or at the given versions, against the
+        run state. Returns the reader, the results by name and the state loaded.
+        """
+        pins = {"a": "1.0.0", "b": "1.0.0", **(pins or {})}
+        reader = StubReader(self.directory, self.latest, **options)
+        state = RunState.load(self.directory, variant=reader.state_variant)
+        dependencies = [Dependency(name, version) for name, version in pins.items()]
+        results = reader.check_with_state(dependencies, state)
+        return reader, {dependency.name: dependency for dependency in results}, state
+
+    def test_reuses_results_younger_than_max_age(self):
+        self.run_reader()
+        self.latest["a"] = "3.0.0"
+
+        reader, results, _ = self.run_reader(max_age=3600)
+
+        self.assertEqual(reader.checked, [])
+        self.assertEqual(results["a"].latest_version, "2.0.0")
+
+    def test_looks_up_changed_pins_and_expired_results(self):
+        self.run_reader()
+        state = RunState.load(self.directory)
+        state.entries["b"]["checked_at"] -= 7200
+        state.save()
+
+        reader, results, _ = self.run_reader(pins={"a": "1.1.0"}, max_age=3600)
+
+        self.assertEqual(reader.checked, ["a", "b"])
+        self.assertEqual(results["a"].current_version, "1.1.0")
+
+    def test_refresh_ignores_the_previous_run(self):
+        self.run_reader()
+
+        reader, _, _ = self.run_reader(max_age=3600, refresh=True)
+
+        self.assertEqual(reader.checked, ["a", "b"])
+
+    def test_since_last_run_only_reports_new_releases(self):
+        self.run_reader()
+        self.latest["b"] = "3.0.0"
+
+        reader, results, state = self.run_reader(refresh=True, since_last_run=True)
+
+        self.assertFalse(reader.should_display(results["a"], state=state))
+        self.assertTrue(reader.should_display(results["b"], state=state))
+        # The next run compares against the releases this one saw
+        reader, results, state = self.run_reader(refresh=True, since_last_run=True)
+        self.assertFalse(reader.should_display(results["b"], state=state))
+
+    def test_incomplete_results_are_not_recorded(self):
+        reader, results, _ = self.run_reader(incomplete=["b"])
+        self.assertTrue(reader.should_display(results["b"]))
+
+        reader, _, _ = self.run_reader(max_age=3600)
+
+        self.assertEqual(reader.checked, ["b"])
+
+    def test_offline_results_are_not_recorded(self):
+        self.run_reader(offline=True)
+        self.assertEqual(RunState.load(self.directory).previous, {})
+
+        self.run_reader()
+        self.latest["a"] = "3.0.0"
+        self.run_reader(offline=True, refresh=True)
+
+        # The offline answer, of unknown age, didn't replace the online one
+        reader, results, _ = self.run_reader(max_age=3600)
+        self.assertEqual(reader.checked, [])
+        self.assertEqual(results["a"].latest_version, "2.0.0")
+
+
+if __name__ == "__main__":
+    unittest.main()
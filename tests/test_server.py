@@ -0,0 +1,100 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from dependency_release_tracker import server
+from dependency_release_tracker.server import TrackerService
+
+
+class SlowScanner:
+    """
+    Stand-in ProjectScanner whose checks take a while and are counted.
+    """
+
+    scans = 0
+
+    def __init__(self, *args, **options):
+        pass
+
+    def read_projects(self):
+        SlowScanner.scans += 1
+        time.sleep(0.2)
+        return []
+
+    def resolve(self, projects, states):
+        return []
+
+
+class TrackerServiceTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = directory.name
+        SlowScanner.scans = 0
+        patcher = mock.patch.object(server, "ProjectScanner", SlowScanner)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def detect(self, path):
+        manifest_path = os.path.join(path, "pubspec.yaml")
+        if not os.path.exists(manifest_path):
+            return [], {}
+        project = SimpleNamespace(manifest_path=manifest_path, lock_path=None)
+        return [project], {}
+
+    def write_project(self, name):
+        path = os.path.join(self.root, name)
+        os.makedirs(path)
+        with open(os.path.join(path, "pubspec.yaml"), "w") as file:
+            file.write("name: app\n")
+        return path
+
+    def in_threads(self, count, target):
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+    def test_concurrent_requests_check_a_project_once(self):
+        service = TrackerService(self.detect, {}, refresh_interval=3600)
+        path = self.write_project("app")
+        watched = []
+
+        def request():
+            watched.append(service.project(path))
+            service.results(path)
+
+        self.in_threads(4, request)
+
+        self.assertEqual(SlowScanner.scans, 1)
+        self.assertEqual(len({id(project) for project in watched}), 1)
+        self.assertEqual(list(service.projects), [path])
+
+    def test_detection_does_not_block_other_projects(self):
+        released = threading.Event()
+        self.addCleanup(released.set)
+        slow_path = self.write_project("slow")
+        fast_path = self.write_project("fast")
+
+        def detect(path):
+            if path == slow_path:
+                released.wait(10)
+            return self.detect(path)
+
+        service = TrackerService(detect, {}, refresh_interval=3600)
+        slow = threading.Thread(target=service.project, args=(slow_path,))
+        slow.start()
+        self.addCleanup(slow.join)
+
+        start = time.perf_counter()
+        self.assertIsNotNone(service.project(fast_path))
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertIsNone(service.project(self.root))
+
+
+if __name__ == "__main__":
+    unittest.main()
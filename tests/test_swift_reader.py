@@ -0,0 +1,121 @@
+import json
+import os
+import unittest
+from unittest import mock
+from dependency_release_tracker.dependency_readers import swift_reader
+from dependency_release_tracker.dependency_readers.swift_reader import (
+    SwiftDependencyReader,
+)
+from tests.support import isolate, reader_options
+
+PINS = [
+    ("swift-algorithms", "https://github.com/apple/swift-algorithms.git", "1.2.0"),
+    ("swift-nio", "git@github.com:apple/swift-nio.git", "2.65.0"),
+    ("internal-kit", "https://gitlab.example.com/ios/internal-kit.git", "3.1.0"),
+]
+
+
+def resolved_v1():
+    return {
+        "object": {
+            "pins": [
+                {
+                    "package": name,
+                    "repositoryURL": url,
+                    "state": {"branch": None, "revision": "0" * 40, "version": version},
+                }
+                for name, url, version in PINS
+            ]
+            + [
+                # Local packages have no repository URL to look up
+                {"package": "LocalKit", "repositoryURL": "../LocalKit", "state": {}}
+            ]
+        },
+        "version": 1,
+    }
+
+
+def resolved_v2(version=2):
+    data = {
+        "pins": [
+            {
+                "identity": name,
+                "kind": "remoteSourceControl",
+                "location": url,
+                "state": {"revision": "0" * 40, "version": version},
+            }
+            for name, url, version in PINS
+        ]
+        + [
+            {
+                "identity": "localkit",
+                "kind": "localSourceControl",
+                "location": "/Users/me/LocalKit",
+                "state": {"revision": "0" * 40},
+            }
+        ],
+        "version": version,
+    }
+    if version == 3:
+        data["originHash"] = "f" * 64
+    return data
+
+
+class ReadPackageResolvedTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = isolate(self)
+        patcher = mock.patch.object(swift_reader, "GITHUB_TOKEN", "test")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.reader = SwiftDependencyReader(self.directory, **reader_options())
+
+    def read(self, data):
+        path = os.path.join(self.directory, "Package.resolved")
+        with open(path, "w") as file:
+            json.dump(data, file)
+        return self.reader.read_package_resolved(path)
+
+    def assertPins(self, dependencies):
+        self.assertEqual(
+            [
+                (dependency.current_version, dependency.repository.host)
+                for dependency in dependencies
+            ],
+            [
+                ("1.2.0", "github.com"),
+                ("2.65.0", "github.com"),
+                ("3.1.0", "gitlab.example.com"),
+            ],
+        )
+        self.assertEqual(
+            [dependency.owner_repo for dependency in dependencies],
+            ["apple/swift-algorithms", "apple/swift-nio", "ios/internal-kit"],
+        )
+        self.assertEqual(
+            [dependency.repository.is_github for dependency in dependencies],
+            [True, True, False],
+        )
+
+    def test_version_1(self):
+        dependencies = self.read(resolved_v1())
+
+        self.assertPins(dependencies)
+        self.assertEqual(dependencies[0].name, "swift-algorithms")
+
+    def test_version_2(self):
+        self.assertPins(self.read(resolved_v2()))
+
+    def test_version_3(self):
+        self.assertPins(self.read(resolved_v2(version=3)))
+
+    def test_branch_pins_have_no_version(self):
+        data = resolved_v2()
+        data["pins"][0]["state"] = {"branch": "main", "revision": "0" * 40}
+
+        dependencies = self.read(data)
+
+        self.assertEqual(dependencies[0].current_version, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
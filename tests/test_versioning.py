@@ -0,0 +1,97 @@
+import unittest
+from dependency_release_tracker.utils.versioning import (
+    clean_version,
+    is_newer,
+    is_prerelease,
+    update_type,
+    version_key,
+)
+
+
+class VersionOrderTest(unittest.TestCase):
+    def assertOrdered(self, versions):
+        for older, newer in zip(versions, versions[1:]):
+            with self.subTest(older=older, newer=newer):
+                self.assertTrue(is_newer(newer, older))
+                self.assertFalse(is_newer(older, newer))
+
+    def test_semver_precedence(self):
+        # The example ordering of the semver specification
+        self.assertOrdered(
+            [
+                "1.0.0-alpha",
+                "1.0.0-alpha.1",
+                "1.0.0-alpha.beta",
+                "1.0.0-beta",
+                "1.0.0-beta.2",
+                "1.0.0-beta.11",
+                "1.0.0-rc.1",
+                "1.0.0",
+                "1.0.1",
+                "1.1.0",
+                "2.0.0",
+                "10.0.0",
+            ]
+        )
+
+    def test_prerelease_sorts_before_its_release(self):
+        self.assertTrue(is_newer("2.0.0", "2.0.0-beta.1"))
+        self.assertTrue(is_newer("2.0.0-beta.1", "1.9.9"))
+        self.assertTrue(is_prerelease(version_key("2.0.0-beta.1")))
+        self.assertFalse(is_prerelease(version_key("2.0.0")))
+        self.assertFalse(is_prerelease(version_key("2.0.0+build.1")))
+
+    def test_extra_numeric_components(self):
+        self.assertEqual(clean_version("1.2.3.4"), "1.2.3.4")
+        self.assertOrdered(["1.2.3", "1.2.3.4", "1.2.3.5", "1.2.3.10", "1.2.4"])
+        self.assertEqual(version_key("1.2.3.0"), version_key("1.2.3"))
+        self.assertEqual(version_key("1.2"), version_key("1.2.0"))
+
+    def test_build_metadata_only_breaks_ties(self):
+        self.assertTrue(is_newer("1.0.0+2", "1.0.0+1"))
+        self.assertTrue(is_newer("1.0.0+1", "1.0.0"))
+        self.assertTrue(is_newer("1.0.1", "1.0.0+99"))
+        self.assertTrue(is_newer("1.0.0", "1.0.0-rc.1+build.5"))
+        self.assertEqual(clean_version("v1.0.0+build.5"), "1.0.0+build.5")
+
+    def test_constraints_and_tag_prefixes(self):
+        self.assertEqual(clean_version("^1.2.0"), "1.2.0")
+        self.assertEqual(clean_version("v1.2.0"), "1.2.0")
+        self.assertEqual(clean_version(">=1.2.0 <2.0.0"), "1.2.0")
+        self.assertFalse(is_newer("1.2.0", "^1.2.0"))
+        self.assertTrue(is_newer("1.3.0", "^1.2.0"))
+
+    def test_malformed_versions(self):
+        for version in ("1.2.3foo", "latest", "", "main", "1.2.3-", "v"):
+            with self.subTest(version=version):
+                self.assertIsNone(version_key(version))
+        self.assertEqual(clean_version("1.2.3foo"), "1.2.3foo")
+        self.assertIsNone(clean_version(None))
+        # Unparsable versions are only compared for equality
+        self.assertTrue(is_newer("main", "1.0.0"))
+        self.assertFalse(is_newer("main", "main"))
+
+
+class UpdateTypeTest(unittest.TestCase):
+    def test_classification(self):
+        cases = [
+            ("1.2.3", "2.0.0", "major"),
+            ("1.2.3", "1.3.0", "minor"),
+            ("1.2.3", "1.2.4", "patch"),
+            ("1.2.3", "1.2.3.1", "patch"),
+            ("1.2.3-beta", "1.2.3", "patch"),
+            ("1.2.3", "1.2.3+1", "patch"),
+            ("^1.2.3", "1.9.0", "minor"),
+            ("1.2.3", "1.2.3", None),
+            ("1.2.3", "1.2.2", None),
+            ("2.0.0", "2.0.0-rc.1", None),
+            ("main", "1.0.0", "major"),
+            ("main", "main", None),
+        ]
+        for current, latest, expected in cases:
+            with self.subTest(current=current, latest=latest):
+                self.assertEqual(update_type(current, latest), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()